@@ -0,0 +1,48 @@
+from datetime import datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Optional, Tuple
+from fastapi import Request
+
+
+def _opaque_tag(tag: str) -> str:
+  """Strip the weak prefix; If-None-Match uses weak comparison."""
+  tag = tag.strip()
+  return tag[2:] if tag.startswith("W/") else tag
+
+
+def check(
+  request: Request,
+  scope: str,
+  version: int,
+  updated_at: Optional[datetime]
+) -> Tuple[Dict[str, str], bool]:
+  """
+  Build validators from a table version and evaluate the request's
+  conditional headers against them. If-None-Match takes precedence over
+  If-Modified-Since, as in RFC 9110.
+
+  Returns:
+    (ETag / Last-Modified / Cache-Control headers, True if a 304 should be sent)
+  """
+  etag = f'W/"{scope}-{version}"'
+  headers = {"ETag": etag, "Cache-Control": "no-cache"}
+  if updated_at is not None:
+    headers["Last-Modified"] = format_datetime(updated_at, usegmt=True)
+
+  if_none_match = request.headers.get("if-none-match")
+  if if_none_match is not None:
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return headers, "*" in tags or _opaque_tag(etag) in {_opaque_tag(tag) for tag in tags}
+
+  if_modified_since = request.headers.get("if-modified-since")
+  if if_modified_since and updated_at is not None:
+    try:
+      since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+      return headers, False
+    if since.tzinfo is None:
+      return headers, False
+    # HTTP dates have one-second resolution
+    return headers, updated_at.replace(microsecond=0) <= since
+
+  return headers, False
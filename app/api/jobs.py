@@ -1,47 +1,203 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from uuid import UUID
-from app.db.deps import get_db
-from app.models import Job
-from app.schemas.jobs import JobCreate, JobUpdate, JobOut
-from app.services.job_service import create_job, get_all_jobs, get_job_by_id, delete_job, update_job
+from collections import Counter
+from typing import Any, List, Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.api import conditional
+from app.db.deps import get_async_db
+from app.schemas.jobs import (
+  JobCreate, JobUpdate, JobOut, JobFilters, JobPage, JobChangeFeed,
+  BulkJobResult, BulkJobResponse, BulkStatusUpdate, BulkStatusResponse
+)
+from app.services import async_job_service, job_service
+from app.utils.serialization import FastJSONResponse, dumps_lines, loads
 
 router = APIRouter(prefix="/jobs", tags=["Jobs"])
 
+# Upper bound on items per bulk request
+MAX_BULK_ITEMS = 10000
+
+
+def _parse_bulk_body(body: bytes, content_type: str) -> List[Any]:
+  """
+  Returns:
+    Decoded items; undecodable NDJSON lines become ValueError instances
+  """
+  if "ndjson" in content_type or "jsonlines" in content_type:
+    items = []
+    for line in body.splitlines():
+      if not line.strip():
+        continue
+      try:
+        items.append(loads(line))
+      except ValueError as e:
+        items.append(ValueError(f"Invalid JSON: {e}"))
+    return items
+
+  try:
+    items = loads(body)
+  except ValueError as e:
+    raise HTTPException(status_code=400, detail=f"Invalid JSON: {e}")
+
+  if not isinstance(items, list):
+    raise HTTPException(status_code=400, detail="Expected a JSON array of jobs")
+  return items
+
+
+def _validation_message(error: ValidationError) -> str:
+  return "; ".join(
+    f"{'.'.join(str(part) for part in err['loc']) or 'item'}: {err['msg']}"
+    for err in error.errors()
+  )
+
+
+async def _check_jobs_version(request: Request, db: AsyncSession):
+  """
+  The version is read once per transaction (see version_service), and the
+  job service validates cached results against that same read, so a body
+  served under this ETag is never older than the version it names.
+
+  Returns:
+    (validator headers, True if the client's copy is still current)
+  """
+  version, updated_at = await async_job_service.get_jobs_version(db)
+  return conditional.check(request, "jobs", version, updated_at)
+
+
+async def _ndjson_lines(filters: JobFilters):
+  async for records in async_job_service.stream_jobs(filters):
+    yield dumps_lines(records)
+
+
 # Create a job
 @router.post("/", response_model=JobOut, status_code=status.HTTP_201_CREATED)
-def create_job(job: JobCreate, db: Session = Depends(get_db)):
-  return create_job(db, job)
+async def create_job(job: JobCreate, db: AsyncSession = Depends(get_async_db)):
+  created = await async_job_service.create_job(db, job)
+  if not created:
+    raise HTTPException(status_code=409, detail="Job with this URL already exists")
+  return FastJSONResponse(job_service.job_record(created), status_code=status.HTTP_201_CREATED)
+
+# Create or update many jobs in one transaction (JSON array or NDJSON body)
+@router.post("/bulk", response_model=BulkJobResponse)
+async def bulk_create_jobs(
+  request: Request,
+  on_conflict: Literal["skip", "update"] = Query("skip", description="What to do with URLs already stored"),
+  db: AsyncSession = Depends(get_async_db)
+):
+  items = _parse_bulk_body(await request.body(), request.headers.get("content-type", ""))
+
+  if len(items) > MAX_BULK_ITEMS:
+    raise HTTPException(status_code=413, detail=f"At most {MAX_BULK_ITEMS} jobs per request")
 
-#List all jobs
-@router.get("/", response_model=list[JobOut])
-def list_jobs(db: Session = Depends(get_db)):
-  return get_all_jobs(db)
+  results = [None] * len(items)
+  valid_indexes = []
+  valid_jobs = []
+
+  for index, item in enumerate(items):
+    if isinstance(item, ValueError):
+      results[index] = BulkJobResult(index=index, status="invalid", error=str(item))
+      continue
+    try:
+      valid_jobs.append(JobCreate.model_validate(item))
+      valid_indexes.append(index)
+    except ValidationError as e:
+      results[index] = BulkJobResult(index=index, status="invalid", error=_validation_message(e))
+
+  outcomes = await async_job_service.upsert_jobs(db, valid_jobs, on_conflict)
+  for index, (outcome, job_id) in zip(valid_indexes, outcomes):
+    results[index] = BulkJobResult(index=index, status=outcome, id=job_id)
+
+  counts = Counter(result.status for result in results)
+  return BulkJobResponse(results=results, **counts)
+
+
+# Set the status of many jobs at once
+@router.patch("/status", response_model=BulkStatusResponse)
+async def bulk_update_status(payload: BulkStatusUpdate, db: AsyncSession = Depends(get_async_db)):
+  updated = await async_job_service.bulk_update_status(db, payload.job_ids, payload.status)
+  return BulkStatusResponse(updated=updated)
+
+
+# List jobs: one cursor-paginated page, or every match streamed as NDJSON
+@router.get("/", response_model=JobPage)
+async def list_jobs(
+  request: Request,
+  filters: JobFilters = Depends(),
+  format: Literal["json", "ndjson"] = Query("json", description="ndjson streams all matching jobs"),
+  db: AsyncSession = Depends(get_async_db)
+):
+  # Answer repeat polls from the table version alone, before querying jobs
+  headers, not_modified = await _check_jobs_version(request, db)
+  if not_modified:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+  if filters.cursor:
+    try:
+      job_service.decode_cursor(filters.cursor, filters.sort)
+    except ValueError as e:
+      raise HTTPException(status_code=400, detail=str(e))
+
+  if format == "ndjson":
+    # Full dumps ignore the default page size unless a limit was given explicitly
+    if "limit" not in filters.model_fields_set:
+      filters = filters.model_copy(update={"limit": None})
+    return StreamingResponse(_ndjson_lines(filters), media_type="application/x-ndjson", headers=headers)
+
+  # Records come straight from the database in JobOut's shape; skip revalidation
+  items, next_cursor = await async_job_service.get_job_page(db, filters)
+  return FastJSONResponse({"items": items, "next_cursor": next_cursor}, headers=headers)
+
+# Jobs created, updated or deleted since a cursor, for incremental sync
+@router.get("/changes", response_model=JobChangeFeed)
+async def list_changes(
+  request: Request,
+  since: Optional[str] = Query(None, description="next_cursor from the previous call; omit to start from the beginning"),
+  limit: int = Query(500, ge=1, le=5000),
+  db: AsyncSession = Depends(get_async_db)
+):
+  headers, not_modified = await _check_jobs_version(request, db)
+  if not_modified:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+  try:
+    changes, next_cursor, has_more = await async_job_service.get_changes(db, since, limit)
+  except ValueError as e:
+    raise HTTPException(status_code=400, detail=str(e))
+
+  return FastJSONResponse(
+    {"changes": changes, "next_cursor": next_cursor, "has_more": has_more},
+    headers=headers
+  )
 
 #Get one job
 @router.get("/{job_id}", response_model=JobOut)
-def get_job(job_id: str, db: Session = Depends(get_db)):
-  job = get_job_by_id(db, job_id)
+async def get_job(job_id: str, request: Request, db: AsyncSession = Depends(get_async_db)):
+  headers, not_modified = await _check_jobs_version(request, db)
+  if not_modified:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+  job = await async_job_service.get_job_by_id(db, job_id)
 
   if not job:
     raise HTTPException(status_code=404, detail="Job not found")
-  return job
+  return FastJSONResponse(job_service.job_record(job), headers=headers)
 
 # Update a job
 @router.put("/{job_id}", response_model=JobOut)
-def update_job(job_id: str, payload: JobUpdate, db: Session = Depends(get_db)):
-  job = update_job(db, job_id, payload)
+async def update_job(job_id: str, payload: JobUpdate, db: AsyncSession = Depends(get_async_db)):
+  job = await async_job_service.update_job(db, job_id, payload)
   if not job:
     raise HTTPException(status_code=404, detail="Job not found")
 
-  return job
+  return FastJSONResponse(job_service.job_record(job))
 
 
 # Delete a job
 @router.delete("/{job_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_job(job_id: str, db: Session = Depends(get_db)):
-  job = delete_job(db, job_id)
-  if not job:
+async def delete_job(job_id: str, db: AsyncSession = Depends(get_async_db)):
+  deleted = await async_job_service.delete_job(db, job_id)
+  if not deleted:
     raise HTTPException(status_code=404, detail="Job not found")
   
-  return None
\ No newline at end of file
+  return None
@@ -0,0 +1,75 @@
+import time
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from app.db.profiling import track_queries
+from app.utils.metrics import registry
+
+router = APIRouter(tags=["Metrics"])
+
+REQUEST_DURATION = registry.histogram(
+  "jobtrail_http_request_duration_seconds",
+  "HTTP request latency by route template, including streamed bodies",
+  ["method", "route", "status"]
+)
+REQUEST_QUERIES = registry.histogram(
+  "jobtrail_http_request_queries",
+  "Database queries run per HTTP request",
+  ["method", "route"],
+  buckets=(1, 2, 3, 5, 8, 13, 21, 34, 55, 100)
+)
+REQUESTS_IN_PROGRESS = registry.gauge(
+  "jobtrail_http_requests_in_progress",
+  "HTTP requests currently being served",
+  ["method"]
+)
+
+
+class MetricsMiddleware:
+  """
+  ASGI middleware recording request latency and query counts per route.
+  Routes are labelled by their template (/jobs/{job_id}), never the raw
+  path, so label cardinality stays bounded. Each request runs under a
+  query budget (see app.db.profiling) and reports its query count in
+  the X-Query-Count header.
+  """
+
+  def __init__(self, app):
+    self.app = app
+
+  async def __call__(self, scope, receive, send):
+    if scope["type"] != "http":
+      await self.app(scope, receive, send)
+      return
+
+    method = scope["method"]
+    status_code = 500
+    started = time.perf_counter()
+    REQUESTS_IN_PROGRESS.inc(method=method)
+
+    with track_queries(f"{method} {scope['path']}") as budget:
+
+      async def send_with_status(message):
+        nonlocal status_code
+        if message["type"] == "http.response.start":
+          status_code = message["status"]
+          message.setdefault("headers", []).append((b"x-query-count", str(budget.count).encode()))
+        await send(message)
+
+      try:
+        await self.app(scope, receive, send_with_status)
+      finally:
+        REQUESTS_IN_PROGRESS.dec(method=method)
+        route = getattr(scope.get("route"), "path", "unmatched")
+        REQUEST_DURATION.observe(
+          time.perf_counter() - started,
+          method=method,
+          route=route,
+          status=status_code
+        )
+        REQUEST_QUERIES.observe(budget.count, method=method, route=route)
+
+
+# Prometheus scrape endpoint
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def metrics():
+  return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -0,0 +1,77 @@
+import asyncio
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
+from app.schemas.scrapes import ScrapeRequest, ScrapeRun
+from app.services import scrape_service
+from app.utils.serialization import dumps
+
+router = APIRouter(prefix="/scrapes", tags=["Scrapes"])
+
+# How often the event stream checks a run for progress, and sends keep-alives
+POLL_INTERVAL = 0.5
+KEEPALIVE_INTERVAL = 15
+
+
+# Queue a scrape run on the background workers
+@router.post("/", response_model=ScrapeRun, status_code=status.HTTP_202_ACCEPTED)
+def start_scrape(payload: Optional[ScrapeRequest] = None):
+  try:
+    return scrape_service.start_run(payload.sources if payload else None)
+  except ValueError as e:
+    raise HTTPException(status_code=400, detail=str(e))
+
+
+# Recent runs, newest first
+@router.get("/", response_model=list[ScrapeRun])
+def list_scrapes():
+  return scrape_service.list_runs()
+
+
+# Progress of one run
+@router.get("/{run_id}", response_model=ScrapeRun)
+def get_scrape(run_id: str):
+  run = scrape_service.get_run(run_id)
+  if not run:
+    raise HTTPException(status_code=404, detail="Scrape run not found")
+  return run
+
+
+async def _progress_events(request: Request, run_id: str):
+  last_version = None
+  idle = 0.0
+
+  while True:
+    run = scrape_service.get_run(run_id)
+    if run is None:
+      return
+
+    if run.version != last_version:
+      last_version = run.version
+      idle = 0.0
+      yield b"event: progress\ndata: " + dumps(run.model_dump(mode="json")) + b"\n\n"
+      if run.finished:
+        yield b"event: end\ndata: {}\n\n"
+        return
+    elif idle >= KEEPALIVE_INTERVAL:
+      idle = 0.0
+      yield b": keep-alive\n\n"
+
+    if await request.is_disconnected():
+      return
+
+    await asyncio.sleep(POLL_INTERVAL)
+    idle += POLL_INTERVAL
+
+
+# Server-sent events with the run's progress until it finishes
+@router.get("/{run_id}/events")
+async def stream_scrape(run_id: str, request: Request):
+  if not scrape_service.get_run(run_id):
+    raise HTTPException(status_code=404, detail="Scrape run not found")
+
+  return StreamingResponse(
+    _progress_events(request, run_id),
+    media_type="text/event-stream",
+    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+  )
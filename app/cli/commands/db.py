@@ -0,0 +1,75 @@
+import typer
+from rich.console import Console
+from app.db.session import SessionLocal, engine
+from sqlalchemy import text
+from app.services import job_service, stats_service, event_service, description_service
+from app.utils.logging import get_logger
+
+app = typer.Typer(help="Database maintenance commands")
+console = Console()
+
+logger = get_logger(__name__)
+
+
+@app.command("rebuild-stats")
+def rebuild_stats():
+  """
+  Recompute the job stats rollup, funnel metrics and daily activity.
+  """
+  db = SessionLocal()
+  try:
+    buckets = stats_service.rebuild_stats(db)
+    seeded = event_service.rebuild_funnel(db)
+    days = event_service.rebuild_activity(db)
+    console.print(
+      f"[bold green]✅ Stats rebuilt:[/bold green] {buckets} buckets, {seeded} jobs added to the event log, "
+      f"{days} daily activity rows"
+    )
+  finally:
+    db.close()
+
+
+@app.command("backfill-salaries")
+def backfill_salaries():
+  """
+  Parse salary text of existing jobs into the numeric salary columns.
+  """
+  db = SessionLocal()
+  try:
+    parsed = job_service.backfill_salaries(db)
+    console.print(f"[bold green]✅ Salaries backfilled:[/bold green] {parsed} jobs parsed")
+  finally:
+    db.close()
+
+
+@app.command("compress-descriptions")
+def compress_descriptions(
+  train: bool = typer.Option(True, "--train/--no-train", help="Train a new shared dictionary first"),
+  vacuum: bool = typer.Option(False, "--vacuum", help="Run VACUUM afterwards to reclaim space (SQLite)"),
+):
+  """
+  Move descriptions into compressed, deduplicated storage.
+  """
+  db = SessionLocal()
+  try:
+    if train:
+      dictionary = description_service.train_dictionary(db)
+      if dictionary:
+        console.print(f"[cyan]Trained {dictionary.codec} dictionary on {dictionary.sample_count} descriptions[/cyan]")
+
+    migrated = description_service.migrate_descriptions(db)
+    rewritten = description_service.recompress_descriptions(db)
+    pruned = description_service.prune_descriptions(db)
+
+    stats = description_service.get_storage_stats(db)
+    db.close()
+
+    if vacuum and engine.dialect.name == "sqlite":
+      with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("VACUUM"))
+    ratio = stats["raw_bytes"] / stats["stored_bytes"] if stats["stored_bytes"] else 0
+
+    console.print(f"[bold green]✅ Descriptions compressed:[/bold green] {migrated} migrated, {rewritten} recompressed, {pruned} pruned")
+    console.print(f"{stats['blobs']} unique descriptions, {stats['raw_bytes']:,} → {stats['stored_bytes']:,} bytes ({ratio:.1f}x)")
+  finally:
+    db.close()
@@ -1,9 +1,12 @@
 import typer
+from datetime import datetime
 from pathlib import Path
+from typing import Optional
 from rich.console import Console
 from app.db.session import SessionLocal
-from app.services.job_service import get_all_jobs
-from app.utils.export import export_csv, export_json
+from app.schemas.jobs import JobFilters
+from app.services import job_service, export_service
+from app.utils import export as exporter
 from app.utils.logging import get_logger
 
 app = typer.Typer()
@@ -11,38 +14,140 @@ console = Console()
 
 logger = get_logger(__name__)
 
-SUPPORTED_FORMATS = ["csv", "json"]
+SUPPORTED_FORMATS = exporter.FORMATS
+
+# Rows fetched from the database per batch
+BATCH_SIZE = 1000
+
+EXPORT_DIR = Path("exports")
+DELTA_DIR = EXPORT_DIR / "deltas"
 
 
 @app.command()
 def export(
-  format: str = typer.Option(..., "--format", "-f", help="Export format: csv or json"),
+  format: str = typer.Option(..., "--format", "-f", help=f"Export format: {', '.join(SUPPORTED_FORMATS)}"),
+  compress: Optional[str] = typer.Option(
+    None, "--compress", "-c", help="Compression: none, gzip or zstd (default: zstd for parquet/arrow, none otherwise)"
+  ),
+  output: Optional[Path] = typer.Option(None, "--output", "-o", help="Output file (default: exports/jobs.<format>)"),
+  since_last: bool = typer.Option(
+    False, "--since-last", help="Only jobs changed since the last --since-last export, into a new file in exports/deltas"
+  ),
+  name: str = typer.Option("jobs", "--name", help="Watermark and file name for --since-last exports"),
+  status: Optional[str] = typer.Option(None, "--status", help="Only jobs with this status"),
+  source: Optional[str] = typer.Option(None, "--source", help="Only jobs from this source"),
+  job_type: Optional[str] = typer.Option(None, "--job-type", help="Only jobs of this type"),
+  search: Optional[str] = typer.Option(None, "--search", help="Search in title and company (not descriptions)"),
+  location: Optional[str] = typer.Option(None, "--location", help="Location contains"),
+  salary_min: Optional[int] = typer.Option(None, "--salary-min", help="Yearly salary range reaches at least this (excludes hourly/monthly pay)"),
+  salary_max: Optional[int] = typer.Option(None, "--salary-max", help="Yearly salary range starts at most at this (excludes hourly/monthly pay)"),
+  salary_currency: str = typer.Option("USD", "--salary-currency", help="Currency of --salary-min/--salary-max; other currencies are excluded"),
+  date_from: Optional[datetime] = typer.Option(None, "--from", help="Added on or after this date"),
+  date_to: Optional[datetime] = typer.Option(None, "--to", help="Added on or before this date"),
 ):
   """
-  Export jobs to a file (csv or json).
+  Export jobs to a file, streamed from the database in batches.
   """
 
   format = format.lower()
+  if compress is None:
+    compress = "zstd" if format in exporter.COLUMNAR_FORMATS else "none"
+  compress = compress.lower()
 
   if format not in SUPPORTED_FORMATS:
-    logger.info(f"[bold red]❌ Unsupported format:[/bold red] {format}")
-    logger.info(f"[yellow]Supported formats:[/yellow] {', '.join(SUPPORTED_FORMATS)}")
+    console.print(f"[bold red]❌ Unsupported format:[/bold red] {format}")
+    console.print(f"[yellow]Supported formats:[/yellow] {', '.join(SUPPORTED_FORMATS)}")
+    raise typer.Exit(code=1)
+
+  try:
+    exporter.check_format(format, compress)
+  except (ValueError, RuntimeError) as e:
+    console.print(f"[bold red]❌ {e}[/bold red]")
+    raise typer.Exit(code=1)
+
+  filters = JobFilters(
+    status=status,
+    source=source,
+    job_type=job_type,
+    search=search,
+    location=location,
+    salary_min=salary_min,
+    salary_max=salary_max,
+    salary_currency=salary_currency,
+    date_from=date_from,
+    date_to=date_to,
+    limit=None,
+  )
+
+  if since_last:
+    _export_delta(name, format, compress, output, filters)
+    return
+
+  if output is None:
+    EXPORT_DIR.mkdir(exist_ok=True)
+    output = exporter.output_path(EXPORT_DIR, "jobs", format, compress)
+
+  db = SessionLocal()
+  try:
+    count = exporter.export_records(
+      job_service.iter_job_records(db, filters, batch_size=BATCH_SIZE),
+      output,
+      format,
+      job_service.RECORD_FIELDS,
+      compress,
+      types=job_service.RECORD_TYPES,
+      dictionary_fields=job_service.CATEGORICAL_FIELDS,
+    )
+  finally:
+    db.close()
+
+  if not count:
+    console.print("[yellow]No jobs matched; wrote an empty export.[/yellow]")
+
+  console.print(f"[bold green]✅ Export completed:[/bold green] {count} jobs → {output}")
+
+
+def _export_delta(name: str, format: str, compress: str, output: Optional[Path], filters: JobFilters) -> None:
+  # A delta must carry every change, or jobs leaving the filter would never be updated downstream
+  if output is not None or filters.model_dump(exclude_none=True, exclude={"sort", "limit", "offset"}):
+    console.print("[bold red]❌ --since-last exports every change; --output and filters are not supported[/bold red]")
     raise typer.Exit(code=1)
 
   db = SessionLocal()
-  jobs = get_all_jobs(db)
+  try:
+    path, count = export_service.export_delta(db, DELTA_DIR, name, format, compress, BATCH_SIZE)
+  finally:
+    db.close()
 
-  if not jobs:
-    logger.info("[yellow]No jobs to export.[/yellow]")
+  if path is None:
+    console.print("[yellow]No changes since the last export.[/yellow]")
     return
 
-  output_dir = Path("exports")
-  output_dir.mkdir(exist_ok=True)
+  console.print(f"[bold green]✅ Delta export completed:[/bold green] {count} changed jobs → {path}")
+
+
+@app.command()
+def compact(
+  name: str = typer.Option("jobs", "--name", help="Name the deltas were exported under"),
+  format: Optional[str] = typer.Option(None, "--format", "-f", help="Output format (default: that of the newest delta)"),
+  compress: Optional[str] = typer.Option(None, "--compress", "-c", help="Compression (default: that of the newest delta)"),
+):
+  """
+  Merge the delta files written by `export --since-last` into one file.
+  """
+  format = format.lower() if format else None
+  if format and compress is None:
+    compress = "zstd" if format in exporter.COLUMNAR_FORMATS else "none"
+  compress = compress.lower() if compress else None
+
+  try:
+    path, count, merged = export_service.compact_deltas(DELTA_DIR, name, format, compress, BATCH_SIZE)
+  except (ValueError, RuntimeError) as e:
+    console.print(f"[bold red]❌ {e}[/bold red]")
+    raise typer.Exit(code=1)
 
-  if format == "csv":
-    export_csv(jobs, output_dir / "jobs.csv")
-  elif format == "json":
-    export_json(jobs, output_dir / "jobs.json")
+  if path is None:
+    console.print(f"[yellow]Nothing to compact: {merged} delta file(s) for {name}.[/yellow]")
+    return
 
-  logger.info(f"[bold green]✅ Export completed:[/bold green] exports/jobs.{format}")
-  db.close()
+  console.print(f"[bold green]✅ Compacted {merged} deltas:[/bold green] {count} jobs → {path}")
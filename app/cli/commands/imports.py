@@ -0,0 +1,58 @@
+import typer
+from pathlib import Path
+from typing import Optional
+from rich.console import Console
+from app.db.session import SessionLocal
+from app.services import import_service
+from app.utils.logging import get_logger
+
+app = typer.Typer()
+console = Console()
+
+logger = get_logger(__name__)
+
+ON_CONFLICT = ["skip", "update"]
+
+# Rows validated and written per batch
+BATCH_SIZE = 5000
+
+
+@app.command("import")
+def import_jobs(
+  file: Path = typer.Argument(..., exists=True, dir_okay=False, help="csv, json, ndjson, parquet or arrow file, optionally .gz/.zst"),
+  on_conflict: str = typer.Option("skip", "--on-conflict", help="Jobs whose URL is already stored: skip or update"),
+  batch_size: int = typer.Option(BATCH_SIZE, "--batch-size", min=1, help="Rows validated and written per batch"),
+  defer_indexes: Optional[bool] = typer.Option(
+    None, "--defer-indexes/--keep-indexes",
+    help="Drop secondary indexes during the load and rebuild them once (default: SQLite only; "
+         "elsewhere this locks the jobs table until the import commits)"
+  ),
+):
+  """
+  Import jobs from an export file in a single transaction.
+  """
+  on_conflict = on_conflict.lower()
+  if on_conflict not in ON_CONFLICT:
+    console.print(f"[bold red]❌ Unsupported --on-conflict:[/bold red] {on_conflict}")
+    console.print(f"[yellow]Supported values:[/yellow] {', '.join(ON_CONFLICT)}")
+    raise typer.Exit(code=1)
+
+  db = SessionLocal()
+  try:
+    result = import_service.import_file(db, file, on_conflict, batch_size, defer_indexes)
+  except (ValueError, RuntimeError) as e:
+    console.print(f"[bold red]❌ {e}[/bold red]")
+    raise typer.Exit(code=1)
+  finally:
+    db.close()
+
+  for error in result.errors:
+    console.print(f"[yellow]  {error}[/yellow]")
+  if result.invalid > len(result.errors):
+    console.print(f"[yellow]  ... and {result.invalid - len(result.errors)} more invalid rows[/yellow]")
+
+  console.print(
+    f"[bold green]✅ Import completed:[/bold green] {result.read} rows in {result.seconds:.2f}s "
+    f"({result.rows_per_second:,.0f} rows/s) → {result.created} created, {result.updated} updated, "
+    f"{result.skipped} skipped, {result.invalid} invalid"
+  )
@@ -2,7 +2,8 @@ import typer
 from rich.console import Console
 from rich.table import Table
 from app.db.session import SessionLocal
-from app.services.job_service import get_all_jobs 
+from app.services.job_service import get_job_summaries
+from app.schemas.jobs import JobFilters
 from app.utils.logging import get_logger
 
 app = typer.Typer()
@@ -17,7 +18,7 @@ def list():
   List all saved jobs.
   """
   db = SessionLocal()
-  jobs = get_all_jobs(db)
+  jobs = get_job_summaries(db, JobFilters(limit=None))
 
   if not jobs:
     logger.info("[yellow]No jobs found.[/yellow]")
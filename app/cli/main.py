@@ -2,15 +2,21 @@ import typer
 from app.cli.commands.scrape import app as scrape_app
 from app.cli.commands.jobs import app as jobs_app
 from app.cli.commands.export import app as export_app
+from app.cli.commands.imports import app as import_app
+from app.cli.commands.db import app as db_app
+from app.db.init_db import init_db
 
 app = typer.Typer(help="JobTrail CLI - Job scraping and tracking tool")
 
 app.add_typer(scrape_app)
 app.add_typer(jobs_app)
 app.add_typer(export_app)
+app.add_typer(import_app)
+app.add_typer(db_app, name="db")
 
 
 def main():
+  init_db()
   app()
 
 if __name__ == "__main__":
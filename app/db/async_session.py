@@ -0,0 +1,32 @@
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from app.db.metrics import instrument_engine
+from app.db.profiling import profile_engine
+from app.db.session import DATABASE_URL
+
+# Async driver per backend: aiosqlite locally, asyncpg for Postgres
+ASYNC_DRIVERS = {
+  "sqlite": "sqlite+aiosqlite",
+  "postgresql": "postgresql+asyncpg",
+}
+
+
+def to_async_url(url: str) -> str:
+  """Swap the sync driver in a database URL for its async counterpart."""
+  parsed = make_url(url)
+  backend = parsed.get_backend_name()
+
+  if backend not in ASYNC_DRIVERS:
+    raise ValueError(f"No async driver configured for database backend: {backend}")
+
+  return parsed.set(drivername=ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+
+ASYNC_DATABASE_URL = to_async_url(DATABASE_URL)
+
+async_engine = create_async_engine(ASYNC_DATABASE_URL)
+instrument_engine(async_engine.sync_engine, "async")
+profile_engine(async_engine.sync_engine)
+
+# Objects stay loaded after commit: async code cannot lazy-load on attribute access
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
@@ -1,4 +1,5 @@
 from app.db.session import SessionLocal
+from app.db.async_session import AsyncSessionLocal
 
 
 def get_db():
@@ -7,3 +8,8 @@ def get_db():
     yield db
   finally:
     db.close()
+
+
+async def get_async_db():
+  async with AsyncSessionLocal() as db:
+    yield db
@@ -0,0 +1,49 @@
+from sqlalchemy import inspect, text
+from sqlalchemy.schema import CreateIndex
+from app.db.base import Base
+from app.db.session import engine, SessionLocal
+
+
+def _add_missing_columns():
+  """
+  Add columns and indexes introduced after a table was first created.
+
+  create_all() only creates whole tables, so databases created by older
+  versions would otherwise never pick up new nullable columns.
+  """
+  inspector = inspect(engine)
+  existing_tables = set(inspector.get_table_names())
+
+  with engine.begin() as conn:
+    for table in Base.metadata.sorted_tables:
+      if table.name not in existing_tables:
+        continue
+
+      existing_columns = {col["name"] for col in inspector.get_columns(table.name)}
+      for column in table.columns:
+        if column.name in existing_columns:
+          continue
+        column_type = column.type.compile(dialect=engine.dialect)
+        conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN "{column.name}" {column_type}'))
+
+      for index in table.indexes:
+        conn.execute(CreateIndex(index, if_not_exists=True))
+
+
+def init_db():
+  """Create missing tables and seed derived data for older databases."""
+  # Import models so they are registered on Base.metadata
+  import app.models  # noqa: F401
+  from app.services import stats_service, event_service, job_service
+
+  _add_missing_columns()
+  Base.metadata.create_all(bind=engine)
+
+  db = SessionLocal()
+  try:
+    stats_service.ensure_stats(db)
+    event_service.ensure_funnel(db)
+    event_service.ensure_activity(db)
+    job_service.ensure_change_seq(db)
+  finally:
+    db.close()
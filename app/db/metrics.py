@@ -0,0 +1,84 @@
+import time
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.utils.metrics import registry
+
+QUERY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+OPERATIONS = {"SELECT", "INSERT", "UPDATE", "DELETE"}
+
+QUERY_DURATION = registry.histogram(
+  "jobtrail_db_query_duration_seconds",
+  "Database statement execution time",
+  ["engine", "operation"],
+  buckets=QUERY_BUCKETS
+)
+QUERY_ERRORS = registry.counter(
+  "jobtrail_db_query_errors_total",
+  "Database statements that raised an error",
+  ["engine", "operation"]
+)
+
+# Instrumented engines by label, for the pool gauges
+_engines = {}
+
+
+def _operation(statement: str) -> str:
+  keyword = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+  return keyword if keyword in OPERATIONS else "OTHER"
+
+
+def _pool_samples(method: str):
+  def collect():
+    for name, engine in list(_engines.items()):
+      pool_method = getattr(engine.pool, method, None)
+      if pool_method is not None:
+        # QueuePool.overflow() counts up from -size; report only real overflow
+        yield {"engine": name}, max(pool_method(), 0)
+  return collect
+
+
+registry.gauge(
+  "jobtrail_db_pool_checked_out",
+  "Connections currently checked out of the pool",
+  ["engine"],
+  collect=_pool_samples("checkedout")
+)
+registry.gauge(
+  "jobtrail_db_pool_size",
+  "Configured pool size",
+  ["engine"],
+  collect=_pool_samples("size")
+)
+registry.gauge(
+  "jobtrail_db_pool_overflow",
+  "Connections open beyond the pool size",
+  ["engine"],
+  collect=_pool_samples("overflow")
+)
+
+
+def instrument_engine(engine: Engine, name: str) -> None:
+  """
+  Time every statement run through engine and expose its pool usage.
+  For async engines pass async_engine.sync_engine.
+  """
+  if name in _engines:
+    return
+  _engines[name] = engine
+
+  @event.listens_for(engine, "before_cursor_execute")
+  def _before(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+  @event.listens_for(engine, "after_cursor_execute")
+  def _after(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_start"].pop()
+    QUERY_DURATION.observe(time.perf_counter() - started, engine=name, operation=_operation(statement))
+
+  @event.listens_for(engine, "handle_error")
+  def _error(context):
+    starts = context.connection.info.get("query_start") if context.connection is not None else None
+    if starts:
+      starts.pop()
+    QUERY_ERRORS.inc(engine=name, operation=_operation(context.statement or ""))
@@ -0,0 +1,133 @@
+import os
+import time
+import traceback
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import List, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.utils.exceptions import QueryBudgetExceeded
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Statements slower than this are logged with their parameters and call site
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "250"))
+
+# Default queries allowed per API request / Streamlit rerun
+QUERY_BUDGET = int(os.getenv("QUERY_BUDGET", "25"))
+
+# Raise QueryBudgetExceeded instead of logging a warning (tests, benchmarks)
+QUERY_BUDGET_STRICT = os.getenv("QUERY_BUDGET_STRICT", "").lower() in ("1", "true", "yes")
+
+MAX_LOGGED_PARAMS = 500
+APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DB_PACKAGE = os.path.dirname(os.path.abspath(__file__))
+
+
+class QueryBudget:
+  """
+  Queries run within one unit of work (an API request, a Streamlit rerun,
+  a benchmarked call). Set for the current context by track_queries().
+  """
+
+  def __init__(self, name: str, limit: Optional[int], strict: bool):
+    self.name = name
+    self.limit = limit
+    self.strict = strict
+    self.count = 0
+    self.statements: List[str] = []
+
+  @property
+  def exceeded(self) -> bool:
+    return self.limit is not None and self.count > self.limit
+
+  def summary(self) -> str:
+    lines = "\n".join(f"  {statement[:200]}" for statement in self.statements)
+    return f"{self.name} ran {self.count} queries (budget {self.limit}):\n{lines}"
+
+
+_current_budget: ContextVar[Optional[QueryBudget]] = ContextVar("query_budget", default=None)
+
+
+def current_budget() -> Optional[QueryBudget]:
+  return _current_budget.get()
+
+
+@contextmanager
+def track_queries(name: str, limit: Optional[int] = QUERY_BUDGET, strict: Optional[bool] = None):
+  """
+  Count the queries run inside the block. Over budget, log a warning with
+  the statements, or in strict mode fail the query that crosses the limit
+  with QueryBudgetExceeded. Pass limit=None to only count.
+
+  Yields:
+    The QueryBudget being filled
+  """
+  budget = QueryBudget(name, limit, QUERY_BUDGET_STRICT if strict is None else strict)
+  token = _current_budget.set(budget)
+  try:
+    yield budget
+  finally:
+    _current_budget.reset(token)
+
+  if budget.exceeded and not budget.strict:
+    logger.warning(f"Query budget exceeded: {budget.summary()}")
+
+
+def assert_max_queries(limit: int, name: str = "block"):
+  """Strict track_queries() for tests and benchmarks."""
+  return track_queries(name, limit=limit, strict=True)
+
+
+def _call_site() -> str:
+  """
+  Returns:
+    The innermost application frame outside app/db, e.g. "app/services/job_service.py:431 in create_job"
+  """
+  for frame in reversed(traceback.extract_stack()):
+    filename = os.path.abspath(frame.filename)
+    if filename.startswith(APP_ROOT) and not filename.startswith(DB_PACKAGE):
+      return f"{os.path.relpath(filename, os.path.dirname(APP_ROOT))}:{frame.lineno} in {frame.name}"
+  return "unknown"
+
+
+def _format_params(parameters) -> str:
+  text = repr(parameters)
+  return text if len(text) <= MAX_LOGGED_PARAMS else text[:MAX_LOGGED_PARAMS] + "..."
+
+
+def profile_engine(engine: Engine) -> None:
+  """
+  Attach the slow-query log and query budget counting to engine.
+  For async engines pass async_engine.sync_engine.
+  """
+
+  @event.listens_for(engine, "before_cursor_execute")
+  def _before(conn, cursor, statement, parameters, context, executemany):
+    budget = _current_budget.get()
+    if budget is not None:
+      budget.count += 1
+      budget.statements.append(statement)
+      if budget.strict and budget.exceeded:
+        raise QueryBudgetExceeded(
+          f"Query budget exceeded: {budget.summary()}",
+          details={"name": budget.name, "limit": budget.limit, "count": budget.count}
+        )
+
+    conn.info.setdefault("profile_start", []).append(time.perf_counter())
+
+  @event.listens_for(engine, "after_cursor_execute")
+  def _after(conn, cursor, statement, parameters, context, executemany):
+    elapsed_ms = (time.perf_counter() - conn.info["profile_start"].pop()) * 1000
+    if elapsed_ms >= SLOW_QUERY_MS:
+      logger.warning(
+        f"Slow query ({elapsed_ms:.0f} ms) at {_call_site()}: "
+        f"{statement} | params={_format_params(parameters)}"
+      )
+
+  @event.listens_for(engine, "handle_error")
+  def _error(context):
+    starts = context.connection.info.get("profile_start") if context.connection is not None else None
+    if starts:
+      starts.pop()
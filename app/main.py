@@ -1,19 +1,22 @@
 from fastapi import FastAPI
 from dotenv import load_dotenv
-from app.db.base import Base
-from app.db.session import engine
-from app.models import Job
+from app.db.init_db import init_db
 from app.api.jobs import router as jobs_router
+from app.api.scrapes import router as scrapes_router
+from app.api.metrics import router as metrics_router, MetricsMiddleware
 
 load_dotenv()
 
 app = FastAPI(title="JobTrail API")
+app.add_middleware(MetricsMiddleware)
 
 # Create tables
-Base.metadata.create_all(bind=engine)
+init_db()
 
 
 app.include_router(jobs_router)
+app.include_router(scrapes_router)
+app.include_router(metrics_router)
 
 
 @app.get("/")
@@ -1 +1,6 @@
-from .job import Job
+from .job import Job, JobTombstone
+from .stats import JobStatCounter
+from .description import JobDescription, CompressionDictionary
+from .events import JobEvent, FunnelStageStats, DailyActivity
+from .versions import TableVersion
+from .exports import ExportWatermark
@@ -0,0 +1,105 @@
+from datetime import datetime, timezone
+from sqlalchemy import Column, String, Integer, DateTime, LargeBinary, ForeignKey, event
+from sqlalchemy.orm import Session, relationship
+from app.db.base import Base
+from app.models.job import Job
+from app.utils import compression
+
+
+class CompressionDictionary(Base):
+  """
+  Shared compression dictionary trained on stored descriptions.
+  The newest dictionary for the preferred codec is used for new blobs.
+  """
+  __tablename__ = "compression_dictionaries"
+
+  id = Column(Integer, primary_key=True, autoincrement=True)
+  codec = Column(String, nullable=False)  # zstd, zlib
+  data = Column(LargeBinary, nullable=False)
+  sample_count = Column(Integer, nullable=False, default=0)
+  created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+
+
+class JobDescription(Base):
+  """
+  Content-addressed, compressed job description. Jobs with identical
+  descriptions share one row, keyed by the SHA-256 of the text.
+  """
+  __tablename__ = "job_descriptions"
+
+  hash = Column(String(64), primary_key=True)
+  codec = Column(String, nullable=False)  # raw, zstd, zlib
+  dictionary_id = Column(Integer, ForeignKey("compression_dictionaries.id"), nullable=True)
+  size = Column(Integer, nullable=False)  # uncompressed bytes
+  data = Column(LargeBinary, nullable=False)
+
+  dictionary = relationship(CompressionDictionary)
+
+  @classmethod
+  def from_text(cls, digest: str, text: str, dictionary: CompressionDictionary = None) -> "JobDescription":
+    codec, payload = compression.compress(
+      text,
+      dictionary.codec if dictionary else compression.preferred_codec(),
+      dictionary.data if dictionary else None,
+      dictionary.id if dictionary else None,
+    )
+    return cls(
+      hash=digest,
+      codec=codec,
+      dictionary_id=dictionary.id if dictionary and codec != "raw" else None,
+      size=len(text.encode("utf-8")),
+      data=payload,
+    )
+
+  @property
+  def text(self) -> str:
+    dictionary = self.dictionary if self.dictionary_id else None
+    return compression.decompress(
+      self.data,
+      self.codec,
+      dictionary.data if dictionary else None,
+      self.dictionary_id,
+    )
+
+
+def active_dictionary(session: Session) -> CompressionDictionary:
+  """
+  Returns:
+    The newest dictionary usable with the preferred codec, or None
+  """
+  return session.query(CompressionDictionary).filter(
+    CompressionDictionary.codec == compression.preferred_codec()
+  ).order_by(CompressionDictionary.id.desc()).first()
+
+
+@event.listens_for(Session, "before_flush")
+def _store_descriptions(session, flush_context, instances):
+  """
+  Create the JobDescription rows for descriptions set on jobs being
+  flushed, reusing an existing row when the same text is already stored.
+  """
+  pending = [
+    obj for obj in list(session.new) + list(session.dirty)
+    if isinstance(obj, Job) and obj.description_hash and Job.PENDING_DESCRIPTION in obj.__dict__
+  ]
+
+  if not pending:
+    return
+
+  created = {}
+  with session.no_autoflush:
+    dictionary = None
+    for job in pending:
+      digest, text = job.__dict__[Job.PENDING_DESCRIPTION]
+      if digest != job.description_hash:
+        continue
+
+      blob = created.get(digest) or session.get(JobDescription, digest)
+      if blob is None:
+        if dictionary is None:
+          dictionary = active_dictionary(session) or False
+        blob = JobDescription.from_text(digest, text, dictionary or None)
+        session.add(blob)
+        created[digest] = blob
+
+      job.description_blob = blob
@@ -0,0 +1,50 @@
+from datetime import datetime, timezone
+from sqlalchemy import Column, String, Integer, Float, Date, DateTime, Index
+from app.db.base import Base
+
+
+class JobEvent(Base):
+  """
+  Append-only log of job status changes, written in the same transaction
+  as the change. Creation is logged as a change from no status.
+  Events are kept when a job is deleted so funnel history stays intact.
+  """
+  __tablename__ = "job_events"
+
+  id = Column(Integer, primary_key=True, autoincrement=True)
+  job_id = Column(String, nullable=False)
+  from_status = Column(String, nullable=True)
+  to_status = Column(String, nullable=False)
+  created_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+
+  __table_args__ = (
+    Index("ix_job_events_job_time", "job_id", "created_at"),
+    Index("ix_job_events_time", "created_at"),
+  )
+
+
+class FunnelStageStats(Base):
+  """
+  Precomputed funnel aggregates per pipeline stage: how many jobs ever
+  reached the stage and the summed time from creation to first reaching it.
+  """
+  __tablename__ = "funnel_stage_stats"
+
+  stage = Column(String, primary_key=True)
+  reached = Column(Integer, nullable=False, default=0)
+  total_seconds = Column(Float, nullable=False, default=0)
+
+
+class DailyActivity(Base):
+  """
+  Daily rollup of the event log by source and status: jobs added with the
+  status that day, and jobs moved into it from another status. Maintained
+  with the events, so trend charts read O(days) rows instead of the log.
+  """
+  __tablename__ = "job_daily_activity"
+
+  day = Column(Date, primary_key=True)
+  source = Column(String, primary_key=True)
+  status = Column(String, primary_key=True)
+  created = Column(Integer, nullable=False, default=0)
+  changed = Column(Integer, nullable=False, default=0)
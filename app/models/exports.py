@@ -0,0 +1,16 @@
+from datetime import datetime, timezone
+from sqlalchemy import Column, String, Integer, DateTime
+from app.db.base import Base
+
+
+class ExportWatermark(Base):
+  """
+  Jobs change sequence covered by the last incremental export of a name.
+  The next `export --since-last` only writes jobs changed after it.
+  """
+  __tablename__ = "export_watermarks"
+
+  name = Column(String, primary_key=True)
+  change_seq = Column(Integer, nullable=False, default=0)
+  path = Column(String, nullable=True)
+  exported_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
@@ -1,6 +1,8 @@
 import uuid
-from sqlalchemy import Column, String, DateTime, Text
+import hashlib
+from sqlalchemy import Column, String, DateTime, Text, Integer, Index, ForeignKey, func
 from sqlalchemy.dialects.sqlite import BLOB
+from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
 from app.db.base import Base
 
@@ -14,7 +16,15 @@ class Job(Base):
   location = Column(String, nullable=False)
   job_type = Column(String, nullable=False)  # remote, hybrid, onsite
   salary = Column(String, nullable=True)
-  description = Column(Text, nullable=True)
+  # Parsed from `salary` at ingest (see app.utils.salary); whole currency units
+  salary_min = Column(Integer, nullable=True, index=True)
+  salary_max = Column(Integer, nullable=True, index=True)
+  salary_currency = Column(String(3), nullable=True)
+  salary_period = Column(String, nullable=True)  # hour, day, week, month, year
+  # Descriptions live compressed in job_descriptions (see models/description.py);
+  # the legacy inline column is only read for rows not yet migrated.
+  description_hash = Column(String(64), ForeignKey("job_descriptions.hash"), nullable=True, index=True)
+  _legacy_description = Column("description", Text, nullable=True)
 
   url = Column(String, nullable=False, unique=True)
   source = Column(String, nullable=False)
@@ -24,3 +34,62 @@ class Job(Base):
   notes = Column(Text, nullable=True)
 
   created_at = Column(DateTime(timezone=True), default=lambda:datetime.now(timezone.utc))
+  updated_at = Column(
+    DateTime(timezone=True),
+    default=lambda: datetime.now(timezone.utc),
+    onupdate=lambda: datetime.now(timezone.utc)
+  )
+  # jobs table version of the write that last changed this row (see version_service)
+  change_seq = Column(Integer, nullable=True)
+
+  description_blob = relationship("JobDescription", lazy="select")
+
+  # Instance attribute holding (hash, text) for a description set in Python
+  PENDING_DESCRIPTION = "_description_text"
+
+  @property
+  def description(self):
+    """Description text, decompressed on first access."""
+    pending = self.__dict__.get(self.PENDING_DESCRIPTION)
+    if pending and pending[0] == self.description_hash:
+      return pending[1]
+
+    if self.description_hash is None:
+      return self._legacy_description
+
+    text = self.description_blob.text if self.description_blob else None
+    self.__dict__[self.PENDING_DESCRIPTION] = (self.description_hash, text)
+    return text
+
+  @description.setter
+  def description(self, text):
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest() if text else None
+    self.__dict__[self.PENDING_DESCRIPTION] = (digest, text)
+    self.description_hash = digest
+    self._legacy_description = None
+
+
+# Sort keys for salary ordering; open-ended ranges fall back to their known bound
+Index("ix_jobs_salary_high", func.coalesce(Job.salary_max, Job.salary_min))
+Index("ix_jobs_salary_low", func.coalesce(Job.salary_min, Job.salary_max))
+# Newest-first listing and keyset pagination on (created_at, id)
+Index("ix_jobs_created_at_id", Job.created_at, Job.id)
+# Per-status columns of the kanban board, newest first
+Index("ix_jobs_status_created_at_id", Job.status, Job.created_at, Job.id)
+# Change feed order
+Index("ix_jobs_change_seq_id", Job.change_seq, Job.id)
+
+
+class JobTombstone(Base):
+  """
+  Marker left behind by a deleted job so the change feed can report it.
+  """
+  __tablename__ = "job_tombstones"
+
+  job_id = Column(String, primary_key=True)
+  change_seq = Column(Integer, nullable=False)
+  deleted_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+
+  __table_args__ = (
+    Index("ix_job_tombstones_change_seq", "change_seq", "job_id"),
+  )
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, String, Date, Integer
+from app.db.base import Base
+
+
+class JobStatCounter(Base):
+  """
+  Rollup of job counts by status, source, job type and creation day.
+
+  Maintained by the job service in the same transaction as the job writes,
+  so reading stats never has to scan the jobs table.
+  """
+  __tablename__ = "job_stat_counters"
+
+  status = Column(String, primary_key=True)
+  source = Column(String, primary_key=True)
+  job_type = Column(String, primary_key=True)
+  day = Column(Date, primary_key=True)
+  count = Column(Integer, nullable=False, default=0)
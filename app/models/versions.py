@@ -0,0 +1,16 @@
+from datetime import datetime, timezone
+from sqlalchemy import Column, String, Integer, DateTime
+from app.db.base import Base
+
+
+class TableVersion(Base):
+  """
+  Change counter per table, bumped in the same transaction as every write.
+  Cheap to read, so HTTP validators (ETag / Last-Modified) can be checked
+  before running the real query.
+  """
+  __tablename__ = "table_versions"
+
+  table_name = Column(String, primary_key=True)
+  version = Column(Integer, nullable=False, default=0)
+  updated_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
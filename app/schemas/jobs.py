@@ -1,6 +1,6 @@
 from datetime import datetime
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from typing import List, Optional, Dict, Any, Literal
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class JobBase(BaseModel):
@@ -21,6 +21,14 @@ class JobCreate(JobBase):
   pass
 
 
+class JobImport(JobBase):
+  """One job read from an import file; the optional fields restore exported state."""
+  id: Optional[str] = None
+  status: Optional[str] = None
+  notes: Optional[str] = None
+  created_at: Optional[datetime] = None
+
+
 class JobUpdate(BaseModel):
   title: Optional[str] = None
   company: Optional[str] = None
@@ -33,28 +41,100 @@ class JobUpdate(BaseModel):
 
 
 class JobOut(JobBase):
+  model_config = ConfigDict(from_attributes=True)
+
   id: str
   title: str
   status: str
   notes: Optional[str] = None
+  salary_min: Optional[int] = None
+  salary_max: Optional[int] = None
+  salary_currency: Optional[str] = None
+  salary_period: Optional[str] = None
   created_at: datetime
-
-  class Config:
-    orm_mode = True
+  updated_at: Optional[datetime] = None
+  change_seq: Optional[int] = None
 
 class JobFilters(BaseModel):
   """Filter parameters for job queries."""
-  search: Optional[str] = Field(None, description="Search in title and company")
+  search: Optional[str] = Field(None, description="Search in title and company (job descriptions are not searched)")
   status: Optional[str] = Field(None, description="Filter by status")
   source: Optional[str] = Field(None, description="Filter by source")
   job_type: Optional[str] = Field(None, description="Filter by job type")
   location: Optional[str] = Field(None, description="Filter by location")
-  salary_min: Optional[int] = Field(None, description="Minimum salary")
-  salary_max: Optional[int] = Field(None, description="Maximum salary")
+  salary_min: Optional[int] = Field(None, description="Minimum yearly salary (only yearly salaries match)")
+  salary_max: Optional[int] = Field(None, description="Maximum yearly salary (only yearly salaries match)")
+  salary_currency: str = Field("USD", description="Currency of the salary bounds (only salaries in it match)")
   date_from: Optional[datetime] = Field(None, description="Filter jobs added after this date")
   date_to: Optional[datetime] = Field(None, description="Filter jobs added before this date")
+  sort: Literal["newest", "salary_desc", "salary_asc"] = Field("newest", description="Sort order")
   limit: Optional[int] = Field(100, description="Maximum number of results")
-  offset: Optional[int] = Field(0, description="Pagination offset")
+  offset: Optional[int] = Field(0, description="Pagination offset (ignored when a cursor is given)")
+  cursor: Optional[str] = Field(None, description="Opaque cursor from a previous page's next_cursor")
+
+
+class JobPage(BaseModel):
+  """One page of jobs with the cursor for the next page."""
+  items: List[JobOut]
+  next_cursor: Optional[str] = None
+
+
+class JobChange(BaseModel):
+  """One entry of the change feed; deleted jobs carry no job body."""
+  seq: int
+  id: str
+  deleted: bool
+  changed_at: Optional[datetime] = None
+  job: Optional[JobOut] = None
+
+
+class JobChangeFeed(BaseModel):
+  """Changes after a cursor, with the cursor to resume from."""
+  changes: List[JobChange]
+  next_cursor: str
+  has_more: bool
+
+
+class BulkJobResult(BaseModel):
+  """Outcome for one item of a bulk create."""
+  index: int
+  status: Literal["created", "updated", "skipped", "invalid"]
+  id: Optional[str] = None
+  error: Optional[str] = None
+
+
+class BulkJobResponse(BaseModel):
+  """Per-item results and totals for a bulk create."""
+  created: int = 0
+  updated: int = 0
+  skipped: int = 0
+  invalid: int = 0
+  results: List[BulkJobResult]
+
+
+class BulkStatusUpdate(BaseModel):
+  """Set one status on many jobs."""
+  job_ids: List[str]
+  status: str
+
+
+class BulkStatusResponse(BaseModel):
+  updated: int
+
+
+class ImportResult(BaseModel):
+  """Totals of a file import."""
+  read: int = 0
+  created: int = 0
+  updated: int = 0
+  skipped: int = 0
+  invalid: int = 0
+  seconds: float = 0.0
+  errors: List[str] = []
+
+  @property
+  def rows_per_second(self) -> float:
+    return self.read / self.seconds if self.seconds else 0.0
 
 
 class JobStats(BaseModel):
@@ -64,4 +144,19 @@ class JobStats(BaseModel):
   by_source: Dict[str, int]
   by_job_type: Dict[str, int]
   recent_7days: int
-  recent_30days: int
\ No newline at end of file
+  recent_30days: int
+
+
+class FunnelStage(BaseModel):
+  """Funnel metrics for one pipeline stage."""
+  stage: str
+  reached: int
+  conversion_rate: Optional[float] = None
+  avg_days_to_reach: Optional[float] = None
+
+
+class FunnelMetrics(BaseModel):
+  """Pipeline funnel metrics."""
+  stages: List[FunnelStage]
+  time_to_apply_days: Optional[float] = None
+  time_to_interview_days: Optional[float] = None
@@ -0,0 +1,42 @@
+from datetime import datetime
+from typing import List, Literal, Optional
+from pydantic import BaseModel, Field
+
+RunStatus = Literal["queued", "running", "done", "failed"]
+
+
+class ScrapeRequest(BaseModel):
+  """Sources to scrape; all registered sources when omitted."""
+  sources: Optional[List[str]] = Field(None, description="Scraper names, e.g. remoteok")
+
+
+class ScrapeSourceProgress(BaseModel):
+  """Progress and results for one source of a scrape run."""
+  source: str
+  status: Literal["pending", "scraping", "saving", "done", "failed"] = "pending"
+  found: int = 0
+  saved: int = 0
+  duplicates: int = 0
+  errors: int = 0
+  error: Optional[str] = None
+  started_at: Optional[datetime] = None
+  finished_at: Optional[datetime] = None
+
+
+class ScrapeRun(BaseModel):
+  """A background scrape run and its per-source progress."""
+  id: str
+  status: RunStatus = "queued"
+  sources: List[ScrapeSourceProgress]
+  created_at: datetime
+  started_at: Optional[datetime] = None
+  finished_at: Optional[datetime] = None
+  total_saved: int = 0
+  # Why the run itself stopped, when it failed outside a single source
+  error: Optional[str] = None
+  # Bumped on every progress update, so pollers can tell when something changed
+  version: int = 0
+
+  @property
+  def finished(self) -> bool:
+    return self.status in ("done", "failed")
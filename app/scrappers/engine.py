@@ -1,22 +1,43 @@
-from typing import List, Type
+from typing import Callable, List, Optional, Type
 from sqlalchemy.orm import Session
 from rich.console import Console
 from .base import BaseScraper
 from app.services import job_service
 from app.schemas.jobs import JobCreate
 from app.utils.logging import get_logger
+from app.utils.metrics import registry
 
 logger = get_logger(__name__)
 
 console = Console()
 
+SCRAPE_STAGE_DURATION = registry.histogram(
+  "jobtrail_scraper_stage_duration_seconds",
+  "Time spent per scraper stage (fetch: scraping the source, save: validating and storing)",
+  ["source", "stage"],
+  buckets=(0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+)
+SCRAPED_JOBS = registry.counter(
+  "jobtrail_scraper_jobs_total",
+  "Jobs returned by scrapers, by outcome (saved, duplicate, invalid)",
+  ["source", "outcome"]
+)
+
+# on_progress(source_name, stage, counts): stage is "scraping", "saving" or "done"
+ProgressCallback = Callable[[str, str, dict], None]
+
 class ScraperEngine:
   """
   Responsible for running scrapers and saving results to DB.
   """
 
-  def __init__(self, db: Session):
+  def __init__(self, db: Session, on_progress: Optional[ProgressCallback] = None):
     self.db = db
+    self.on_progress = on_progress
+
+  def _report(self, source_name: str, stage: str, **counts):
+    if self.on_progress:
+      self.on_progress(source_name, stage, counts)
 
   def run_scraper(self, scraper: BaseScraper) -> int:
     """
@@ -24,33 +45,46 @@ class ScraperEngine:
     Returns number of jobs saved.
     """
     console.print(f"[blue]🔎 Running scraper:[/blue] {scraper.source_name}")
+    self._report(scraper.source_name, "scraping")
 
-    jobs = scraper.scrape()
+    with SCRAPE_STAGE_DURATION.time(source=scraper.source_name, stage="fetch"):
+      jobs = scraper.scrape()
 
     if not jobs:
       console.print(f"[yellow]⚠️ No jobs found from {scraper.source_name}[/yellow]")
+      self._report(scraper.source_name, "done", found=0, saved=0, duplicates=0, errors=0)
       return 0
     
     logger.info(f"Found {len(jobs)} jobs from {scraper.source_name}")
 
-    saved_count = 0
-    duplicate_count = 0
     error_count = 0
+    valid_jobs = []
 
-    for job_data in jobs:
-      try:
-        job_schema = JobCreate(**job_data)
-        result = job_service.create_job(self.db, job_schema)
+    with SCRAPE_STAGE_DURATION.time(source=scraper.source_name, stage="save"):
+      for job_data in jobs:
+        try:
+          valid_jobs.append(JobCreate(**job_data))
+        except Exception as e:
+          error_count += 1
+          logger.error(f"Error saving job from {scraper.source_name}: {str(e)}")
 
-        if result:
-          saved_count += 1
-        else:
-          duplicate_count += 1
-      except Exception as e:
-        error_count += 1
-        logger.error(f"Error saving job from {scraper.source_name}: {str(e)}")
+      self._report(scraper.source_name, "saving", found=len(jobs), errors=error_count)
+
+      # Save the whole batch in one transaction
+      created = job_service.create_jobs(self.db, valid_jobs)
+
+    saved_count = len(created)
+    duplicate_count = len(valid_jobs) - saved_count
+
+    SCRAPED_JOBS.inc(saved_count, source=scraper.source_name, outcome="saved")
+    SCRAPED_JOBS.inc(duplicate_count, source=scraper.source_name, outcome="duplicate")
+    SCRAPED_JOBS.inc(error_count, source=scraper.source_name, outcome="invalid")
     
     logger.info(f"Scraper {scraper.source_name} results: {saved_count} saved, {duplicate_count} duplicates, {error_count} errors")
+    self._report(
+      scraper.source_name, "done",
+      found=len(jobs), saved=saved_count, duplicates=duplicate_count, errors=error_count
+    )
 
     #console.print(f"[green]Saved {saved_count} jobs from {scraper.source_name}[/green]")
     return saved_count
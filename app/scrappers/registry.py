@@ -2,6 +2,13 @@ from .remoteok import RemoteOKScraper
 from .weworkremotely import WeWorkRemotelyScraper
 from .remotive import RemotiveScraper
 
+# Scraper classes by lowercase source name
+SCRAPER_CLASSES = {
+  "remoteok": RemoteOKScraper,
+  "weworkremotely": WeWorkRemotelyScraper,
+  "remotive": RemotiveScraper,
+}
+
 def get_all_scrapers():
   return [
     RemoteOKScraper(),
@@ -0,0 +1,96 @@
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.async_session import AsyncSessionLocal
+from app.models.job import Job
+from app.schemas.jobs import JobCreate, JobUpdate, JobFilters, JobStats, FunnelMetrics
+from app.services import job_service, description_service, version_service
+
+# Async counterparts of job_service for the FastAPI routes. Each runs the sync
+# implementation through AsyncSession.run_sync, so statements go through the
+# async driver (aiosqlite / asyncpg) while rollups, the event log and the cache
+# stay in one place. Jobs are fully loaded before leaving run_sync because
+# async code cannot lazy-load attributes.
+
+# Rows fetched per round trip when streaming
+STREAM_BATCH_SIZE = 1000
+
+
+def _loaded(job: Optional[Job]) -> Optional[Job]:
+  """Load the compressed description while still inside run_sync."""
+  if job is not None:
+    job.description
+  return job
+
+
+async def get_jobs(db: AsyncSession, filters: Optional[JobFilters]) -> List[Job]:
+  return await db.run_sync(job_service.get_jobs, filters)
+
+
+async def get_job_page(db: AsyncSession, filters: JobFilters) -> Tuple[List[Job], Optional[str]]:
+  return await db.run_sync(job_service.get_job_page, filters)
+
+
+async def stream_jobs(filters: Optional[JobFilters]) -> AsyncIterator[List[Dict[str, Any]]]:
+  """
+  Stream full job records matching filters, one batch of dicts at a time.
+  Rows are fetched with yield_per and never held all at once, so memory
+  stays flat regardless of the result size.
+
+  Opens its own session: the stream outlives the request's dependencies.
+  """
+  async with AsyncSessionLocal() as db:
+    dictionaries = await db.run_sync(description_service.load_dictionaries)
+    statement = job_service.export_statement(filters).execution_options(yield_per=STREAM_BATCH_SIZE)
+    result = await db.stream(statement)
+
+    async for rows in result.partitions():
+      yield [job_service.export_record(row, dictionaries) for row in rows]
+
+
+async def get_job_by_id(db: AsyncSession, job_id: str) -> Optional[Job]:
+  return await db.run_sync(lambda session: _loaded(job_service.get_job_by_id(session, job_id)))
+
+
+async def create_job(db: AsyncSession, job_data: JobCreate) -> Optional[Job]:
+  return await db.run_sync(lambda session: _loaded(job_service.create_job(session, job_data)))
+
+
+async def create_jobs(db: AsyncSession, jobs_data: List[JobCreate]) -> List[Job]:
+  return await db.run_sync(job_service.create_jobs, jobs_data)
+
+
+async def upsert_jobs(db: AsyncSession, jobs_data: List[JobCreate], on_conflict: str = "skip") -> List[Tuple[str, Optional[str]]]:
+  return await db.run_sync(job_service.upsert_jobs, jobs_data, on_conflict)
+
+
+async def update_job(db: AsyncSession, job_id: str, job_data: JobUpdate) -> Optional[Job]:
+  return await db.run_sync(lambda session: _loaded(job_service.update_job(session, job_id, job_data)))
+
+
+async def update_job_status(db: AsyncSession, job_id: str, new_status: str) -> Optional[Job]:
+  return await db.run_sync(lambda session: _loaded(job_service.update_job_status(session, job_id, new_status)))
+
+
+async def bulk_update_status(db: AsyncSession, job_ids: List[str], new_status: str) -> int:
+  return await db.run_sync(job_service.bulk_update_status, job_ids, new_status)
+
+
+async def delete_job(db: AsyncSession, job_id: str) -> bool:
+  return await db.run_sync(job_service.delete_job, job_id)
+
+
+async def get_changes(db: AsyncSession, since: Optional[str], limit: int) -> Tuple[List[Dict[str, Any]], str, bool]:
+  return await db.run_sync(job_service.get_changes, since, limit)
+
+
+async def get_jobs_version(db: AsyncSession) -> Tuple[int, Optional[datetime]]:
+  return await db.run_sync(version_service.get_version, Job.__tablename__)
+
+
+async def get_job_stats(db: AsyncSession) -> JobStats:
+  return await db.run_sync(job_service.get_job_stats)
+
+
+async def get_funnel_metrics(db: AsyncSession) -> FunnelMetrics:
+  return await db.run_sync(job_service.get_funnel_metrics)
@@ -0,0 +1,189 @@
+from typing import Dict, Optional
+from sqlalchemy.orm import Session
+from sqlalchemy import func
+from app.models.job import Job
+from app.models.description import JobDescription, CompressionDictionary, active_dictionary
+from app.utils import compression
+from app.utils.cache import query_cache
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_BATCH_SIZE = 500
+
+
+def train_dictionary(db: Session, sample_size: int = 2000) -> Optional[CompressionDictionary]:
+  """
+  Train a shared dictionary on a random sample of stored descriptions
+  (both migrated blobs and legacy inline text).
+
+  Returns:
+    The new CompressionDictionary, or None if there was nothing to learn from
+  """
+  samples = [
+    text for text, in db.query(Job._legacy_description).filter(
+      Job._legacy_description.isnot(None)
+    ).order_by(func.random()).limit(sample_size).all()
+  ]
+
+  remaining = sample_size - len(samples)
+  if remaining > 0:
+    blobs = db.query(JobDescription).order_by(func.random()).limit(remaining).all()
+    samples.extend(blob.text for blob in blobs)
+
+  if not samples:
+    logger.info("No descriptions to train a dictionary on")
+    return None
+
+  codec = compression.preferred_codec()
+  data = compression.train_dictionary(samples, codec)
+
+  if not data:
+    return None
+
+  try:
+    dictionary = CompressionDictionary(codec=codec, data=data, sample_count=len(samples))
+    db.add(dictionary)
+    db.commit()
+    logger.info(f"Trained {codec} dictionary ({len(data)} bytes) on {len(samples)} descriptions")
+    return dictionary
+
+  except Exception as e:
+    db.rollback()
+    logger.error(f"Error saving compression dictionary: {e}")
+    raise
+
+
+def migrate_descriptions(db: Session, batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+  """
+  Move inline descriptions into the compressed, deduplicated
+  job_descriptions table, one committed batch at a time.
+
+  Returns:
+    Number of jobs migrated
+  """
+  migrated = 0
+
+  while True:
+    jobs = db.query(Job).filter(
+      Job._legacy_description.isnot(None)
+    ).limit(batch_size).all()
+
+    if not jobs:
+      break
+
+    try:
+      for job in jobs:
+        # The setter hashes the text and clears the inline column
+        job.description = job._legacy_description
+      db.commit()
+    except Exception as e:
+      db.rollback()
+      logger.error(f"Error migrating descriptions: {e}")
+      raise
+
+    migrated += len(jobs)
+    db.expunge_all()
+
+  query_cache.invalidate()
+  logger.info(f"Migrated {migrated} descriptions to compressed storage")
+  return migrated
+
+
+def recompress_descriptions(db: Session, batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+  """
+  Re-encode blobs that do not use the active dictionary, e.g. after
+  training a new one.
+
+  Returns:
+    Number of blobs rewritten
+  """
+  dictionary = active_dictionary(db)
+  if dictionary is None:
+    return 0
+
+  rewritten = 0
+  last_hash = ""
+
+  while True:
+    blobs = db.query(JobDescription).filter(
+      JobDescription.hash > last_hash
+    ).order_by(JobDescription.hash).limit(batch_size).all()
+
+    if not blobs:
+      break
+
+    try:
+      for blob in blobs:
+        if blob.dictionary_id == dictionary.id:
+          continue
+        fresh = JobDescription.from_text(blob.hash, blob.text, dictionary)
+        blob.codec = fresh.codec
+        blob.dictionary_id = fresh.dictionary_id
+        blob.data = fresh.data
+        rewritten += 1
+      db.commit()
+    except Exception as e:
+      db.rollback()
+      logger.error(f"Error recompressing descriptions: {e}")
+      raise
+
+    last_hash = blobs[-1].hash
+
+  logger.info(f"Recompressed {rewritten} descriptions")
+  return rewritten
+
+
+def prune_descriptions(db: Session) -> int:
+  """
+  Delete description blobs no longer referenced by any job.
+
+  Returns:
+    Number of blobs deleted
+  """
+  referenced = db.query(Job.description_hash).filter(Job.description_hash.isnot(None))
+
+  try:
+    deleted = db.query(JobDescription).filter(
+      ~JobDescription.hash.in_(referenced)
+    ).delete(synchronize_session=False)
+    db.commit()
+    logger.info(f"Pruned {deleted} unreferenced descriptions")
+    return deleted
+
+  except Exception as e:
+    db.rollback()
+    logger.error(f"Error pruning descriptions: {e}")
+    raise
+
+
+def load_dictionaries(db: Session) -> Dict[int, bytes]:
+  """
+  Returns:
+    Compression dictionary bytes by id, for decoding raw description rows
+  """
+  return {
+    dictionary_id: data
+    for dictionary_id, data in db.query(CompressionDictionary.id, CompressionDictionary.data).all()
+  }
+
+
+def get_storage_stats(db: Session) -> Dict[str, int]:
+  """
+  Returns:
+    Blob count, raw and stored byte totals, and inline rows left to migrate
+  """
+  blobs, raw_bytes, stored_bytes = db.query(
+    func.count(JobDescription.hash),
+    func.coalesce(func.sum(JobDescription.size), 0),
+    func.coalesce(func.sum(func.length(JobDescription.data)), 0),
+  ).one()
+
+  legacy = db.query(func.count(Job.id)).filter(Job._legacy_description.isnot(None)).scalar()
+
+  return {
+    "blobs": blobs,
+    "raw_bytes": raw_bytes,
+    "stored_bytes": stored_bytes,
+    "legacy_rows": legacy,
+  }
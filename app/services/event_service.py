@@ -0,0 +1,415 @@
+from collections import Counter, defaultdict
+from datetime import date, datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import Row, bindparam, case, func, insert, update
+from sqlalchemy.orm import Session
+from app.models.job import Job
+from app.models.events import JobEvent, FunnelStageStats, DailyActivity
+from app.services import stats_service
+from app.schemas.jobs import FunnelMetrics, FunnelStage
+from app.utils.cache import query_cache
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Forward path through the pipeline; conversion is measured between neighbours
+PIPELINE_STAGES = ["saved", "applied", "interview", "offer"]
+ALL_STAGES = PIPELINE_STAGES + ["rejected"]
+
+SECONDS_PER_DAY = 86400
+
+# Keeps IN (...) lists under SQLite's bound-parameter limit
+CHUNK_SIZE = 500
+
+# Daily activity of jobs deleted before the rollup existed has no known source
+UNKNOWN_SOURCE = "unknown"
+
+# (job_id, job source, job created_at, from_status, to_status)
+StatusChange = Tuple[str, str, Optional[datetime], Optional[str], str]
+
+
+def _utc(value: Optional[datetime]) -> Optional[datetime]:
+  """SQLite returns naive datetimes; they are stored as UTC."""
+  if value is None or value.tzinfo is not None:
+    return value
+  return value.replace(tzinfo=timezone.utc)
+
+
+def _stages_reached(status: str) -> List[str]:
+  """
+  A job that jumps ahead in the pipeline has passed the stages it skipped,
+  and every job was saved first. Crediting those keeps each stage's count
+  within the one before it, so conversion never exceeds 100%.
+
+  Returns:
+    Funnel stages a job in status has reached
+  """
+  if status in PIPELINE_STAGES:
+    return PIPELINE_STAGES[:PIPELINE_STAGES.index(status) + 1]
+  return ["saved", status]
+
+
+def _reached_before(db: Session, changes: List[StatusChange]) -> set:
+  """
+  Returns:
+    (job_id, stage) pairs from changes that earlier events already reached
+  """
+  wanted = {
+    (job_id, stage)
+    for job_id, _, _, _, to_status in changes
+    for stage in _stages_reached(to_status)
+  }
+  job_ids = list({job_id for job_id, _ in wanted})
+  reached = set()
+
+  for start in range(0, len(job_ids), CHUNK_SIZE):
+    chunk = job_ids[start:start + CHUNK_SIZE]
+    rows = db.query(JobEvent.job_id, JobEvent.to_status).filter(
+      JobEvent.job_id.in_(chunk)
+    ).distinct().all()
+    reached.update(
+      (job_id, stage)
+      for job_id, to_status in rows
+      for stage in _stages_reached(to_status)
+      if (job_id, stage) in wanted
+    )
+
+  return reached
+
+
+def _apply_stage_deltas(db: Session, reached: Counter, seconds: Dict[str, float]) -> None:
+  for stage, count in reached.items():
+    updated = db.query(FunnelStageStats).filter(
+      FunnelStageStats.stage == stage
+    ).update(
+      {
+        FunnelStageStats.reached: FunnelStageStats.reached + count,
+        FunnelStageStats.total_seconds: FunnelStageStats.total_seconds + seconds[stage],
+      },
+      synchronize_session=False
+    )
+
+    if not updated:
+      db.add(FunnelStageStats(stage=stage, reached=count, total_seconds=seconds[stage]))
+      db.flush()
+
+
+def _apply_activity_deltas(db: Session, created: Counter, changed: Counter) -> None:
+  """
+  Add per-day counts to the daily activity rollup: one lookup of the
+  existing rows, then an executemany each for increments and new rows.
+  """
+  keys = set(created) | set(changed)
+  if not keys:
+    return
+
+  days = list({day for day, _, _ in keys})
+  existing = set()
+  for start in range(0, len(days), CHUNK_SIZE):
+    existing.update(db.query(
+      DailyActivity.day,
+      DailyActivity.source,
+      DailyActivity.status,
+    ).filter(DailyActivity.day.in_(days[start:start + CHUNK_SIZE])).all())
+
+  increments = []
+  new_rows = []
+  for key in keys:
+    day, source, status = key
+    if key in existing:
+      increments.append({
+        "b_day": day, "b_source": source, "b_status": status,
+        "b_created": created[key], "b_changed": changed[key],
+      })
+    else:
+      new_rows.append({
+        "day": day, "source": source, "status": status,
+        "created": created[key], "changed": changed[key],
+      })
+
+  if increments:
+    activity = DailyActivity.__table__
+    db.execute(
+      update(activity).where(
+        activity.c.day == bindparam("b_day"),
+        activity.c.source == bindparam("b_source"),
+        activity.c.status == bindparam("b_status"),
+      ).values(
+        created=activity.c.created + bindparam("b_created"),
+        changed=activity.c.changed + bindparam("b_changed"),
+      ),
+      increments
+    )
+
+  if new_rows:
+    db.execute(insert(DailyActivity), new_rows)
+
+
+def record_status_changes(
+  db: Session,
+  changes: Iterable[StatusChange],
+  at: Optional[datetime] = None,
+  new_jobs: bool = False
+) -> None:
+  """
+  Append events for status changes and update the funnel aggregates and
+  the daily activity rollup.
+  Pass new_jobs=True for freshly created jobs to skip the history lookup;
+  their creation events are stamped with the job's created_at.
+
+  Does not commit; callers record events inside the transaction that
+  changed the jobs.
+  """
+  changes = [change for change in changes if change[3] != change[4]]
+  if not changes:
+    return
+
+  at = at or datetime.now(timezone.utc)
+  already_reached = set() if new_jobs else _reached_before(db, changes)
+
+  reached = Counter()
+  seconds = defaultdict(float)
+  counted = set()
+  events = []
+  created = Counter()
+  changed = Counter()
+
+  for job_id, source, created_at, from_status, to_status in changes:
+    event_at = _utc(created_at) if new_jobs and created_at is not None else at
+    activity = created if from_status is None else changed
+    activity[(event_at.date(), source or UNKNOWN_SOURCE, to_status)] += 1
+
+    events.append({
+      "job_id": job_id,
+      "from_status": from_status,
+      "to_status": to_status,
+      "created_at": event_at,
+    })
+
+    # Funnel stats only count the first time a job reaches a stage
+    for stage in _stages_reached(to_status):
+      key = (job_id, stage)
+      if key in already_reached or key in counted:
+        continue
+      counted.add(key)
+
+      reached[stage] += 1
+      if created_at is not None:
+        seconds[stage] += max((event_at - _utc(created_at)).total_seconds(), 0)
+
+  # One executemany instead of an ORM object per event
+  db.execute(insert(JobEvent.__table__), events)
+  _apply_stage_deltas(db, reached, seconds)
+  _apply_activity_deltas(db, created, changed)
+
+
+def record_created(db: Session, jobs: Iterable[Job]) -> None:
+  """
+  Log creation events for newly flushed jobs.
+  """
+  changes = [(job.id, job.source, job.created_at, None, job.status or "saved") for job in jobs]
+  record_status_changes(db, changes, new_jobs=True)
+
+
+def get_funnel_metrics(db: Session) -> FunnelMetrics:
+  """
+  Reads the precomputed per-stage aggregates; never scans the event log.
+
+  Returns:
+    FunnelMetrics with per-stage counts, conversion rates and timings
+  """
+  rows = {row.stage: row for row in db.query(FunnelStageStats).all()}
+
+  def avg_days(stage: str) -> Optional[float]:
+    row = rows.get(stage)
+    if not row or not row.reached:
+      return None
+    return row.total_seconds / row.reached / SECONDS_PER_DAY
+
+  stages = []
+  previous = None
+  for stage in ALL_STAGES:
+    reached = rows[stage].reached if stage in rows else 0
+    # Rejections can happen at any point, so compare them with all saved jobs
+    base_stage = "saved" if stage == "rejected" else previous
+    base = rows[base_stage].reached if base_stage in rows else 0
+
+    stages.append(FunnelStage(
+      stage=stage,
+      reached=reached,
+      conversion_rate=reached / base if base_stage and base else None,
+      avg_days_to_reach=avg_days(stage),
+    ))
+
+    if stage in PIPELINE_STAGES:
+      previous = stage
+
+  return FunnelMetrics(
+    stages=stages,
+    time_to_apply_days=avg_days("applied"),
+    time_to_interview_days=avg_days("interview"),
+  )
+
+
+def get_daily_activity(db: Session, since: date) -> List[Row]:
+  """
+  Reads the daily activity rollup; never scans the event log or jobs.
+
+  Returns:
+    Rows of (day, source, status, created, changed) from since on, oldest first
+  """
+  return db.query(
+    DailyActivity.day,
+    DailyActivity.source,
+    DailyActivity.status,
+    DailyActivity.created,
+    DailyActivity.changed,
+  ).filter(DailyActivity.day >= since).order_by(DailyActivity.day).all()
+
+
+def rebuild_funnel(db: Session) -> int:
+  """
+  Seed creation events for jobs that have none, then recompute the funnel
+  aggregates from the event log. Times are measured from each job's first
+  event, so deleted jobs still count.
+
+  Returns:
+    Number of jobs seeded with a creation event
+  """
+  try:
+    logged = db.query(JobEvent.job_id).distinct()
+    unlogged = db.query(Job.id, Job.created_at, Job.status).filter(
+      ~Job.id.in_(logged)
+    ).all()
+
+    # History before the event log existed is unknown: log the current status at creation
+    db.add_all([
+      JobEvent(
+        job_id=job_id,
+        from_status=None,
+        to_status=status or "saved",
+        created_at=_utc(created_at) or datetime.now(timezone.utc),
+      )
+      for job_id, created_at, status in unlogged
+    ])
+    db.flush()
+
+    db.query(FunnelStageStats).delete(synchronize_session=False)
+
+    reached = Counter()
+    seconds = defaultdict(float)
+    current_job = None
+    started_at = None
+    seen = set()
+
+    events = db.query(JobEvent.job_id, JobEvent.to_status, JobEvent.created_at).order_by(
+      JobEvent.job_id, JobEvent.created_at, JobEvent.id
+    ).yield_per(1000)
+
+    for job_id, to_status, created_at in events:
+      if job_id != current_job:
+        current_job = job_id
+        started_at = _utc(created_at)
+        seen = set()
+
+      for stage in _stages_reached(to_status):
+        if stage in seen:
+          continue
+        seen.add(stage)
+
+        reached[stage] += 1
+        seconds[stage] += max((_utc(created_at) - started_at).total_seconds(), 0)
+
+    db.add_all([
+      FunnelStageStats(stage=stage, reached=count, total_seconds=seconds[stage])
+      for stage, count in reached.items()
+    ])
+    db.commit()
+    query_cache.invalidate()
+    logger.info(f"Rebuilt funnel stats ({len(unlogged)} jobs seeded with creation events)")
+    return len(unlogged)
+
+  except Exception as e:
+    db.rollback()
+    logger.error(f"Error rebuilding funnel stats: {e}")
+    raise
+
+
+def ensure_funnel(db: Session) -> Optional[int]:
+  """
+  Seed the event log and funnel aggregates for databases that predate them.
+
+  Returns:
+    Number of jobs seeded, or None if no rebuild was needed
+  """
+  has_events = db.query(JobEvent.id).first() is not None
+  has_jobs = db.query(Job.id).first() is not None
+
+  if has_jobs and not has_events:
+    return rebuild_funnel(db)
+  return None
+
+
+def rebuild_activity(db: Session) -> int:
+  """
+  Recompute the daily activity rollup from the event log with one grouped
+  scan. Events of jobs deleted since are counted under UNKNOWN_SOURCE.
+
+  Returns:
+    Number of rollup rows written
+  """
+  try:
+    db.query(DailyActivity).delete(synchronize_session=False)
+
+    day = func.date(JobEvent.created_at)
+    source = func.coalesce(Job.source, UNKNOWN_SOURCE)
+    is_creation = JobEvent.from_status.is_(None)
+    rows = db.query(
+      day,
+      source,
+      JobEvent.to_status,
+      func.sum(case((is_creation, 1), else_=0)),
+      func.sum(case((is_creation, 0), else_=1)),
+    ).outerjoin(
+      Job, Job.id == JobEvent.job_id
+    ).group_by(
+      day,
+      source,
+      JobEvent.to_status,
+    ).all()
+
+    if rows:
+      db.execute(insert(DailyActivity), [
+        {
+          "day": stats_service.as_date(event_day),
+          "source": event_source,
+          "status": status,
+          "created": created,
+          "changed": changed,
+        }
+        for event_day, event_source, status, created, changed in rows
+      ])
+    db.commit()
+    query_cache.invalidate()
+    logger.info(f"Rebuilt daily activity rollup: {len(rows)} rows")
+    return len(rows)
+
+  except Exception as e:
+    db.rollback()
+    logger.error(f"Error rebuilding daily activity: {e}")
+    raise
+
+
+def ensure_activity(db: Session) -> Optional[int]:
+  """
+  Seed the daily activity rollup for databases that predate it.
+
+  Returns:
+    Number of rows written, or None if no rebuild was needed
+  """
+  has_activity = db.query(DailyActivity.day).first() is not None
+  has_events = db.query(JobEvent.id).first() is not None
+
+  if has_events and not has_activity:
+    return rebuild_activity(db)
+  return None
@@ -0,0 +1,211 @@
+import os
+import re
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+from sqlalchemy.orm import Session
+from app.models.exports import ExportWatermark
+from app.services import job_service, version_service
+from app.utils import export as exporter
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Delta records are job records plus a deletion marker
+DELTA_FIELDS = job_service.RECORD_FIELDS + ("deleted",)
+DELTA_TYPES = {**job_service.RECORD_TYPES, "deleted": bool}
+
+# <name>-<UTC timestamp>-<after seq>-<until seq>.<format>[.<compression>]
+# Hidden files never match; partial writes use them (see _write_delta)
+DELTA_PATTERN = re.compile(r"^(?P<name>[^.].*)-(?P<stamp>\d{8}T\d{6}Z)-(?P<after>\d+)-(?P<until>\d+)\.")
+
+
+class DeltaFile(NamedTuple):
+  path: Path
+  after_seq: int
+  until_seq: int
+
+
+def get_watermark(db: Session, name: str) -> int:
+  """
+  Returns:
+    Change sequence covered by the last incremental export of name, 0 if none
+  """
+  seq = db.query(ExportWatermark.change_seq).filter(ExportWatermark.name == name).scalar()
+  return seq or 0
+
+
+def save_watermark(db: Session, name: str, change_seq: int, path: Optional[Path]) -> None:
+  try:
+    watermark = db.get(ExportWatermark, name)
+    if watermark is None:
+      watermark = ExportWatermark(name=name)
+      db.add(watermark)
+
+    watermark.change_seq = change_seq
+    watermark.path = str(path) if path else None
+    watermark.exported_at = datetime.now(timezone.utc)
+    db.commit()
+  except Exception as e:
+    db.rollback()
+    logger.error(f"Error saving export watermark {name}: {e}")
+    raise
+
+
+def delta_path(
+  directory: Path,
+  name: str,
+  after_seq: int,
+  until_seq: int,
+  format: str,
+  compression: str = "none"
+) -> Path:
+  """
+  Returns:
+    Timestamped file for the changes in (after_seq, until_seq]
+  """
+  stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+  return exporter.output_path(directory, f"{name}-{stamp}-{after_seq}-{until_seq}", format, compression)
+
+
+def _write_delta(path: Path, batches: Iterable[List[dict]], format: str, compression: str) -> int:
+  """
+  Write a delta under a hidden temporary name and move it into place once
+  complete, so a failed write never leaves a file that looks like a delta.
+
+  Returns:
+    Number of records written
+  """
+  partial = path.with_name(f".{path.name}.partial")
+  try:
+    count = exporter.export_records(
+      batches,
+      partial,
+      format,
+      DELTA_FIELDS,
+      compression,
+      types=DELTA_TYPES,
+      dictionary_fields=job_service.CATEGORICAL_FIELDS,
+    )
+    os.replace(partial, path)
+  except BaseException:
+    partial.unlink(missing_ok=True)
+    raise
+  return count
+
+
+def find_deltas(directory: Path, name: str) -> List[DeltaFile]:
+  """
+  Returns:
+    Delta files of name in directory, oldest range first
+  """
+  if not directory.is_dir():
+    return []
+
+  deltas = []
+  for path in directory.iterdir():
+    match = DELTA_PATTERN.match(path.name)
+    if match and match["name"] == name:
+      deltas.append(DeltaFile(path, int(match["after"]), int(match["until"])))
+  return sorted(deltas, key=lambda delta: (delta.until_seq, delta.after_seq))
+
+
+def export_delta(
+  db: Session,
+  directory: Path,
+  name: str,
+  format: str,
+  compression: str = "none",
+  batch_size: int = 1000
+) -> Tuple[Optional[Path], int]:
+  """
+  Write the jobs created, changed or deleted since the last incremental
+  export of name to a new delta file, then move the watermark forward.
+  The first run has no watermark and writes every job.
+
+  Returns:
+    (delta file, number of records); (None, 0) if nothing changed
+  """
+  exporter.check_format(format, compression)
+  after_seq = get_watermark(db, name)
+  until_seq, _ = version_service.get_version(db, "jobs")
+
+  if until_seq <= after_seq:
+    return None, 0
+
+  directory.mkdir(parents=True, exist_ok=True)
+  path = delta_path(directory, name, after_seq, until_seq, format, compression)
+  count = _write_delta(path, job_service.iter_job_changes(db, after_seq, until_seq, batch_size), format, compression)
+
+  save_watermark(db, name, until_seq, path)
+  logger.info(f"Exported {count} changes ({after_seq}, {until_seq}] to {path}")
+  return path, count
+
+
+def compact_deltas(
+  directory: Path,
+  name: str,
+  format: Optional[str] = None,
+  compression: Optional[str] = None,
+  batch_size: int = 1000
+) -> Tuple[Optional[Path], int, int]:
+  """
+  Merge consecutive delta files into one delta covering their whole range,
+  keeping only the latest state of each job. When the range starts at the
+  beginning (no earlier export to apply it to), deleted jobs are dropped
+  instead of kept as deletion markers. Holds one record per job in memory.
+
+  Format and compression default to those of the newest delta. The merged
+  files are removed afterwards.
+
+  Returns:
+    (compacted file, records written, delta files merged); (None, 0, n) if
+    there was nothing to merge
+
+  Raises:
+    ValueError: if the deltas do not form one unbroken range
+  """
+  deltas = find_deltas(directory, name)
+  if len(deltas) < 2:
+    return None, 0, len(deltas)
+
+  for previous, delta in zip(deltas, deltas[1:]):
+    if delta.after_seq != previous.until_seq:
+      raise ValueError(
+        f"Deltas are not contiguous: {previous.path.name} ends at {previous.until_seq}, "
+        f"{delta.path.name} starts at {delta.after_seq}"
+      )
+
+  newest_format, newest_compression = exporter.detect_format(deltas[-1].path)
+  format = format or newest_format
+  compression = compression or newest_compression
+  exporter.check_format(format, compression)
+
+  latest: Dict[str, dict] = {}
+  for delta in deltas:
+    for records in exporter.read_records(delta.path, DELTA_TYPES, batch_size):
+      for record in records:
+        # Later deltas win; re-inserting moves the job to the end (change order)
+        latest.pop(record["id"], None)
+        latest[record["id"]] = record
+
+  after_seq, until_seq = deltas[0].after_seq, deltas[-1].until_seq
+  records = [
+    {field: record.get(field) for field in DELTA_FIELDS}
+    for record in latest.values()
+    if after_seq > 0 or not record.get("deleted")
+  ]
+
+  path = delta_path(directory, name, after_seq, until_seq, format, compression)
+  count = _write_delta(
+    path,
+    (records[start:start + batch_size] for start in range(0, len(records), batch_size)),
+    format,
+    compression,
+  )
+
+  for delta in deltas:
+    delta.path.unlink()
+
+  logger.info(f"Compacted {len(deltas)} deltas ({after_seq}, {until_seq}] into {path}")
+  return path, count, len(deltas)
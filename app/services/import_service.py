@@ -0,0 +1,334 @@
+import hashlib
+import time
+import uuid
+from collections import Counter
+from functools import lru_cache
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+from pydantic import ValidationError
+from sqlalchemy import bindparam, insert, select, update
+from sqlalchemy.orm import Session
+from sqlalchemy.schema import CreateIndex, DropIndex
+from app.models.description import JobDescription, active_dictionary
+from app.models.job import Job, JobTombstone
+from app.schemas.jobs import ImportResult, JobImport
+from app.services import job_service, stats_service, event_service, version_service
+from app.utils import export as exporter
+from app.utils.cache import query_cache
+from app.utils.logging import get_logger
+from app.utils.salary import parse_salary
+
+logger = get_logger(__name__)
+
+# Keeps IN (...) lists under SQLite's bound-parameter limit
+CHUNK_SIZE = job_service.BULK_CHUNK_SIZE
+
+# Validation errors kept for the report; the rest are only counted
+MAX_REPORTED_ERRORS = 20
+
+# Salary texts repeat heavily across a file; parse each distinct one once
+_parse_salary = lru_cache(maxsize=10000)(parse_salary)
+
+
+def _chunks(values: List[Any]) -> Iterable[List[Any]]:
+  for start in range(0, len(values), CHUNK_SIZE):
+    yield values[start:start + CHUNK_SIZE]
+
+
+def _deferred_indexes(db: Session, defer_indexes: Optional[bool]) -> List:
+  """
+  Secondary indexes on jobs that can be dropped during a load and rebuilt
+  once afterwards. Unique indexes stay: upserts look jobs up by URL.
+
+  The drop and rebuild run inside the import transaction. On SQLite that
+  costs nothing extra, since a writer already locks the whole database. On
+  server databases DROP INDEX takes an exclusive lock on jobs until commit,
+  blocking every reader for the whole load, so by default (None) indexes
+  are only deferred on SQLite; pass True to accept the lock for very large
+  imports into an otherwise idle database.
+
+  Returns:
+    The indexes to drop, empty when they should be kept
+  """
+  if defer_indexes is None:
+    defer_indexes = db.get_bind().dialect.name == "sqlite"
+  if not defer_indexes:
+    return []
+  return [index for index in Job.__table__.indexes if not index.unique]
+
+
+def _validate(
+  records: List[Dict[str, Any]],
+  first_row: int,
+  result: ImportResult
+) -> List[JobImport]:
+  """
+  Returns:
+    The valid records; invalid ones and deletion markers are counted in result
+  """
+  valid = []
+  for row, record in enumerate(records, start=first_row):
+    if record.get("deleted"):
+      result.skipped += 1
+      continue
+
+    try:
+      # Empty csv cells mean "not set"; pydantic parses the remaining text
+      valid.append(JobImport.model_validate({
+        field: None if value == "" else value for field, value in record.items()
+      }))
+    except ValidationError as e:
+      result.invalid += 1
+      if len(result.errors) < MAX_REPORTED_ERRORS:
+        error = e.errors()[0]
+        location = ".".join(str(part) for part in error["loc"])
+        result.errors.append(f"row {row}: {location}: {error['msg']}")
+  return valid
+
+
+def _store_descriptions(db: Session, jobs: List[JobImport], dictionary) -> Dict[str, str]:
+  """
+  Insert the descriptions not stored yet, compressed, in one executemany.
+
+  Returns:
+    {description text: hash}
+  """
+  hashes = {
+    job.description: hashlib.sha256(job.description.encode("utf-8")).hexdigest()
+    for job in jobs if job.description
+  }
+  if not hashes:
+    return hashes
+
+  wanted = {digest: text for text, digest in hashes.items()}
+  stored = set()
+  for chunk in _chunks(list(wanted)):
+    stored.update(db.execute(select(JobDescription.hash).filter(JobDescription.hash.in_(chunk))).scalars())
+
+  blobs = [
+    JobDescription.from_text(digest, text, dictionary)
+    for digest, text in wanted.items() if digest not in stored
+  ]
+  if blobs:
+    db.execute(insert(JobDescription), [
+      {
+        "hash": blob.hash,
+        "codec": blob.codec,
+        "dictionary_id": blob.dictionary_id,
+        "size": blob.size,
+        "data": blob.data,
+      }
+      for blob in blobs
+    ])
+  return hashes
+
+
+def _utc(value: Optional[datetime]) -> Optional[datetime]:
+  """Store aware datetimes as UTC; naive ones are taken to be UTC already."""
+  if value is None or value.tzinfo is None:
+    return value
+  return value.astimezone(timezone.utc)
+
+
+def _job_values(job: JobImport, description_hashes: Dict[str, str]) -> Dict[str, Any]:
+  """
+  Returns:
+    jobs table column values taken from the import (legacy description cleared)
+  """
+  return {
+    "title": job.title,
+    "company": job.company,
+    "location": job.location,
+    "job_type": job.job_type,
+    "salary": job.salary,
+    **_parse_salary(job.salary),
+    "description_hash": description_hashes.get(job.description) if job.description else None,
+    "description": None,
+    "source": job.source,
+  }
+
+
+def _load_batch(
+  db: Session,
+  jobs: List[JobImport],
+  on_conflict: str,
+  change_seq: int,
+  dictionary,
+  deltas: Counter,
+  result: ImportResult
+) -> None:
+  """
+  Write one validated batch. Stats rollup deltas are added to deltas for
+  the caller to apply once.
+  """
+  # Repeats of a URL within the batch are skipped, keeping the first
+  unique = {}
+  for job in jobs:
+    unique.setdefault(job.url, job)
+  result.skipped += len(jobs) - len(unique)
+
+  existing = {}
+  for chunk in _chunks(list(unique)):
+    existing.update((row.url, row) for row in db.execute(
+      select(Job.id, Job.url, Job.status, Job.notes, Job.source, Job.job_type, Job.created_at).filter(Job.url.in_(chunk))
+    ))
+
+  new = [job for url, job in unique.items() if url not in existing]
+  updates = [job for url, job in unique.items() if url in existing] if on_conflict == "update" else []
+  result.skipped += len(unique) - len(new) - len(updates)
+
+  # Keep exported ids unless another job already has them
+  requested_ids = [job.id for job in new if job.id]
+  taken_ids = set()
+  for chunk in _chunks(requested_ids):
+    taken_ids.update(db.execute(select(Job.id).filter(Job.id.in_(chunk))).scalars())
+
+  description_hashes = _store_descriptions(db, new + updates, dictionary)
+  now = datetime.now(timezone.utc)
+
+  rows = []
+  assigned = set()
+  for job in new:
+    job_id = job.id if job.id and job.id not in taken_ids and job.id not in assigned else str(uuid.uuid4())
+    assigned.add(job_id)
+    row = {
+      "id": job_id,
+      "url": job.url,
+      "status": job.status or stats_service.DEFAULT_STATUS,
+      "notes": job.notes,
+      "created_at": _utc(job.created_at) or now,
+      "updated_at": now,
+      "change_seq": change_seq,
+      **_job_values(job, description_hashes),
+    }
+    rows.append(row)
+    deltas[(row["status"], row["source"], row["job_type"], row["created_at"].date())] += 1
+
+  if rows:
+    # Table-level executemany: column names, no per-row ORM bookkeeping
+    db.execute(insert(Job.__table__), rows)
+    # A reimported job is no longer deleted
+    for chunk in _chunks([row["id"] for row in rows]):
+      db.query(JobTombstone).filter(JobTombstone.job_id.in_(chunk)).delete(synchronize_session=False)
+    event_service.record_status_changes(db, [
+      (row["id"], row["source"], row["created_at"], None, row["status"]) for row in rows
+    ], new_jobs=True)
+
+  changed = []
+  for job in updates:
+    old = existing[job.url]
+    # executemany takes its SET columns from the first row, so every row
+    # carries the same keys; unset fields keep their stored value
+    values = {
+      "b_id": old.id,
+      "updated_at": now,
+      "change_seq": change_seq,
+      "status": job.status or old.status or stats_service.DEFAULT_STATUS,
+      "notes": job.notes if job.notes is not None else old.notes,
+      **_job_values(job, description_hashes),
+    }
+    changed.append(values)
+
+    old_key = stats_service.job_key(old)
+    new_key = (values["status"], job.source, job.job_type, old_key[3])
+    if new_key != old_key:
+      deltas[old_key] -= 1
+      deltas[new_key] += 1
+
+  if changed:
+    db.execute(update(Job.__table__).where(Job.__table__.c.id == bindparam("b_id")), changed)
+    event_service.record_status_changes(db, [
+      (values["b_id"], job.source, existing[job.url].created_at, existing[job.url].status, values["status"])
+      for job, values in zip(updates, changed)
+    ])
+
+  result.created += len(rows)
+  result.updated += len(changed)
+
+
+def import_records(
+  db: Session,
+  batches: Iterable[List[Dict[str, Any]]],
+  on_conflict: str = "skip",
+  defer_indexes: Optional[bool] = None
+) -> ImportResult:
+  """
+  Validate and load job records in a single transaction. Jobs are matched
+  by URL: stored ones are skipped or overwritten (on_conflict="update"),
+  the rest are inserted with their exported id, status, notes and
+  created_at when present. Rows and events are written with executemany,
+  the funnel is updated once per batch and the stats rollup once at the
+  end. The secondary job indexes are dropped for the load and rebuilt at
+  the end when defer_indexes is True, or by default on SQLite only (see
+  _deferred_indexes).
+
+  Invalid records are counted and skipped; any database error rolls back
+  the whole import.
+
+  Returns:
+    ImportResult with the totals
+  """
+  result = ImportResult()
+  started = time.perf_counter()
+
+  try:
+    change_seq = version_service.bump(db, Job.__tablename__)
+    dictionary = active_dictionary(db)
+    deltas = Counter()
+
+    indexes = _deferred_indexes(db, defer_indexes)
+    for index in indexes:
+      db.execute(DropIndex(index, if_exists=True))
+
+    for records in batches:
+      jobs = _validate(records, result.read + 1, result)
+      result.read += len(records)
+      if jobs:
+        _load_batch(db, jobs, on_conflict, change_seq, dictionary, deltas, result)
+
+    stats_service.apply_deltas(db, deltas)
+
+    for index in indexes:
+      db.execute(CreateIndex(index, if_not_exists=True))
+
+    db.commit()
+    query_cache.invalidate()
+
+  except Exception as e:
+    db.rollback()
+    logger.error(f"Error importing jobs: {e}")
+    raise
+
+  result.seconds = time.perf_counter() - started
+  logger.info(
+    f"Imported {result.read} rows in {result.seconds:.1f}s: {result.created} created, "
+    f"{result.updated} updated, {result.skipped} skipped, {result.invalid} invalid"
+  )
+  return result
+
+
+def import_file(
+  db: Session,
+  path: Path,
+  on_conflict: str = "skip",
+  batch_size: int = 1000,
+  defer_indexes: Optional[bool] = None
+) -> ImportResult:
+  """
+  Import a csv, json, ndjson, parquet or Arrow file written by
+  `jobtrail export` (or any file with the same columns); the format
+  comes from the file name.
+
+  Returns:
+    ImportResult with the totals
+
+  Raises:
+    ValueError: if the file format is not recognized
+  """
+  return import_records(
+    db,
+    exporter.read_records(path, batch_size=batch_size),
+    on_conflict,
+    defer_indexes,
+  )
@@ -1,35 +1,245 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import func, desc, or_
+from sqlalchemy.orm import Session, make_transient_to_detached, selectinload
+from sqlalchemy import func, or_, and_, inspect, update, select, union_all, Row, Select
 from sqlalchemy.exc import IntegrityError
-from typing import List, Optional
-from datetime import datetime, timedelta
-from app.models.job import Job
-from app.schemas.jobs import JobCreate, JobUpdate, JobFilters, JobStats
+from collections import Counter
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterator, List, Literal, NamedTuple, Optional, Sequence, Tuple
+import base64
+import binascii
+import json
+from app.models.job import Job, JobTombstone
+from app.models.description import JobDescription
+from app.schemas.jobs import JobCreate, JobUpdate, JobFilters, JobStats, FunnelMetrics
+from app.services import stats_service, event_service, description_service, version_service
+from app.utils import compression
+from app.utils.cache import query_cache
 from app.utils.logging import get_logger
+from app.utils.salary import parse_salary
 
 logger = get_logger(__name__)
 
+# Keeps IN (...) lists under SQLite's bound-parameter limit
+BULK_CHUNK_SIZE = 500
 
-def get_jobs(
-  db: Session,
-  filters: Optional[JobFilters]
-) -> List[Job]:
-  """    
+# Tries for create_job when a concurrent writer inserted the same rollup
+# bucket or description first; a retry sees their row and increments it
+CREATE_ATTEMPTS = 3
+
+# Columns needed by list views (everything except description and notes)
+SUMMARY_COLUMNS = (
+  Job.id,
+  Job.title,
+  Job.company,
+  Job.location,
+  Job.job_type,
+  Job.salary,
+  Job.salary_min,
+  Job.salary_max,
+  Job.salary_currency,
+  Job.salary_period,
+  Job.url,
+  Job.source,
+  Job.status,
+  Job.created_at,
+  Job.updated_at,
+  Job.change_seq,
+)
+
+# Columns for full dumps: summaries plus notes and the stored description,
+# decoded row by row with export_record() instead of loading ORM objects
+EXPORT_COLUMNS = SUMMARY_COLUMNS + (
+  Job.notes,
+  Job._legacy_description.label("legacy_description"),
+  JobDescription.codec.label("description_codec"),
+  JobDescription.dictionary_id.label("description_dictionary_id"),
+  JobDescription.data.label("description_data"),
+)
+
+# Keys of the plain-dict job records served by the API
+RECORD_FIELDS = tuple(column.key for column in SUMMARY_COLUMNS) + ("notes", "description")
+
+# Python type of each record field, for typed (columnar) exports
+RECORD_TYPES = {
+  **{column.key: column.type.python_type for column in SUMMARY_COLUMNS},
+  "notes": str,
+  "description": str,
+}
+
+# Low-cardinality record fields, dictionary-encoded in columnar exports
+CATEGORICAL_FIELDS = ("job_type", "source", "status")
+
+
+class BoardColumn(NamedTuple):
+  """One status column of the kanban board."""
+  count: int
+  jobs: List[Row]
+  next_cursor: Optional[str]
+
+
+class SortKey(NamedTuple):
+  expr: Any
+  descending: bool
+  nullable: bool
+  value: Callable[[Any], Any]
+
+
+def _field(row, name: str) -> Any:
+  """Read a field from a job, a result row or a job record dict."""
+  return row[name] if isinstance(row, dict) else getattr(row, name)
+
+
+def _salary_high(row) -> Optional[int]:
+  high = _field(row, "salary_max")
+  return high if high is not None else _field(row, "salary_min")
+
+
+def _salary_low(row) -> Optional[int]:
+  low = _field(row, "salary_min")
+  return low if low is not None else _field(row, "salary_max")
+
+
+_NEWEST = SortKey(Job.created_at, True, False, lambda row: _field(row, "created_at"))
+
+# Every sort ends with the primary key so keyset pages never skip or repeat rows
+SORT_KEYS = {
+  "newest": (
+    _NEWEST,
+  ),
+  "salary_desc": (
+    SortKey(func.coalesce(Job.salary_max, Job.salary_min), True, True, _salary_high),
+    _NEWEST,
+  ),
+  "salary_asc": (
+    SortKey(func.coalesce(Job.salary_min, Job.salary_max), False, True, _salary_low),
+    _NEWEST,
+  ),
+}
+_ID_KEY = SortKey(Job.id, True, False, lambda row: _field(row, "id"))
+
+
+def _filters_key(filters: Optional[JobFilters]) -> Optional[tuple]:
+  """
+  Normalize filters into a hashable cache key. Unset fields are dropped and
+  case-insensitive terms are lowercased so equivalent filters share an entry.
+  """
+  if filters is None:
+    return None
+
+  data = filters.model_dump(exclude_none=True)
+  for field in ("search", "location"):
+    if field in data:
+      data[field] = data[field].lower()
+
+  return tuple(sorted(data.items()))
+
+
+def _cached(db: Session, key: tuple, loader: Callable[[], Any]) -> Any:
+  """
   Returns:
-    List of Job objects matching filters
+    loader()'s result from the query cache, valid for the current jobs
+    table version (bumped by every job write, in any process)
+  """
+  version, _ = version_service.get_version(db, Job.__tablename__)
+  return query_cache.get_or_load(key, loader, version)
+
+
+def _snapshot(job: Job) -> Job:
+  """
+  Copy a loaded job into a detached instance that is safe to cache and
+  share between sessions and threads.
+  """
+  copy = Job(**{
+    attr.key: getattr(job, attr.key)
+    for attr in inspect(Job).column_attrs
+  })
+  # Carry the decompressed description along; the copy has no session to load it
+  copy.__dict__[Job.PENDING_DESCRIPTION] = (job.description_hash, job.description)
+  make_transient_to_detached(copy)
+  return copy
+
+
+def _sort_keys(sort: str) -> Tuple[SortKey, ...]:
+  return SORT_KEYS[sort] + (_ID_KEY,)
+
+
+def _json_default(value):
+  if isinstance(value, datetime):
+    return {"$dt": value.isoformat()}
+  raise TypeError(f"Cannot encode {type(value).__name__} in a cursor")
+
+
+def _json_object(value: dict):
+  return datetime.fromisoformat(value["$dt"]) if "$dt" in value else value
+
+
+def encode_cursor(sort: str, row) -> str:
+  """
+  Returns:
+    Opaque cursor pointing just after row in the given sort order
+  """
+  payload = [sort] + [key.value(row) for key in _sort_keys(sort)]
+  raw = json.dumps(payload, default=_json_default, separators=(",", ":"))
+  return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str) -> List[Any]:
+  """
+  Returns:
+    Sort key values stored in the cursor
+
+  Raises:
+    ValueError: if the cursor is malformed or belongs to another sort order
+  """
+  try:
+    raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+    payload = json.loads(raw, object_hook=_json_object)
+  except (binascii.Error, UnicodeDecodeError, ValueError, KeyError, TypeError) as e:
+    raise ValueError("Invalid cursor") from e
+
+  if not isinstance(payload, list) or payload[:1] != [sort] or len(payload) != len(_sort_keys(sort)) + 1:
+    raise ValueError("Invalid cursor for this sort order")
+
+  return payload[1:]
+
+
+def _keyset_filter(keys: Tuple[SortKey, ...], values: List[Any]):
+  """
+  Rows strictly after the cursor position: equal on every earlier key and
+  past the cursor on this one. NULL sort keys always come last.
+  """
+  clauses = []
+  for i, (key, value) in enumerate(zip(keys, values)):
+    if value is None:
+      # Nothing sorts after NULL on a nulls-last key
+      continue
+
+    after = key.expr < value if key.descending else key.expr > value
+    if key.nullable:
+      after = or_(after, key.expr.is_(None))
+
+    equal = [
+      earlier.expr.is_(None) if earlier_value is None else earlier.expr == earlier_value
+      for earlier, earlier_value in zip(keys[:i], values[:i])
+    ]
+    clauses.append(and_(*equal, after))
+
+  return or_(*clauses)
+
+
+def _apply_filters(query, filters: Optional[JobFilters]):
+  """
+  Returns:
+    query with the filters, ordering and pagination applied
   """
-  query = db.query(Job)
-  
   # Apply filters if provided
   if filters:
-    # Search in title and company
+    # Search in title and company (descriptions are stored compressed)
     if filters.search:
       search_term = f"%{filters.search}%"
       query = query.filter(
         or_(
           Job.title.ilike(search_term),
-          Job.company.ilike(search_term),
-          Job.description.ilike(search_term)
+          Job.company.ilike(search_term)
         )
       )
     
@@ -56,20 +266,434 @@ def get_jobs(
     
     if filters.date_to:
       query = query.filter(Job.created_at <= filters.date_to)
+
+    # Filter by salary range overlap (uses the salary_min/salary_max indexes).
+    # Open-ended ranges only store one bound, so fall back to the other one.
+    # Hourly, daily, weekly and monthly figures are not comparable with the
+    # yearly bounds, and amounts are not converted between currencies, so
+    # salary filters only match yearly salaries in the filter's currency.
+    if filters.salary_min is not None or filters.salary_max is not None:
+      query = query.filter(
+        Job.salary_period == "year",
+        Job.salary_currency == filters.salary_currency.upper()
+      )
+
+    if filters.salary_min is not None:
+      query = query.filter(
+        or_(
+          Job.salary_max >= filters.salary_min,
+          and_(Job.salary_max.is_(None), Job.salary_min >= filters.salary_min)
+        )
+      )
+
+    if filters.salary_max is not None:
+      query = query.filter(
+        or_(
+          Job.salary_min <= filters.salary_max,
+          and_(Job.salary_min.is_(None), Job.salary_max <= filters.salary_max)
+        )
+      )
     
-    # Default ordering: newest first
-    query = query.order_by(desc(Job.created_at))
+    # Ordering: newest first unless sorting by salary
+    keys = _sort_keys(filters.sort)
+    for key in keys:
+      order = key.expr.desc() if key.descending else key.expr.asc()
+      query = query.order_by(order.nulls_last() if key.nullable else order)
 
-    # Pagination
-    if filters.offset:
+    # Pagination: keyset when a cursor is given, offset otherwise
+    if filters.cursor:
+      query = query.filter(_keyset_filter(keys, decode_cursor(filters.cursor, filters.sort)))
+    elif filters.offset:
       query = query.offset(filters.offset)
     
     if filters.limit:
       query = query.limit(filters.limit)
-  
 
-  
-  return query.all()
+  return query
+
+
+def get_jobs(
+  db: Session,
+  filters: Optional[JobFilters]
+) -> List[Job]:
+  """
+  Results are cached per normalized filter set and returned as detached
+  snapshots; load a job with get_job_by_id before modifying it.
+
+  Returns:
+    List of Job objects matching filters
+  """
+  def load():
+    query = db.query(Job).options(
+      selectinload(Job.description_blob).selectinload(JobDescription.dictionary)
+    )
+    jobs = _apply_filters(query, filters).all()
+    return [_snapshot(job) for job in jobs]
+
+  return _cached(db, ("get_jobs", _filters_key(filters)), load)
+
+
+def get_job_records(
+  db: Session,
+  filters: Optional[JobFilters]
+) -> List[Dict[str, Any]]:
+  """
+  Serialization-ready variant of get_jobs: rows are projected straight
+  into dicts with RECORD_FIELDS keys, without building ORM objects.
+  Cached like get_jobs; treat the dicts as read-only.
+
+  Returns:
+    List of job record dicts matching filters
+  """
+  def load():
+    dictionaries = description_service.load_dictionaries(db)
+    rows = db.execute(export_statement(filters)).all()
+    return [export_record(row, dictionaries) for row in rows]
+
+  return _cached(db, ("get_job_records", _filters_key(filters)), load)
+
+
+def job_record(job: Job) -> Dict[str, Any]:
+  """
+  Returns:
+    The job as a dict with RECORD_FIELDS keys
+  """
+  return {field: getattr(job, field) for field in RECORD_FIELDS}
+
+
+def get_job_page(
+  db: Session,
+  filters: JobFilters
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+  """
+  Cursor-paginated get_job_records. One extra row is fetched to tell
+  whether another page follows.
+
+  Returns:
+    (job records on this page, cursor for the next page or None)
+
+  Raises:
+    ValueError: if filters.cursor is invalid
+  """
+  if not filters.limit:
+    return get_job_records(db, filters), None
+
+  records = get_job_records(db, filters.model_copy(update={"limit": filters.limit + 1}))
+  return _split_page(records, filters)
+
+
+def _split_page(rows: list, filters: JobFilters) -> Tuple[list, Optional[str]]:
+  """
+  Returns:
+    (the first filters.limit rows, next-page cursor if the extra row was found)
+  """
+  if len(rows) <= filters.limit:
+    return rows, None
+
+  page = rows[:filters.limit]
+  return page, encode_cursor(filters.sort, page[-1])
+
+
+def export_statement(filters: Optional[JobFilters]) -> Select:
+  """
+  Returns:
+    Select of EXPORT_COLUMNS with the filters applied, for streaming
+  """
+  statement = select(*EXPORT_COLUMNS).outerjoin(
+    JobDescription, Job.description_hash == JobDescription.hash
+  )
+  return _apply_filters(statement, filters)
+
+
+def export_record(row: Row, dictionaries: Dict[int, bytes]) -> Dict[str, Any]:
+  """
+  Decode an export_statement row, decompressing the description.
+
+  Returns:
+    Dict of job fields
+  """
+  record = row._asdict()
+  legacy = record.pop("legacy_description")
+  codec = record.pop("description_codec")
+  dictionary_id = record.pop("description_dictionary_id")
+  data = record.pop("description_data")
+
+  if data is None:
+    record["description"] = legacy
+  else:
+    record["description"] = compression.decompress(
+      data, codec, dictionaries.get(dictionary_id), dictionary_id
+    )
+  return record
+
+
+def iter_job_records(
+  db: Session,
+  filters: Optional[JobFilters],
+  batch_size: int = 1000
+) -> Iterator[List[Dict[str, Any]]]:
+  """
+  Stream every job record matching filters in batches. Rows are fetched
+  with yield_per, so memory use depends on batch_size, not on the number
+  of matching jobs. Bypasses the query cache.
+
+  Yields:
+    Lists of job record dicts with RECORD_FIELDS keys
+  """
+  dictionaries = description_service.load_dictionaries(db)
+  result = db.execute(export_statement(filters).execution_options(yield_per=batch_size))
+
+  for rows in result.partitions():
+    yield [export_record(row, dictionaries) for row in rows]
+
+
+def iter_job_changes(
+  db: Session,
+  after_seq: int,
+  until_seq: int,
+  batch_size: int = 1000
+) -> Iterator[List[Dict[str, Any]]]:
+  """
+  Stream the current state of every job changed in (after_seq, until_seq],
+  in change order, followed by the jobs deleted in that range. Capping at
+  until_seq keeps the range stable while writes continue; later changes
+  are picked up by the next range.
+
+  Yields:
+    Lists of records with RECORD_FIELDS keys plus "deleted"; deleted jobs
+    only carry id and change_seq
+  """
+  dictionaries = description_service.load_dictionaries(db)
+  result = db.execute(
+    export_statement(None).filter(
+      Job.change_seq > after_seq,
+      Job.change_seq <= until_seq
+    ).order_by(Job.change_seq, Job.id).execution_options(yield_per=batch_size)
+  )
+
+  for rows in result.partitions():
+    records = [export_record(row, dictionaries) for row in rows]
+    for record in records:
+      record["deleted"] = False
+    yield records
+
+  tombstones = db.execute(
+    select(JobTombstone.job_id, JobTombstone.change_seq).filter(
+      JobTombstone.change_seq > after_seq,
+      JobTombstone.change_seq <= until_seq
+    ).order_by(JobTombstone.change_seq, JobTombstone.job_id).execution_options(yield_per=batch_size)
+  )
+
+  for rows in tombstones.partitions():
+    yield [
+      {**dict.fromkeys(RECORD_FIELDS), "id": job_id, "change_seq": change_seq, "deleted": True}
+      for job_id, change_seq in rows
+    ]
+
+
+def _parse_change_cursor(since: Optional[str]) -> Tuple[int, Optional[str]]:
+  """
+  Change cursors are "<seq>" or "<seq>:<job id>".
+
+  Raises:
+    ValueError: if the cursor is malformed
+  """
+  if not since:
+    return 0, None
+
+  seq, _, job_id = since.partition(":")
+  try:
+    return int(seq), job_id or None
+  except ValueError:
+    raise ValueError("Invalid change cursor") from None
+
+
+def _after_change(seq_column, id_column, seq: int, job_id: Optional[str]):
+  if job_id is None:
+    return seq_column > seq
+  return or_(seq_column > seq, and_(seq_column == seq, id_column > job_id))
+
+
+def get_changes(
+  db: Session,
+  since: Optional[str],
+  limit: int = 500
+) -> Tuple[List[Dict[str, Any]], str, bool]:
+  """
+  Jobs created, updated or deleted after the since cursor, in change
+  order. Each job appears once with its current state; deleted jobs
+  appear as tombstones. Cost depends on the number of changes, not on
+  the size of the table.
+
+  Returns:
+    (changes, cursor to pass as since next time, True if more changes follow)
+
+  Raises:
+    ValueError: if since is malformed
+  """
+  seq, job_id = _parse_change_cursor(since)
+  dictionaries = description_service.load_dictionaries(db)
+
+  live = db.execute(
+    export_statement(None).filter(
+      _after_change(Job.change_seq, Job.id, seq, job_id)
+    ).order_by(Job.change_seq, Job.id).limit(limit + 1)
+  ).all()
+
+  deleted = db.query(JobTombstone).filter(
+    _after_change(JobTombstone.change_seq, JobTombstone.job_id, seq, job_id)
+  ).order_by(JobTombstone.change_seq, JobTombstone.job_id).limit(limit + 1).all()
+
+  changes = [
+    {
+      "seq": row.change_seq,
+      "id": row.id,
+      "deleted": False,
+      "changed_at": row.updated_at,
+      "job": export_record(row, dictionaries),
+    }
+    for row in live
+  ] + [
+    {
+      "seq": tombstone.change_seq,
+      "id": tombstone.job_id,
+      "deleted": True,
+      "changed_at": tombstone.deleted_at,
+      "job": None,
+    }
+    for tombstone in deleted
+  ]
+  changes.sort(key=lambda change: (change["seq"], change["id"]))
+
+  has_more = len(changes) > limit
+  changes = changes[:limit]
+
+  if not changes:
+    return changes, since or "0", False
+
+  last = changes[-1]
+  return changes, f"{last['seq']}:{last['id']}", has_more
+
+
+def ensure_change_seq(db: Session) -> int:
+  """
+  Give jobs that predate the change feed a change sequence number, so a
+  sync from the beginning still sees them.
+
+  Returns:
+    Number of jobs updated
+  """
+  if db.query(Job.id).filter(Job.change_seq.is_(None)).first() is None:
+    return 0
+
+  try:
+    change_seq = _next_change_seq(db)
+    count = db.query(Job).filter(
+      Job.change_seq.is_(None)
+    ).update(
+      {
+        Job.change_seq: change_seq,
+        Job.updated_at: func.coalesce(Job.updated_at, Job.created_at),
+      },
+      synchronize_session=False
+    )
+    db.commit()
+    query_cache.invalidate()
+    logger.info(f"Assigned change sequence {change_seq} to {count} existing jobs")
+    return count
+
+  except Exception as e:
+    db.rollback()
+    logger.error(f"Error assigning change sequence: {e}")
+    raise
+
+
+def get_job_summaries(
+  db: Session,
+  filters: Optional[JobFilters]
+) -> List[Row]:
+  """
+  List-view variant of get_jobs that selects only SUMMARY_COLUMNS, leaving
+  the large description and notes columns in the database. Use
+  get_job_by_id for detail views that need them.
+
+  Returns:
+    List of read-only rows with attribute access (row.title, row.status, ...)
+  """
+  def load():
+    return _apply_filters(db.query(*SUMMARY_COLUMNS), filters).all()
+
+  return _cached(db, ("get_job_summaries", _filters_key(filters)), load)
+
+
+def get_job_summary_page(
+  db: Session,
+  filters: JobFilters
+) -> Tuple[List[Row], Optional[str]]:
+  """
+  Cursor-paginated get_job_summaries, for list views that page through
+  large result sets without counting or offsetting.
+
+  Returns:
+    (summary rows on this page, cursor for the next page or None)
+
+  Raises:
+    ValueError: if filters.cursor is invalid
+  """
+  if not filters.limit:
+    return get_job_summaries(db, filters), None
+
+  rows = get_job_summaries(db, filters.model_copy(update={"limit": filters.limit + 1}))
+  return _split_page(rows, filters)
+
+
+def get_status_board(
+  db: Session,
+  statuses: Sequence[str],
+  limit: int
+) -> Dict[str, BoardColumn]:
+  """
+  The newest limit summaries of each status in one UNION ALL query, each
+  branch an index range scan on (status, created_at, id), so the cost
+  depends on the number of columns and limit rather than on the jobs table.
+  Counts come from the stats rollup. Page further into a column with
+  get_job_summary_page(JobFilters(status=..., cursor=next_cursor)).
+
+  Returns:
+    {status: BoardColumn(count, first summaries, cursor for more or None)}
+  """
+  def load():
+    # One row past the limit tells whether the column has more
+    branches = [
+      _apply_filters(select(*SUMMARY_COLUMNS), JobFilters(status=status, limit=limit + 1)).subquery().select()
+      for status in statuses
+    ]
+    rows = {status: [] for status in statuses}
+    for row in db.execute(union_all(*branches)):
+      rows[row.status].append(row)
+    return rows
+
+  rows = _cached(db, ("get_status_board", tuple(statuses), limit), load)
+  counts = get_job_stats(db).by_status
+
+  board = {}
+  for status in statuses:
+    jobs, next_cursor = _split_page(rows[status], JobFilters(status=status, limit=limit))
+    board[status] = BoardColumn(counts.get(status, 0), jobs, next_cursor)
+  return board
+
+
+def get_distinct_values(db: Session, column_name: str) -> List[str]:
+  """
+  Returns:
+    Sorted distinct non-empty values of a Job column (e.g. source, job_type)
+  """
+  column = getattr(Job, column_name)
+
+  def load():
+    return sorted(value for value, in db.query(column).distinct().all() if value)
+
+  return _cached(db, ("distinct", column_name), load)
 
 
 def get_job_by_id(db: Session, job_id: str) -> Optional[Job]:
@@ -80,6 +704,21 @@ def get_job_by_id(db: Session, job_id: str) -> Optional[Job]:
   return db.query(Job).filter(Job.id == job_id).first()
 
 
+def _new_job(job_data: JobCreate, change_seq: int) -> Job:
+  """
+  Build a Job from validated input, parsing the salary text into columns.
+  """
+  return Job(**job_data.model_dump(), **parse_salary(job_data.salary), change_seq=change_seq)
+
+
+def _next_change_seq(db: Session) -> int:
+  """
+  Returns:
+    Change sequence number for the jobs written by the current transaction
+  """
+  return version_service.bump(db, Job.__tablename__)
+
+
 def create_job(db: Session, job_data: JobCreate) -> Optional[Job]:
   """
   Returns:
@@ -92,24 +731,150 @@ def create_job(db: Session, job_data: JobCreate) -> Optional[Job]:
     logger.debug(f"Job already exists: {job_data.title} at {job_data.company}")
     return None
   
+  for attempt in range(1, CREATE_ATTEMPTS + 1):
+    try:
+      # Create new job
+      new_job = _new_job(job_data, _next_change_seq(db))
+      db.add(new_job)
+      db.flush()
+      stats_service.record_jobs(db, [new_job])
+      event_service.record_created(db, [new_job])
+      db.commit()
+      query_cache.invalidate()
+      db.refresh(new_job)
+      logger.debug(f"Created job: {job_data.title} at {job_data.company}")
+      return new_job
+
+    except IntegrityError as e:
+      db.rollback()
+      # Only a clash on the URL means the job exists; other unique keys
+      # (rollup buckets, description hashes) lost a race with another insert
+      if db.query(Job.id).filter(Job.url == job_data.url).first() is not None:
+        logger.warning(f"Database integrity error (duplicate): {job_data.url}")
+        return None
+      if attempt == CREATE_ATTEMPTS:
+        logger.error(f"Error creating job: {e}")
+        raise
+      logger.warning(f"Concurrent insert while creating {job_data.url}, retrying: {e.orig}")
+    except Exception as e:
+      db.rollback()
+      logger.error(f"Error creating job: {e}")
+      raise
+
+
+def create_jobs(db: Session, jobs_data: List[JobCreate]) -> List[Job]:
+  """
+  Bulk ingest: inserts every job whose URL is not already stored, in a
+  single transaction.
+
+  Returns:
+    List of created Job objects (duplicates are skipped)
+  """
+  new_jobs, _ = _upsert(db, jobs_data, "skip")
+  return new_jobs
+
+
+def upsert_jobs(
+  db: Session,
+  jobs_data: List[JobCreate],
+  on_conflict: Literal["skip", "update"] = "skip"
+) -> List[Tuple[str, Optional[str]]]:
+  """
+  Bulk create-or-update keyed by URL, in a single transaction. Jobs whose
+  URL is already stored are left alone ("skip") or overwritten with the
+  new fields ("update"); repeats of a URL within the batch are skipped.
+
+  Returns:
+    One (outcome, job id) pair per input, in order. outcome is "created",
+    "updated" or "skipped"; the id is None for in-batch repeats.
+  """
+  _, results = _upsert(db, jobs_data, on_conflict)
+  return results
+
+
+def _upsert(
+  db: Session,
+  jobs_data: List[JobCreate],
+  on_conflict: str
+) -> Tuple[List[Job], List[Tuple[str, Optional[str]]]]:
+  """
+  Returns:
+    (created Job objects, per-input (outcome, job id) pairs)
+  """
+  # Drop duplicates within the batch itself, keeping the first occurrence
+  unique = {}
+  for job_data in jobs_data:
+    unique.setdefault(job_data.url, job_data)
+
+  if not unique:
+    return [], []
+
+  existing = {}
+  urls = list(unique)
+  for start in range(0, len(urls), BULK_CHUNK_SIZE):
+    chunk = urls[start:start + BULK_CHUNK_SIZE]
+    if on_conflict == "update":
+      existing.update((job.url, job) for job in db.query(Job).filter(Job.url.in_(chunk)).all())
+    else:
+      existing.update((url, job_id) for job_id, url in db.query(Job.id, Job.url).filter(Job.url.in_(chunk)).all())
+
   try:
-    # Create new job
-    new_job = Job(**job_data.model_dump())
-    db.add(new_job)
+    changes = len(unique) > len(existing) or (on_conflict == "update" and existing)
+    change_seq = _next_change_seq(db) if changes else None
+
+    outcomes = {}
+    new_jobs = []
+    # Rollup changes of the whole batch, applied in one pass
+    deltas = Counter()
+    for url, job_data in unique.items():
+      job = existing.get(url)
+      if job is None:
+        job = _new_job(job_data, change_seq)
+        new_jobs.append(job)
+        outcomes[url] = ("created", job)
+      elif on_conflict == "update":
+        old_key = stats_service.job_key(job)
+        for field, value in job_data.model_dump().items():
+          setattr(job, field, value)
+        for field, value in parse_salary(job_data.salary).items():
+          setattr(job, field, value)
+        job.change_seq = change_seq
+        deltas[old_key] -= 1
+        deltas[stats_service.job_key(job)] += 1
+        outcomes[url] = ("updated", job)
+      else:
+        outcomes[url] = ("skipped", None)
+
+    db.add_all(new_jobs)
+    db.flush()
+    for job in new_jobs:
+      deltas[stats_service.job_key(job)] += 1
+    stats_service.apply_deltas(db, deltas)
+    event_service.record_created(db, new_jobs)
+
+    # Read ids before commit expires the instances
+    results = []
+    reported = set()
+    for job_data in jobs_data:
+      url = job_data.url
+      if url in reported:
+        results.append(("skipped", None))
+        continue
+      reported.add(url)
+      outcome, job = outcomes[url]
+      results.append((outcome, job.id if job is not None else existing[url]))
+
     db.commit()
-    db.refresh(new_job)
-    logger.debug(f"Created job: {job_data.title} at {job_data.company}")
-    return new_job
-  
-  except IntegrityError as e:
-    db.rollback()
-    logger.warning(f"Database integrity error (likely duplicate): {job_data.url}")
-    return None
+    query_cache.invalidate()
+    logger.debug(f"Bulk upserted {len(new_jobs)} new jobs ({len(existing)} already stored, on_conflict={on_conflict})")
+
   except Exception as e:
     db.rollback()
-    logger.error(f"Error creating job: {e}")
+    logger.error(f"Error bulk creating jobs: {e}")
     raise
 
+  return new_jobs, results
+
 
 def update_job(
   db: Session,
@@ -127,13 +892,23 @@ def update_job(
     return None
   
   try:
+    old_key = stats_service.job_key(job)
+    old_status = job.status
+
     # Update only provided fields
     update_data = job_data.model_dump(exclude_unset=True)
     
+    if "salary" in update_data:
+      update_data.update(parse_salary(update_data["salary"]))
+
     for field, value in update_data.items():
       setattr(job, field, value)
+    job.change_seq = _next_change_seq(db)
     
+    stats_service.move_job(db, old_key, stats_service.job_key(job))
+    event_service.record_status_changes(db, [(job.id, job.source, job.created_at, old_status, job.status)])
     db.commit()
+    query_cache.invalidate()
     db.refresh(job)
     logger.info(f"Updated job: {job.title}")
     return job
@@ -156,8 +931,11 @@ def delete_job(db: Session, job_id: str) -> bool:
     return False
   
   try:
+    stats_service.record_jobs(db, [job], delta=-1)
     db.delete(job)
+    db.add(JobTombstone(job_id=job.id, change_seq=_next_change_seq(db)))
     db.commit()
+    query_cache.invalidate()
     logger.info(f"Deleted job: {job.title}")
     return True
   
@@ -167,49 +945,47 @@ def delete_job(db: Session, job_id: str) -> bool:
     raise
 
 
-def get_job_stats(db: Session) -> JobStats:
+def get_funnel_metrics(db: Session) -> FunnelMetrics:
   """
+  Reads the precomputed funnel aggregates maintained from the status event log.
+
   Returns:
-    JobStats object with counts and breakdowns
+    FunnelMetrics with per-stage counts, conversion rates and timings
   """
-  total = db.query(Job).count()
-  
-  # Group by status
-  by_status = db.query(
-    Job.status,
-    func.count(Job.id)
-  ).group_by(Job.status).all()
-  
-  # Group by source
-  by_source = db.query(
-    Job.source,
-    func.count(Job.id)
-  ).group_by(Job.source).all()
-
-  # Group by job type
-  by_job_type = db.query(
-    Job.job_type, 
-    func.count(Job.id)
-  ).group_by(Job.job_type).all()
-  
-  # Recent jobs (last 7 days)
-  recent_7days = db.query(Job).filter(
-    Job.created_at >= datetime.now() - timedelta(days=7)
-  ).count()
+  return _cached(
+    db,
+    ("get_funnel_metrics",),
+    lambda: event_service.get_funnel_metrics(db)
+  )
 
-  # Recent jobs (last 30 days)
-  recent_30days = db.query(Job).filter(
-    Job.created_at >= datetime.now() - timedelta(days=30)
-  ).count()
 
-  
-  return JobStats(
-    total=total,
-    by_status=dict(by_status),
-    by_source=dict(by_source),
-    by_job_type=dict(by_job_type),
-    recent_7days=recent_7days,
-    recent_30days=recent_30days,
+def get_daily_activity(db: Session, since: date) -> List[Row]:
+  """
+  Reads the daily activity rollup maintained from the status event log,
+  so the cost grows with the number of days, not jobs.
+
+  Returns:
+    Rows of (day, source, status, created, changed) from since on, oldest first
+  """
+  return _cached(
+    db,
+    ("get_daily_activity", since),
+    lambda: event_service.get_daily_activity(db, since)
+  )
+
+
+def get_job_stats(db: Session) -> JobStats:
+  """
+  Reads stats from the incrementally maintained rollup table
+  (see stats_service), so the cost does not grow with the jobs table.
+
+  Returns:
+    JobStats object with counts and breakdowns
+  """
+  return _cached(
+    db,
+    ("get_job_stats",),
+    lambda: stats_service.read_job_stats(db)
   )
 
 
@@ -235,22 +1011,110 @@ def bulk_update_status(
   new_status: str
 ) -> int:
   """
-  Update status for multiple jobs at once.
+  Update status for multiple jobs at once, in one transaction. Ids are
+  processed in chunks to stay under SQLite's bound-parameter limit.
  
   Returns:
-    Number of jobs updated
+    Number of jobs whose status changed
   """
+  job_ids = list(dict.fromkeys(job_ids))
+  chunks = [job_ids[start:start + BULK_CHUNK_SIZE] for start in range(0, len(job_ids), BULK_CHUNK_SIZE)]
+
   try:
-    count = db.query(Job).filter(
-      Job.id.in_(job_ids)
-    ).update(
-      {Job.status: new_status},
-      synchronize_session=False
-    )
+    # Jobs actually changing status, for the stats rollup and the event log
+    changing = []
+    for chunk in chunks:
+      changing.extend(db.query(
+        Job.id, Job.status, Job.source, Job.job_type, Job.created_at
+      ).filter(
+        Job.id.in_(chunk),
+        or_(Job.status != new_status, Job.status.is_(None))
+      ).all())
+
+    deltas = Counter()
+    for row in changing:
+      key = stats_service.job_key(row)
+      _, source, job_type, day = key
+      deltas[key] -= 1
+      deltas[(new_status, source, job_type, day)] += 1
+    stats_service.apply_deltas(db, deltas)
+
+    event_service.record_status_changes(db, [
+      (row.id, row.source, row.created_at, row.status, new_status)
+      for row in changing
+    ])
+
+    # Only touch rows whose status changes, so the change feed stays O(changes)
+    changing_ids = [row.id for row in changing]
+    count = 0
+    if changing_ids:
+      change_seq = _next_change_seq(db)
+      for start in range(0, len(changing_ids), BULK_CHUNK_SIZE):
+        count += db.query(Job).filter(
+          Job.id.in_(changing_ids[start:start + BULK_CHUNK_SIZE])
+        ).update(
+          {Job.status: new_status, Job.change_seq: change_seq},
+          synchronize_session=False
+        )
     db.commit()
+    query_cache.invalidate()
     logger.info(f"Bulk updated {count} jobs to status: {new_status}")
     return count
   except Exception as e:
     db.rollback()
     logger.error(f"Error in bulk update: {e}")
     raise
+
+
+def backfill_salaries(db: Session, batch_size: int = BULK_CHUNK_SIZE) -> int:
+  """
+  Parse the salary text of existing jobs into the structured salary columns.
+  Walks the table in primary-key order and commits once per batch. Only jobs
+  whose parsed values differ from the stored ones are written, so re-running
+  it does not touch change_seq or updated_at.
+
+  Returns:
+    Number of jobs with a parsed salary
+  """
+  parsed_count = 0
+  updated_count = 0
+  last_id = ""
+
+  while True:
+    rows = db.query(
+      Job.id, Job.salary, Job.salary_min, Job.salary_max, Job.salary_currency, Job.salary_period
+    ).filter(
+      Job.id > last_id,
+      Job.salary.isnot(None)
+    ).order_by(Job.id).limit(batch_size).all()
+
+    if not rows:
+      break
+
+    try:
+      mappings = []
+      for row in rows:
+        parsed = parse_salary(row.salary)
+        if parsed["salary_min"] is not None or parsed["salary_max"] is not None:
+          parsed_count += 1
+        if any(getattr(row, field) != value for field, value in parsed.items()):
+          mappings.append({"id": row.id, **parsed})
+
+      if mappings:
+        change_seq = _next_change_seq(db)
+        for mapping in mappings:
+          mapping["change_seq"] = change_seq
+        db.execute(update(Job), mappings)
+        db.commit()
+        updated_count += len(mappings)
+    except Exception as e:
+      db.rollback()
+      logger.error(f"Error backfilling salaries: {e}")
+      raise
+
+    last_id = rows[-1][0]
+
+  if updated_count:
+    query_cache.invalidate()
+  logger.info(f"Backfilled structured salary for {parsed_count} jobs ({updated_count} changed)")
+  return parsed_count
@@ -0,0 +1,159 @@
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import List, Optional
+from app.db.session import SessionLocal
+from app.schemas.scrapes import ScrapeRun, ScrapeSourceProgress
+from app.scrappers.engine import ScraperEngine
+from app.scrappers.registry import SCRAPER_CLASSES
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Concurrent scrape runs; each run scrapes its sources one after another
+MAX_WORKERS = int(os.getenv("SCRAPE_WORKERS", "2"))
+
+# Finished runs kept for polling before the oldest are dropped
+MAX_RUNS = 50
+
+_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="scrape")
+_runs = OrderedDict()
+_lock = threading.Lock()
+
+
+def _now() -> datetime:
+  return datetime.now(timezone.utc)
+
+
+def _update(run_id: str, **fields) -> None:
+  with _lock:
+    run = _runs[run_id]
+    for field, value in fields.items():
+      setattr(run, field, value)
+    run.version += 1
+
+
+def _update_source(run_id: str, index: int, **fields) -> None:
+  with _lock:
+    run = _runs[run_id]
+    source = run.sources[index]
+    for field, value in fields.items():
+      setattr(source, field, value)
+    run.total_saved = sum(item.saved for item in run.sources)
+    run.version += 1
+
+
+def _prune() -> None:
+  """Drop the oldest finished runs beyond MAX_RUNS. Call with _lock held."""
+  finished = [run_id for run_id, run in _runs.items() if run.finished]
+  for run_id in finished[:max(len(_runs) - MAX_RUNS, 0)]:
+    del _runs[run_id]
+
+
+def _fail_unfinished(run_id: str, error: str) -> None:
+  """Mark the sources a failed run never finished as failed too."""
+  with _lock:
+    run = _runs[run_id]
+    for source in run.sources:
+      if source.status not in ("done", "failed"):
+        source.status = "failed"
+        source.error = error
+        source.finished_at = _now()
+    run.version += 1
+
+
+def _execute(run_id: str, sources: List[str]) -> None:
+  failures = 0
+  status = "failed"
+  error = None
+  db = None
+
+  try:
+    _update(run_id, status="running", started_at=_now())
+    db = SessionLocal()
+
+    for index, name in enumerate(sources):
+      _update_source(run_id, index, status="scraping", started_at=_now())
+
+      def on_progress(_source_name, stage, counts, index=index):
+        _update_source(run_id, index, status=stage, **counts)
+
+      try:
+        ScraperEngine(db, on_progress=on_progress).run_scraper(SCRAPER_CLASSES[name]())
+        _update_source(run_id, index, status="done", finished_at=_now())
+      except Exception as e:
+        failures += 1
+        db.rollback()
+        logger.error(f"Scrape run {run_id}: {name} failed: {e}")
+        _update_source(run_id, index, status="failed", error=str(e), finished_at=_now())
+
+    status = "failed" if failures == len(sources) else "done"
+
+  except Exception as e:
+    error = str(e)
+    logger.error(f"Scrape run {run_id} failed: {e}")
+    _fail_unfinished(run_id, error)
+
+  finally:
+    # Whatever failed above, never leave the run "running"
+    try:
+      if db is not None:
+        db.close()
+    finally:
+      _update(run_id, status=status, error=error, finished_at=_now())
+      logger.info(f"Scrape run {run_id} finished: {status}")
+
+
+def start_run(sources: Optional[List[str]] = None) -> ScrapeRun:
+  """
+  Queue a scrape of the given sources (all registered sources by default)
+  on the background worker pool.
+
+  Returns:
+    Snapshot of the queued run
+
+  Raises:
+    ValueError: if a source name is unknown
+  """
+  names = [name.lower() for name in sources] if sources else list(SCRAPER_CLASSES)
+  unknown = [name for name in names if name not in SCRAPER_CLASSES]
+  if unknown:
+    raise ValueError(f"Unknown sources: {', '.join(unknown)}")
+  names = list(dict.fromkeys(names))
+
+  run = ScrapeRun(
+    id=str(uuid.uuid4()),
+    sources=[ScrapeSourceProgress(source=name) for name in names],
+    created_at=_now(),
+  )
+
+  with _lock:
+    _runs[run.id] = run
+    _prune()
+    snapshot = run.model_copy(deep=True)
+
+  _executor.submit(_execute, run.id, names)
+  logger.info(f"Queued scrape run {run.id}: {', '.join(names)}")
+  return snapshot
+
+
+def get_run(run_id: str) -> Optional[ScrapeRun]:
+  """
+  Returns:
+    Snapshot of the run's current progress, or None if unknown
+  """
+  with _lock:
+    run = _runs.get(run_id)
+    return run.model_copy(deep=True) if run else None
+
+
+def list_runs() -> List[ScrapeRun]:
+  """
+  Returns:
+    Snapshots of the tracked runs, newest first
+  """
+  with _lock:
+    return [run.model_copy(deep=True) for run in reversed(_runs.values())]
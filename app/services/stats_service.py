@@ -0,0 +1,222 @@
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
+from typing import Iterable, Optional, Tuple
+from sqlalchemy.orm import Session
+from sqlalchemy import func, case, insert, update, bindparam
+from app.models.job import Job
+from app.models.stats import JobStatCounter
+from app.schemas.jobs import JobStats
+from app.utils.cache import query_cache
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_STATUS = "saved"
+
+# Keeps IN (...) lists under SQLite's bound-parameter limit
+CHUNK_SIZE = 500
+
+StatKey = Tuple[str, str, str, date]
+
+
+def as_date(value) -> date:
+  """Normalize a datetime, date or 'YYYY-MM-DD...' string to a date."""
+  if isinstance(value, datetime):
+    return value.date()
+  if isinstance(value, date):
+    return value
+  if isinstance(value, str):
+    return date.fromisoformat(value[:10])
+  return datetime.now(timezone.utc).date()
+
+
+def job_key(job: Job) -> StatKey:
+  """
+  Returns:
+    The rollup bucket a job is counted in
+  """
+  return (
+    job.status or DEFAULT_STATUS,
+    job.source,
+    job.job_type,
+    as_date(job.created_at),
+  )
+
+
+def apply_deltas(db: Session, deltas: Counter) -> None:
+  """
+  Add the given per-bucket deltas to the rollup table: one lookup of the
+  existing buckets, then an executemany each for increments and new rows.
+
+  Does not commit; callers apply deltas inside the transaction that
+  changed the jobs so counters and rows can never drift apart.
+  """
+  deltas = {key: delta for key, delta in deltas.items() if delta}
+  if not deltas:
+    return
+
+  days = list({day for _, _, _, day in deltas})
+  existing = set()
+  for start in range(0, len(days), CHUNK_SIZE):
+    existing.update(db.query(
+      JobStatCounter.status,
+      JobStatCounter.source,
+      JobStatCounter.job_type,
+      JobStatCounter.day,
+    ).filter(JobStatCounter.day.in_(days[start:start + CHUNK_SIZE])).all())
+
+  increments = [
+    {"b_status": status, "b_source": source, "b_job_type": job_type, "b_day": day, "b_delta": delta}
+    for (status, source, job_type, day), delta in deltas.items()
+    if (status, source, job_type, day) in existing
+  ]
+  if increments:
+    # Table-level update: an executemany of relative increments
+    counters = JobStatCounter.__table__
+    db.execute(
+      update(counters).where(
+        counters.c.status == bindparam("b_status"),
+        counters.c.source == bindparam("b_source"),
+        counters.c.job_type == bindparam("b_job_type"),
+        counters.c.day == bindparam("b_day"),
+      ).values(count=counters.c.count + bindparam("b_delta")),
+      increments
+    )
+
+  new_buckets = [
+    {"status": status, "source": source, "job_type": job_type, "day": day, "count": delta}
+    for (status, source, job_type, day), delta in deltas.items()
+    if (status, source, job_type, day) not in existing
+  ]
+  if new_buckets:
+    db.execute(insert(JobStatCounter), new_buckets)
+
+
+def record_jobs(db: Session, jobs: Iterable[Job], delta: int = 1) -> None:
+  """
+  Count (or uncount, with delta=-1) jobs in the rollup table.
+  """
+  deltas = Counter()
+  for job in jobs:
+    deltas[job_key(job)] += delta
+  apply_deltas(db, deltas)
+
+
+def move_job(db: Session, old_key: StatKey, new_key: StatKey) -> None:
+  """
+  Move one job between rollup buckets after its status, source or type changed.
+  """
+  if old_key == new_key:
+    return
+  apply_deltas(db, Counter({old_key: -1, new_key: 1}))
+
+
+def read_job_stats(db: Session) -> JobStats:
+  """
+  Builds JobStats from the rollup table. Cost depends on the number of
+  distinct (status, source, job_type, day) buckets, not on the number of jobs.
+
+  Returns:
+    JobStats object with counts and breakdowns
+  """
+  today = datetime.now(timezone.utc).date()
+  week_ago = today - timedelta(days=7)
+  month_ago = today - timedelta(days=30)
+
+  rows = db.query(
+    JobStatCounter.status,
+    JobStatCounter.source,
+    JobStatCounter.job_type,
+    func.sum(JobStatCounter.count),
+    func.sum(case((JobStatCounter.day >= week_ago, JobStatCounter.count), else_=0)),
+    func.sum(case((JobStatCounter.day >= month_ago, JobStatCounter.count), else_=0)),
+  ).group_by(
+    JobStatCounter.status,
+    JobStatCounter.source,
+    JobStatCounter.job_type,
+  ).all()
+
+  total = 0
+  recent_7days = 0
+  recent_30days = 0
+  by_status = {}
+  by_source = {}
+  by_job_type = {}
+
+  for status, source, job_type, count, week_count, month_count in rows:
+    if not count:
+      continue
+    total += count
+    recent_7days += week_count or 0
+    recent_30days += month_count or 0
+    by_status[status] = by_status.get(status, 0) + count
+    by_source[source] = by_source.get(source, 0) + count
+    by_job_type[job_type] = by_job_type.get(job_type, 0) + count
+
+  return JobStats(
+    total=total,
+    by_status=by_status,
+    by_source=by_source,
+    by_job_type=by_job_type,
+    recent_7days=recent_7days,
+    recent_30days=recent_30days,
+  )
+
+
+def rebuild_stats(db: Session) -> int:
+  """
+  Recompute the rollup table from scratch with one grouped scan of jobs.
+
+  Returns:
+    Number of rollup buckets written
+  """
+  try:
+    db.query(JobStatCounter).delete(synchronize_session=False)
+
+    rows = db.query(
+      func.coalesce(Job.status, DEFAULT_STATUS),
+      Job.source,
+      Job.job_type,
+      func.date(Job.created_at),
+      func.count(Job.id),
+    ).group_by(
+      func.coalesce(Job.status, DEFAULT_STATUS),
+      Job.source,
+      Job.job_type,
+      func.date(Job.created_at),
+    ).all()
+
+    db.add_all([
+      JobStatCounter(
+        status=status,
+        source=source,
+        job_type=job_type,
+        day=as_date(day),
+        count=count,
+      )
+      for status, source, job_type, day, count in rows
+    ])
+    db.commit()
+    query_cache.invalidate()
+    logger.info(f"Rebuilt job stats rollup: {len(rows)} buckets")
+    return len(rows)
+
+  except Exception as e:
+    db.rollback()
+    logger.error(f"Error rebuilding job stats: {e}")
+    raise
+
+
+def ensure_stats(db: Session) -> Optional[int]:
+  """
+  Seed the rollup table for databases that predate it.
+
+  Returns:
+    Number of buckets written, or None if no rebuild was needed
+  """
+  has_counters = db.query(JobStatCounter.status).first() is not None
+  has_jobs = db.query(Job.id).first() is not None
+
+  if has_jobs and not has_counters:
+    return rebuild_stats(db)
+  return None
@@ -0,0 +1,71 @@
+from datetime import datetime, timezone
+from typing import Optional, Tuple
+from sqlalchemy import event
+from sqlalchemy.orm import Session, SessionTransaction
+from app.models.versions import TableVersion
+
+# Session.info key of the versions read in the current transaction
+READ_VERSIONS = "table_versions"
+
+
+def bump(db: Session, table_name: str) -> int:
+  """
+  Record a change to table_name. The counter row stays locked until the
+  transaction ends, so versions are handed out in commit order.
+
+  Does not commit; callers bump inside the transaction that made the change.
+
+  Returns:
+    The new version, usable as a change sequence number
+  """
+  db.info.get(READ_VERSIONS, {}).pop(table_name, None)
+  now = datetime.now(timezone.utc)
+  updated = db.query(TableVersion).filter(
+    TableVersion.table_name == table_name
+  ).update(
+    {TableVersion.version: TableVersion.version + 1, TableVersion.updated_at: now},
+    synchronize_session=False
+  )
+
+  if not updated:
+    db.add(TableVersion(table_name=table_name, version=1, updated_at=now))
+    db.flush()
+    return 1
+
+  return db.query(TableVersion.version).filter(
+    TableVersion.table_name == table_name
+  ).scalar()
+
+
+def get_version(db: Session, table_name: str) -> Tuple[int, Optional[datetime]]:
+  """
+  Read once per transaction, so validators (ETags) and cached results built
+  in one request agree on the version; the next transaction reads it again.
+
+  Returns:
+    (version, last change time in UTC); (0, None) if never changed
+  """
+  read = db.info.setdefault(READ_VERSIONS, {})
+  if table_name in read:
+    return read[table_name]
+
+  row = db.query(TableVersion.version, TableVersion.updated_at).filter(
+    TableVersion.table_name == table_name
+  ).first()
+
+  if row is None:
+    read[table_name] = (0, None)
+    return read[table_name]
+
+  version, updated_at = row
+  # SQLite returns naive datetimes; they are stored as UTC
+  if updated_at is not None and updated_at.tzinfo is None:
+    updated_at = updated_at.replace(tzinfo=timezone.utc)
+  read[table_name] = (version, updated_at)
+  return read[table_name]
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _forget_versions(session: Session, transaction: SessionTransaction) -> None:
+  # Other processes may write between transactions
+  session.info.pop(READ_VERSIONS, None)
@@ -0,0 +1,125 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+from app.utils.metrics import registry
+
+
+def _rows(value: Any) -> int:
+  """Size of a cached value in result rows; scalars and models count as one."""
+  return len(value) if isinstance(value, (list, tuple, dict)) else 1
+
+
+class QueryCache:
+  """
+  Bounded, thread-safe LRU cache for service-layer query results.
+
+  Entries expire after `ttl` seconds. Each entry is stored with the data
+  version it was loaded at (callers pass the database table version, which
+  every write bumps), and a lookup at another version is a miss, so writes
+  from other processes are seen on the next read. In-process writes also
+  call `invalidate()`, which drops every entry; results computed by a
+  loader that started before the bump are never stored, so a read racing
+  a write cannot repopulate the cache with stale data.
+
+  Size is bounded by entry count and by the total number of result rows
+  held; results larger than `max_entry_rows` are returned but not stored.
+  """
+
+  def __init__(
+    self,
+    max_entries: int = 256,
+    ttl: float = 30.0,
+    max_rows: int = 50_000,
+    max_entry_rows: int = 5_000
+  ):
+    self.max_entries = max_entries
+    self.ttl = ttl
+    self.max_rows = max_rows
+    self.max_entry_rows = max_entry_rows
+    self.version = 0
+    self.rows = 0
+    self.hits = 0
+    self.misses = 0
+    self.evictions = 0
+    self._entries = OrderedDict()
+    self._lock = threading.Lock()
+
+  def _drop(self, key: Hashable) -> None:
+    entry = self._entries.pop(key)
+    self.rows -= entry[2]
+
+  def get_or_load(self, key: Hashable, loader: Callable[[], Any], data_version: Hashable = None) -> Any:
+    """
+    Return the value cached for key at data_version, calling loader() on a miss.
+    """
+    now = time.monotonic()
+
+    with self._lock:
+      entry = self._entries.get(key)
+      if entry is not None:
+        expires_at, entry_version, _, value = entry
+        if expires_at > now and entry_version == data_version:
+          self._entries.move_to_end(key)
+          self.hits += 1
+          return value
+        self._drop(key)
+
+      self.misses += 1
+      version = self.version
+
+    value = loader()
+    rows = _rows(value)
+
+    with self._lock:
+      if version == self.version and rows <= self.max_entry_rows:
+        if key in self._entries:
+          self._drop(key)
+        self._entries[key] = (time.monotonic() + self.ttl, data_version, rows, value)
+        self.rows += rows
+        while len(self._entries) > self.max_entries or self.rows > self.max_rows:
+          self._drop(next(iter(self._entries)))
+          self.evictions += 1
+
+    return value
+
+  def invalidate(self):
+    """Bump the version and drop all cached results."""
+    with self._lock:
+      self.version += 1
+      self.rows = 0
+      self._entries.clear()
+
+  def stats(self) -> dict:
+    """
+    Returns:
+      Hit/miss counters and current size
+    """
+    with self._lock:
+      lookups = self.hits + self.misses
+      return {
+        "hits": self.hits,
+        "misses": self.misses,
+        "evictions": self.evictions,
+        "size": len(self._entries),
+        "rows": self.rows,
+        "version": self.version,
+        "hit_rate": self.hits / lookups if lookups else 0.0,
+      }
+
+
+# Shared by the service layer; entries are checked against the jobs table
+# version and writes anywhere in the process invalidate it
+query_cache = QueryCache()
+
+
+def _cache_samples(field: str):
+  return lambda: [({}, query_cache.stats()[field])]
+
+
+registry.counter("jobtrail_query_cache_hits_total", "Query cache hits", collect=_cache_samples("hits"))
+registry.counter("jobtrail_query_cache_misses_total", "Query cache misses", collect=_cache_samples("misses"))
+registry.counter("jobtrail_query_cache_evictions_total", "Query cache LRU evictions", collect=_cache_samples("evictions"))
+registry.gauge("jobtrail_query_cache_entries", "Entries currently cached", collect=_cache_samples("size"))
+registry.gauge("jobtrail_query_cache_rows", "Result rows currently cached", collect=_cache_samples("rows"))
+registry.gauge("jobtrail_query_cache_hit_ratio", "Hits over lookups since start", collect=_cache_samples("hit_rate"))
@@ -0,0 +1,162 @@
+import re
+import zlib
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+try:
+  import zstandard
+except ImportError:
+  zstandard = None
+
+ZSTD_LEVEL = 10
+ZLIB_LEVEL = 9
+
+# zlib can only reference the last 32KB of a preset dictionary
+ZLIB_MAX_DICT_SIZE = 32 * 1024
+ZSTD_DICT_SIZE = 112 * 1024
+
+# Splits descriptions (plain text or HTML) into reusable fragments
+FRAGMENT_RE = re.compile(r"[\r\n]+|(?<=</p>)|(?<=</li>)|(?<=<br>)|(?<=<br/>)|(?<=\. )")
+
+# Compiled zstd dictionaries by dictionary id
+_zstd_dicts: Dict[int, "zstandard.ZstdCompressionDict"] = {}
+
+
+def preferred_codec() -> str:
+  """
+  Returns:
+    "zstd" when the optional zstandard package is installed, else "zlib"
+  """
+  return "zstd" if zstandard is not None else "zlib"
+
+
+def _zstd_dict(dictionary: bytes, dictionary_id: Optional[int]):
+  if dictionary_id is None:
+    return zstandard.ZstdCompressionDict(dictionary)
+
+  compiled = _zstd_dicts.get(dictionary_id)
+  if compiled is None:
+    compiled = zstandard.ZstdCompressionDict(dictionary)
+    _zstd_dicts[dictionary_id] = compiled
+  return compiled
+
+
+def compress(
+  text: str,
+  codec: str,
+  dictionary: Optional[bytes] = None,
+  dictionary_id: Optional[int] = None
+) -> Tuple[str, bytes]:
+  """
+  Compress text with the given codec and optional shared dictionary.
+  Falls back to storing raw bytes when compression does not help.
+
+  Returns:
+    (codec actually used, payload)
+  """
+  raw = text.encode("utf-8")
+
+  if codec == "zstd":
+    if dictionary:
+      compressor = zstandard.ZstdCompressor(
+        level=ZSTD_LEVEL,
+        dict_data=_zstd_dict(dictionary, dictionary_id)
+      )
+    else:
+      compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL)
+    payload = compressor.compress(raw)
+  elif codec == "zlib":
+    if dictionary:
+      compressor = zlib.compressobj(ZLIB_LEVEL, zdict=dictionary)
+    else:
+      compressor = zlib.compressobj(ZLIB_LEVEL)
+    payload = compressor.compress(raw) + compressor.flush()
+  else:
+    raise ValueError(f"Unknown codec: {codec}")
+
+  if len(payload) >= len(raw):
+    return "raw", raw
+  return codec, payload
+
+
+def decompress(
+  payload: bytes,
+  codec: str,
+  dictionary: Optional[bytes] = None,
+  dictionary_id: Optional[int] = None
+) -> str:
+  """
+  Returns:
+    The original text
+  """
+  if codec == "raw":
+    raw = payload
+  elif codec == "zstd":
+    if zstandard is None:
+      raise RuntimeError("zstandard is required to read zstd-compressed data: pip install zstandard")
+    if dictionary:
+      decompressor = zstandard.ZstdDecompressor(dict_data=_zstd_dict(dictionary, dictionary_id))
+    else:
+      decompressor = zstandard.ZstdDecompressor()
+    raw = decompressor.decompress(payload)
+  elif codec == "zlib":
+    if dictionary:
+      decompressor = zlib.decompressobj(zdict=dictionary)
+    else:
+      decompressor = zlib.decompressobj()
+    raw = decompressor.decompress(payload) + decompressor.flush()
+  else:
+    raise ValueError(f"Unknown codec: {codec}")
+
+  return raw.decode("utf-8")
+
+
+def _zlib_dictionary(samples: List[str], size: int) -> bytes:
+  """
+  Build a zlib preset dictionary from fragments shared by several samples.
+  zlib favours matches near the end of the dictionary, so the most
+  common fragments are placed last.
+  """
+  counts = Counter()
+  for sample in samples:
+    fragments = (fragment.strip() for fragment in FRAGMENT_RE.split(sample))
+    counts.update(set(fragment for fragment in fragments if len(fragment) > 20))
+
+  shared = [(fragment, count) for fragment, count in counts.items() if count > 1]
+  shared.sort(key=lambda item: item[1] * len(item[0]), reverse=True)
+
+  chosen = []
+  total = 0
+  for fragment, _ in shared:
+    encoded = fragment.encode("utf-8") + b"\n"
+    if total + len(encoded) > size:
+      continue
+    chosen.append(encoded)
+    total += len(encoded)
+
+  return b"".join(reversed(chosen))
+
+
+def train_dictionary(samples: List[str], codec: str, size: Optional[int] = None) -> Optional[bytes]:
+  """
+  Train a shared compression dictionary on a sample of documents.
+
+  Returns:
+    Dictionary bytes, or None if the samples are too few or too uniform
+  """
+  if codec == "zstd":
+    try:
+      trained = zstandard.train_dictionary(
+        size or ZSTD_DICT_SIZE,
+        [sample.encode("utf-8") for sample in samples]
+      )
+      return trained.as_bytes()
+    except zstandard.ZstdError as e:
+      logger.warning(f"Could not train zstd dictionary: {e}")
+      return None
+
+  dictionary = _zlib_dictionary(samples, min(size or ZLIB_MAX_DICT_SIZE, ZLIB_MAX_DICT_SIZE))
+  return dictionary or None
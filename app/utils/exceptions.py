@@ -44,3 +44,8 @@ class AuthenticationException(JobTrailException):
 class NotFoundException(JobTrailException):
   """Raised when a resource is not found."""
   pass
+
+
+class QueryBudgetExceeded(DatabaseException):
+  """Raised in strict mode when a request or rerun runs more queries than its budget."""
+  pass
@@ -1,46 +1,479 @@
 import csv
+import gzip
+import io
 import json
+from datetime import date, datetime
 from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, TextIO, Tuple
+from app.utils.serialization import dumps, loads
 
-def export_csv(jobs, path: Path):
-  with open(path, mode="w", newline="", encoding="utf-8") as f:
-    writer = csv.writer(f)
-
-    # Header
-    writer.writerow([
-      "id",
-      "title",
-      "company",
-      "job_type",
-      "source",
-      "url",
-    ])
-
-    # Rows
-    for job in jobs:
-      writer.writerow([
-          job.id,
-          job.title,
-          job.company,
-          job.job_type,
-          job.source,
-          job.url,
-      ])
-
-
-def export_json(jobs, path: Path):
-  data = [
-    {
-      "id": job.id,
-      "title": job.title,
-      "company": job.company,
-      "location": job.location,
-      "job_type": job.job_type,
-      "source": job.source,
-      "url": job.url,
+try:
+  import zstandard
+except ImportError:
+  zstandard = None
+
+try:
+  import pyarrow
+  import pyarrow.ipc
+  import pyarrow.parquet
+except ImportError:
+  pyarrow = None
+
+TEXT_FORMATS = ["csv", "json", "ndjson"]
+COLUMNAR_FORMATS = ["parquet", "arrow"]
+FORMATS = TEXT_FORMATS + COLUMNAR_FORMATS
+COMPRESSIONS = ["none", "gzip", "zstd"]
+
+# Codecs each columnar format can apply inside the file
+COLUMNAR_COMPRESSIONS = {
+  "parquet": ["none", "gzip", "zstd"],
+  "arrow": ["none", "zstd"],
+}
+
+# Rows buffered into each Parquet row group
+ROW_GROUP_SIZE = 64 * 1024
+
+# Characters read at a time when parsing a JSON array incrementally
+JSON_READ_SIZE = 64 * 1024
+
+COMPRESSION_SUFFIXES = {
+  "none": "",
+  "gzip": ".gz",
+  "zstd": ".zst",
+}
+
+Batches = Iterable[List[Dict[str, Any]]]
+
+
+def output_path(directory: Path, name: str, format: str, compression: str = "none") -> Path:
+  """
+  Returns:
+    directory / name.format plus the compression suffix, e.g. exports/jobs.csv.gz.
+    Columnar formats compress inside the file and get no suffix.
+  """
+  suffix = "" if format in COLUMNAR_FORMATS else COMPRESSION_SUFFIXES[compression]
+  return directory / f"{name}.{format}{suffix}"
+
+
+def check_format(format: str, compression: str = "none") -> None:
+  """
+  Raises:
+    ValueError: if the format or the compression is unsupported for it
+    RuntimeError: if the optional library the format needs is not installed
+  """
+  if format not in FORMATS:
+    raise ValueError(f"Unsupported format: {format}")
+  if compression not in COMPRESSIONS:
+    raise ValueError(f"Unsupported compression: {compression}")
+
+  if format in COLUMNAR_FORMATS:
+    if pyarrow is None:
+      raise RuntimeError(f"pyarrow is required for {format} exports: pip install pyarrow")
+    if compression not in COLUMNAR_COMPRESSIONS[format]:
+      supported = ", ".join(COLUMNAR_COMPRESSIONS[format])
+      raise ValueError(f"{format} exports support compression: {supported}")
+  elif compression == "zstd" and zstandard is None:
+    raise RuntimeError("zstandard is required for zstd exports: pip install zstandard")
+
+
+def open_output(path: Path, compression: str = "none") -> TextIO:
+  """
+  Open path for writing text, compressing on the fly.
+
+  Raises:
+    RuntimeError: if zstd is requested but zstandard is not installed
+  """
+  if compression == "gzip":
+    return gzip.open(path, "wt", encoding="utf-8", newline="")
+
+  if compression == "zstd":
+    if zstandard is None:
+      raise RuntimeError("zstandard is required for zstd exports: pip install zstandard")
+    writer = zstandard.ZstdCompressor().stream_writer(open(path, "wb"))
+    return io.TextIOWrapper(writer, encoding="utf-8", newline="")
+
+  if compression == "none":
+    return open(path, "w", encoding="utf-8", newline="")
+
+  raise ValueError(f"Unknown compression: {compression}")
+
+
+def _csv_value(value: Any) -> Any:
+  if isinstance(value, (datetime, date)):
+    return value.isoformat()
+  return "" if value is None else value
+
+
+def write_csv(batches: Batches, stream: TextIO, fields: Sequence[str]) -> int:
+  """
+  Returns:
+    Number of rows written
+  """
+  writer = csv.writer(stream)
+  writer.writerow(fields)
+
+  count = 0
+  for records in batches:
+    writer.writerows([_csv_value(record.get(field)) for field in fields] for record in records)
+    count += len(records)
+  return count
+
+
+def write_json(batches: Batches, stream: TextIO) -> int:
+  """
+  Write a JSON array one record at a time, never holding the full list.
+
+  Returns:
+    Number of records written
+  """
+  count = 0
+  stream.write("[")
+  for records in batches:
+    for record in records:
+      stream.write(",\n" if count else "\n")
+      stream.write(dumps(record).decode("utf-8"))
+      count += 1
+  stream.write("\n]\n" if count else "]\n")
+  return count
+
+
+def write_ndjson(batches: Batches, stream: TextIO) -> int:
+  """
+  Returns:
+    Number of records written
+  """
+  count = 0
+  for records in batches:
+    stream.write("".join(dumps(record).decode("utf-8") + "\n" for record in records))
+    count += len(records)
+  return count
+
+
+def _arrow_type(python_type: Optional[type]):
+  if python_type is bool:
+    return pyarrow.bool_()
+  if python_type is int:
+    return pyarrow.int64()
+  if python_type is float:
+    return pyarrow.float64()
+  if python_type is datetime:
+    # SQLite hands back naive datetimes; the app stores them in UTC
+    return pyarrow.timestamp("us", tz="UTC")
+  if python_type is date:
+    return pyarrow.date32()
+  return pyarrow.string()
+
+
+def arrow_schema(
+  fields: Sequence[str],
+  types: Optional[Mapping[str, type]] = None,
+  dictionary_fields: Sequence[str] = ()
+):
+  """
+  Returns:
+    pyarrow.Schema for the fields; dictionary_fields get dictionary<int32, ...> columns
+  """
+  types = types or {}
+  columns = []
+  for field in fields:
+    arrow_type = _arrow_type(types.get(field))
+    if field in dictionary_fields:
+      arrow_type = pyarrow.dictionary(pyarrow.int32(), arrow_type)
+    columns.append(pyarrow.field(field, arrow_type))
+  return pyarrow.schema(columns)
+
+
+class _BatchBuilder:
+  """
+  Turns record dicts into pyarrow RecordBatches. Dictionary columns share
+  one append-only dictionary across batches, so later batches only add
+  delta entries (the Arrow IPC file format allows no replacements).
+  """
+
+  def __init__(self, schema):
+    self.schema = schema
+    self.dictionaries = {
+      field.name: {} for field in schema if pyarrow.types.is_dictionary(field.type)
     }
-    for job in jobs
-  ]
 
-  with open(path, "w", encoding="utf-8") as f:
-    json.dump(data, f, indent=2)
+  def _dictionary_array(self, field, values):
+    dictionary = self.dictionaries[field.name]
+    indices = [None if value is None else dictionary.setdefault(value, len(dictionary)) for value in values]
+    return pyarrow.DictionaryArray.from_arrays(
+      pyarrow.array(indices, type=field.type.index_type),
+      pyarrow.array(list(dictionary), type=field.type.value_type),
+    )
+
+  def build(self, records: List[Dict[str, Any]]):
+    arrays = []
+    for field in self.schema:
+      values = [record.get(field.name) for record in records]
+      if field.name in self.dictionaries:
+        arrays.append(self._dictionary_array(field, values))
+      else:
+        arrays.append(pyarrow.array(values, type=field.type))
+    return pyarrow.RecordBatch.from_arrays(arrays, schema=self.schema)
+
+
+def write_parquet(batches: Batches, path: Path, schema, compression: str = "none") -> int:
+  """
+  Write record batches to a Parquet file, ROW_GROUP_SIZE rows per row group.
+
+  Returns:
+    Number of rows written
+  """
+  builder = _BatchBuilder(schema)
+  dictionary_fields = list(builder.dictionaries)
+  count = 0
+  pending = []
+  pending_rows = 0
+
+  with pyarrow.parquet.ParquetWriter(
+    path,
+    schema,
+    compression=compression,
+    use_dictionary=dictionary_fields or False,
+  ) as writer:
+    for records in batches:
+      if not records:
+        continue
+      pending.append(builder.build(records))
+      pending_rows += len(records)
+      count += len(records)
+      if pending_rows >= ROW_GROUP_SIZE:
+        writer.write_table(pyarrow.Table.from_batches(pending, schema=schema), row_group_size=ROW_GROUP_SIZE)
+        pending, pending_rows = [], 0
+
+    if pending:
+      writer.write_table(pyarrow.Table.from_batches(pending, schema=schema), row_group_size=ROW_GROUP_SIZE)
+
+  return count
+
+
+def write_arrow(batches: Batches, path: Path, schema, compression: str = "none") -> int:
+  """
+  Write record batches to an Arrow IPC file, one IPC batch per input batch.
+
+  Returns:
+    Number of rows written
+  """
+  builder = _BatchBuilder(schema)
+  options = pyarrow.ipc.IpcWriteOptions(
+    compression=None if compression == "none" else compression,
+    emit_dictionary_deltas=True,
+  )
+  count = 0
+
+  with pyarrow.OSFile(str(path), "wb") as sink, pyarrow.ipc.new_file(sink, schema, options=options) as writer:
+    for records in batches:
+      if not records:
+        continue
+      writer.write_batch(builder.build(records))
+      count += len(records)
+
+  return count
+
+
+def export_records(
+  batches: Batches,
+  path: Path,
+  format: str,
+  fields: Sequence[str],
+  compression: str = "none",
+  types: Optional[Mapping[str, type]] = None,
+  dictionary_fields: Sequence[str] = ()
+) -> int:
+  """
+  Stream record batches into a csv, json, ndjson, parquet or Arrow IPC file.
+  types (field -> Python type) and dictionary_fields only apply to the
+  columnar formats; fields without a type are written as strings.
+
+  Returns:
+    Number of records written
+  """
+  check_format(format, compression)
+
+  if format in COLUMNAR_FORMATS:
+    schema = arrow_schema(fields, types, dictionary_fields)
+    if format == "parquet":
+      return write_parquet(batches, path, schema, compression)
+    return write_arrow(batches, path, schema, compression)
+
+  with open_output(path, compression) as stream:
+    if format == "csv":
+      return write_csv(batches, stream, fields)
+    if format == "json":
+      return write_json(batches, stream)
+    return write_ndjson(batches, stream)
+
+
+def detect_format(path: Path) -> Tuple[str, str]:
+  """
+  Returns:
+    (format, compression) from the file name, e.g. ("csv", "gzip") for jobs.csv.gz
+
+  Raises:
+    ValueError: if the extension is not a known export format
+  """
+  suffixes = [suffix.lstrip(".").lower() for suffix in Path(path).suffixes]
+  compression = "none"
+  for name, suffix in COMPRESSION_SUFFIXES.items():
+    if suffix and suffixes and suffixes[-1] == suffix.lstrip("."):
+      compression = name
+      suffixes = suffixes[:-1]
+
+  if not suffixes or suffixes[-1] not in FORMATS:
+    raise ValueError(f"Cannot tell the export format of {path}")
+  return suffixes[-1], compression
+
+
+def open_input(path: Path, compression: str = "none") -> TextIO:
+  """
+  Open path for reading text, decompressing on the fly.
+
+  Raises:
+    RuntimeError: if zstd is requested but zstandard is not installed
+  """
+  if compression == "gzip":
+    return gzip.open(path, "rt", encoding="utf-8", newline="")
+
+  if compression == "zstd":
+    if zstandard is None:
+      raise RuntimeError("zstandard is required for zstd files: pip install zstandard")
+    reader = zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True)
+    return io.TextIOWrapper(reader, encoding="utf-8", newline="")
+
+  if compression == "none":
+    return open(path, "r", encoding="utf-8", newline="")
+
+  raise ValueError(f"Unknown compression: {compression}")
+
+
+def _coerce(value: Any, python_type: Optional[type]) -> Any:
+  """Restore a typed value from its csv/json text form."""
+  if value is None or python_type is None or isinstance(value, python_type):
+    return value
+  if value == "":
+    # csv writes None as an empty cell
+    return None
+  if python_type is datetime:
+    return datetime.fromisoformat(value)
+  if python_type is date:
+    return date.fromisoformat(value)
+  if python_type is bool:
+    return str(value).lower() in ("true", "1", "yes")
+  return python_type(value)
+
+
+def _typed(records: List[Dict[str, Any]], types: Mapping[str, type]) -> List[Dict[str, Any]]:
+  for record in records:
+    for field, python_type in types.items():
+      if field in record:
+        record[field] = _coerce(record[field], python_type)
+  return records
+
+
+def _chunks(records: Iterable[Dict[str, Any]], batch_size: int) -> Iterator[List[Dict[str, Any]]]:
+  batch = []
+  for record in records:
+    batch.append(record)
+    if len(batch) >= batch_size:
+      yield batch
+      batch = []
+  if batch:
+    yield batch
+
+
+def _json_array(stream: TextIO) -> Iterator[Any]:
+  """
+  Parse a JSON array one element at a time, so memory holds a single
+  record plus a read buffer however large the file is.
+
+  Yields:
+    The array's elements
+
+  Raises:
+    ValueError: if the stream is not a JSON array
+  """
+  decoder = json.JSONDecoder()
+  buffer, position, eof = "", 0, False
+  started = False
+
+  while True:
+    # Skip whitespace and the array's punctuation up to the next element
+    while position < len(buffer):
+      char = buffer[position]
+      if char.isspace() or (started and char == ","):
+        position += 1
+      elif not started and char == "[":
+        started = True
+        position += 1
+      elif started and char == "]":
+        return
+      elif not started:
+        raise ValueError("Expected a JSON array")
+      else:
+        break
+
+    if position < len(buffer):
+      try:
+        value, end = decoder.raw_decode(buffer, position)
+      except json.JSONDecodeError:
+        # Usually the element continues past the buffer
+        if eof:
+          raise
+        end = None
+      # A value ending at the buffer's edge may be cut short (e.g. a number)
+      if end is not None and (end < len(buffer) or eof):
+        yield value
+        position = end
+        continue
+    elif eof:
+      raise ValueError("Unexpected end of JSON array")
+
+    chunk = stream.read(JSON_READ_SIZE)
+    eof = not chunk
+    buffer = buffer[position:] + chunk
+    position = 0
+
+
+def read_records(
+  path: Path,
+  types: Optional[Mapping[str, type]] = None,
+  batch_size: int = 1000
+) -> Iterator[List[Dict[str, Any]]]:
+  """
+  Read an export file back in batches; the format comes from the file
+  name. csv and json values are converted back with types (field ->
+  Python type); empty csv cells of typed fields become None.
+  Every format is streamed; JSON arrays are parsed one element at a time.
+
+  Yields:
+    Lists of record dicts
+  """
+  format, compression = detect_format(path)
+  check_format(format, compression)
+  types = types or {}
+
+  if format == "parquet":
+    for batch in pyarrow.parquet.ParquetFile(path).iter_batches(batch_size=batch_size):
+      yield batch.to_pylist()
+    return
+
+  if format == "arrow":
+    with pyarrow.memory_map(str(path)) as source:
+      reader = pyarrow.ipc.open_file(source)
+      for index in range(reader.num_record_batches):
+        yield from _chunks(reader.get_batch(index).to_pylist(), batch_size)
+    return
+
+  with open_input(path, compression) as stream:
+    if format == "csv":
+      records = csv.DictReader(stream)
+    elif format == "json":
+      records = _json_array(stream)
+    else:
+      records = (loads(line) for line in stream if line.strip())
+
+    for batch in _chunks(records, batch_size):
+      yield _typed(batch, types)
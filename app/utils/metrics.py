@@ -0,0 +1,204 @@
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# (label values, value) pairs reported by callback metrics at scrape time
+Samples = Iterable[Tuple[Dict[str, str], float]]
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value: str) -> str:
+  return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+  pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+  if extra:
+    pairs.append(extra)
+  return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+  if value == float("inf"):
+    return "+Inf"
+  if float(value).is_integer():
+    return str(int(value))
+  return repr(float(value))
+
+
+class Metric:
+  """
+  Base class for metrics with an optional fixed set of label names.
+  A `collect` callback makes the metric report values computed at
+  scrape time instead of values recorded by the application.
+  """
+  type = "untyped"
+
+  def __init__(
+    self,
+    name: str,
+    documentation: str,
+    labels: Sequence[str] = (),
+    collect: Optional[Callable[[], Samples]] = None
+  ):
+    self.name = name
+    self.documentation = documentation
+    self.label_names = tuple(labels)
+    self.collect = collect
+    self._values = {}
+    self._lock = threading.Lock()
+
+  def _key(self, labels: Dict[str, object]) -> Tuple[str, ...]:
+    if set(labels) != set(self.label_names):
+      raise ValueError(f"{self.name} expects labels {self.label_names}, got {tuple(labels)}")
+    return tuple(str(labels[name]) for name in self.label_names)
+
+  def _lines(self) -> List[str]:
+    if self.collect is not None:
+      return [
+        f"{self.name}{_format_labels(self.label_names, self._key(labels))} {_format_value(value)}"
+        for labels, value in self.collect()
+      ]
+
+    with self._lock:
+      items = sorted(self._values.items())
+    return [
+      f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}"
+      for key, value in items
+    ]
+
+  def render(self) -> str:
+    lines = [
+      f"# HELP {self.name} {_escape(self.documentation)}",
+      f"# TYPE {self.name} {self.type}",
+    ]
+    lines.extend(self._lines())
+    return "\n".join(lines)
+
+
+class Counter(Metric):
+  type = "counter"
+
+  def inc(self, amount: float = 1, **labels):
+    key = self._key(labels)
+    with self._lock:
+      self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(Metric):
+  type = "gauge"
+
+  def set(self, value: float, **labels):
+    key = self._key(labels)
+    with self._lock:
+      self._values[key] = value
+
+  def inc(self, amount: float = 1, **labels):
+    key = self._key(labels)
+    with self._lock:
+      self._values[key] = self._values.get(key, 0) + amount
+
+  def dec(self, amount: float = 1, **labels):
+    self.inc(-amount, **labels)
+
+
+class Histogram(Metric):
+  type = "histogram"
+
+  def __init__(
+    self,
+    name: str,
+    documentation: str,
+    labels: Sequence[str] = (),
+    buckets: Sequence[float] = DEFAULT_BUCKETS
+  ):
+    super().__init__(name, documentation, labels)
+    self.buckets = tuple(sorted(buckets))
+
+  def observe(self, value: float, **labels):
+    key = self._key(labels)
+    index = bisect_left(self.buckets, value)
+    with self._lock:
+      entry = self._values.get(key)
+      if entry is None:
+        # Per-bucket counts (last slot is +Inf), sum, count
+        entry = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+      entry[0][index] += 1
+      entry[1] += value
+      entry[2] += 1
+
+  @contextmanager
+  def time(self, **labels):
+    """Observe the duration of the with-block, in seconds."""
+    started = time.perf_counter()
+    try:
+      yield
+    finally:
+      self.observe(time.perf_counter() - started, **labels)
+
+  def _lines(self) -> List[str]:
+    with self._lock:
+      items = sorted((key, (list(counts), total, count)) for key, (counts, total, count) in self._values.items())
+
+    lines = []
+    for key, (counts, total, count) in items:
+      cumulative = 0
+      for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+        cumulative += bucket_count
+        labels = _format_labels(self.label_names, key, f'le="{_format_value(bound)}"')
+        lines.append(f"{self.name}_bucket{labels} {cumulative}")
+      labels = _format_labels(self.label_names, key)
+      lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+      lines.append(f"{self.name}_count{labels} {count}")
+    return lines
+
+
+class MetricsRegistry:
+  """
+  Process-wide collection of metrics, rendered in the Prometheus text
+  exposition format. Registering an existing name returns the metric
+  already registered, so modules can declare their metrics at import.
+  """
+
+  def __init__(self):
+    self._metrics = {}
+    self._lock = threading.Lock()
+
+  def _register(self, cls, name: str, *args, **kwargs) -> Metric:
+    with self._lock:
+      metric = self._metrics.get(name)
+      if metric is None:
+        metric = self._metrics[name] = cls(name, *args, **kwargs)
+      elif not isinstance(metric, cls):
+        raise ValueError(f"Metric {name} is already registered as a {metric.type}")
+      return metric
+
+  def counter(self, name: str, documentation: str, labels: Sequence[str] = (), collect=None) -> Counter:
+    return self._register(Counter, name, documentation, labels, collect)
+
+  def gauge(self, name: str, documentation: str, labels: Sequence[str] = (), collect=None) -> Gauge:
+    return self._register(Gauge, name, documentation, labels, collect)
+
+  def histogram(
+    self,
+    name: str,
+    documentation: str,
+    labels: Sequence[str] = (),
+    buckets: Sequence[float] = DEFAULT_BUCKETS
+  ) -> Histogram:
+    return self._register(Histogram, name, documentation, labels, buckets)
+
+  def render(self) -> str:
+    """
+    Returns:
+      All metrics in the Prometheus text format
+    """
+    with self._lock:
+      metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+    return "\n".join(metric.render() for metric in metrics) + "\n"
+
+
+registry = MetricsRegistry()
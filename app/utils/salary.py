@@ -0,0 +1,189 @@
+import re
+from typing import Any, Dict, List, Optional
+
+CURRENCY_SYMBOLS = {
+  "$": "USD",
+  "€": "EUR",
+  "£": "GBP",
+  "₹": "INR",
+  "¥": "JPY",
+}
+
+CURRENCY_CODES = {"USD", "EUR", "GBP", "CAD", "AUD", "NZD", "CHF", "INR", "JPY", "SEK", "NOK", "DKK", "PLN", "BRL", "MXN", "SGD"}
+
+PERIOD_UNITS = {
+  "h": "hour", "hr": "hour", "hour": "hour", "hourly": "hour",
+  "d": "day", "day": "day", "daily": "day",
+  "wk": "week", "week": "week", "weekly": "week",
+  "mo": "month", "month": "month", "monthly": "month",
+  "yr": "year", "year": "year", "annum": "year", "yearly": "year", "annually": "year",
+}
+
+AMOUNT_RE = re.compile(r"(\d+(?:[.,]\d+)*)\s*([kKmM])?(?![\w])")
+# US retirement plan, not a salary: "401k", "401(k)"
+RETIREMENT_RE = re.compile(r"\b401\s*\(?k\)?", re.I)
+# Text joining the two ends of a range, e.g. " - ", "–", " to $"
+RANGE_SEPARATOR_RE = re.compile(r"\s*(-|–|—|to)\s*([$€£₹¥]|[A-Z]{3})?\s*", re.I)
+CURRENCY_BEFORE_RE = re.compile(r"([$€£₹¥]|\b[A-Z]{3})\s*$")
+CURRENCY_AFTER_RE = re.compile(r"^\s*([A-Z]{3})\b")
+# Pay period written right after an amount: "/hr", " per year", " USD an hour", " monthly"
+PERIOD_UNIT_RE = re.compile(
+  r"\s*(?:(?-i:[A-Z]{3})\s*)?"
+  r"(?:(?:/|\bper\b|\ban?\b)\s*(?P<unit>hour|hr|h|day|d|week|wk|month|mo|year|yr|annum)"
+  r"|(?P<adverb>hourly|daily|weekly|monthly|yearly|annually))\b",
+  re.I
+)
+UP_TO_RE = re.compile(r"\b(up\s+to|max(imum)?|under)\b", re.I)
+FROM_RE = re.compile(r"\+|\b(from|min(imum)?|at\s+least|starting)\b", re.I)
+
+
+def _to_number(raw: str, suffix: Optional[str]) -> Optional[int]:
+  """
+  Convert '80,000', '80.000', '1.5' + 'k' etc. to an amount in whole
+  currency units; cents are rounded away ("12.75" -> 13).
+  """
+  if re.fullmatch(r"\d{1,3}([.,]\d{3})+", raw):
+    # Thousands separators, e.g. 80,000 or 80.000
+    value = float(re.sub(r"[.,]", "", raw))
+  else:
+    try:
+      value = float(raw.replace(",", ""))
+    except ValueError:
+      return None
+
+  if suffix and suffix.lower() == "k":
+    value *= 1_000
+  elif suffix and suffix.lower() == "m":
+    value *= 1_000_000
+
+  return int(round(value))
+
+
+def _has_currency(text: str, match: re.Match) -> bool:
+  """Whether an amount is written with a currency symbol or code next to it."""
+  before = CURRENCY_BEFORE_RE.search(text[:match.start()])
+  if before and (before.group(1) in CURRENCY_SYMBOLS or before.group(1) in CURRENCY_CODES):
+    return True
+  after = CURRENCY_AFTER_RE.match(text[match.end():])
+  return bool(after and after.group(1) in CURRENCY_CODES)
+
+
+def _salary_range(text: str) -> List[re.Match]:
+  """
+  Returns:
+    The matches of the one or two amounts of the salary range in text.
+    Numbers are grouped into ranges ("40-50k") and the first range written
+    with a currency is preferred, so head counts or plan names mentioned
+    alongside are skipped.
+  """
+  matches = [match for match in AMOUNT_RE.finditer(text) if _to_number(*match.groups())]
+  if not matches:
+    return []
+
+  groups = [[matches[0]]]
+  for previous, match in zip(matches, matches[1:]):
+    if len(groups[-1]) < 2 and RANGE_SEPARATOR_RE.fullmatch(text[previous.end():match.start()]):
+      groups[-1].append(match)
+    else:
+      groups.append([match])
+
+  return next((group for group in groups if any(_has_currency(text, match) for match in group)), groups[0])
+
+
+def _amounts(group: List[re.Match]) -> List[int]:
+  """
+  Returns:
+    The amounts of a salary range, with a shared k/m suffix applied to both ends
+  """
+  amounts = [_to_number(*match.groups()) for match in group]
+
+  if len(group) == 2:
+    first_suffix, second_suffix = group[0].group(2), group[1].group(2)
+    if second_suffix and not first_suffix and amounts[0] < amounts[1]:
+      # "40-50k": the suffix covers both ends
+      amounts[0] = _to_number(group[0].group(1), second_suffix)
+    elif amounts[1] < amounts[0] and amounts[1] * 1_000 >= amounts[0]:
+      # "80k - 120": apply the first amount's multiplier to the second
+      amounts[1] *= 1_000
+
+  return amounts
+
+
+def _currency(text: str) -> Optional[str]:
+  for symbol, code in CURRENCY_SYMBOLS.items():
+    if symbol in text:
+      return code
+
+  for token in re.findall(r"\b[A-Z]{3}\b", text.upper()):
+    if token in CURRENCY_CODES:
+      return token
+
+  return None
+
+
+def _period(text: str, group: List[re.Match]) -> str:
+  """
+  Only a unit attached to the amounts counts, so "4 days a week, $90k" or
+  "$60k, monthly bonus" stay yearly.
+
+  Returns:
+    The pay period written after either end of the range, else "year"
+  """
+  for match in reversed(group):
+    unit = PERIOD_UNIT_RE.match(text, match.end())
+    if unit:
+      return PERIOD_UNITS[(unit.group("unit") or unit.group("adverb")).lower()]
+  return "year"
+
+
+def parse_salary(text: Optional[str]) -> Dict[str, Any]:
+  """
+  Parse a free-form salary string into structured columns.
+
+  Examples:
+    "$80,000 - $120,000" -> 80000..120000 USD per year
+    "$80,000+"           -> min 80000, no max
+    "Up to €70k"         -> no min, max 70000 EUR
+    "$45/hr"             -> 45..45 USD per hour
+    "£40-50k"            -> 40000..50000 GBP per year
+    "$12.75 an hour"     -> 13..13 USD per hour
+
+  Amounts are whole currency units (the salary columns are integers), so
+  cents are rounded away; the original text stays in the salary column.
+
+  Returns:
+    Dict with salary_min, salary_max, salary_currency and salary_period
+    (all None when nothing could be parsed)
+  """
+  parsed = {
+    "salary_min": None,
+    "salary_max": None,
+    "salary_currency": None,
+    "salary_period": None,
+  }
+
+  if not text:
+    return parsed
+
+  cleaned = RETIREMENT_RE.sub(" ", text)
+  group = _salary_range(cleaned)
+  if not group:
+    return parsed
+
+  amounts = _amounts(group)
+
+  low, high = min(amounts), max(amounts)
+
+  if len(amounts) == 1:
+    if UP_TO_RE.search(text):
+      low = None
+    elif FROM_RE.search(text):
+      high = None
+
+  parsed.update(
+    salary_min=low,
+    salary_max=high,
+    salary_currency=_currency(text),
+    salary_period=_period(cleaned, group),
+  )
+  return parsed
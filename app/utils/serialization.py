@@ -0,0 +1,59 @@
+import json
+from datetime import date, datetime
+from typing import Any
+from starlette.responses import Response
+
+try:
+  import orjson
+except ImportError:
+  orjson = None
+
+
+def _default(value: Any) -> Any:
+  if isinstance(value, (datetime, date)):
+    return value.isoformat()
+  raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(value: Any) -> bytes:
+  """
+  Encode plain dicts/lists (datetimes allowed) as compact UTF-8 JSON.
+  Uses orjson when installed, else the stdlib encoder.
+
+  Returns:
+    JSON bytes
+  """
+  if orjson is not None:
+    return orjson.dumps(value)
+  return json.dumps(value, default=_default, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def loads(data) -> Any:
+  """
+  Decode JSON from bytes or str.
+
+  Raises:
+    ValueError: if data is not valid JSON
+  """
+  if orjson is not None:
+    return orjson.loads(data)
+  return json.loads(data)
+
+
+def dumps_lines(values) -> bytes:
+  """
+  Returns:
+    NDJSON bytes, one line per value
+  """
+  return b"".join(dumps(value) + b"\n" for value in values)
+
+
+class FastJSONResponse(Response):
+  """
+  JSON response rendered with dumps(). Content is written as-is, without
+  pydantic validation, so only pass trusted, already-shaped data.
+  """
+  media_type = "application/json"
+
+  def render(self, content: Any) -> bytes:
+    return dumps(content)
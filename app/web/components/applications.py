@@ -1,5 +1,35 @@
 import streamlit as st
-from app.models.job import Job
+from app.web import queries
+from app.schemas.jobs import JobFilters
+
+STATUSES = ('saved', 'applied', 'interview', 'offer', 'rejected')
+
+# Cards loaded per column at first and per "Load more"
+CARDS_PER_PAGE = 20
+
+
+def _load_more(status):
+  """Button callback: show one more page of cards in a column."""
+  pages = st.session_state.setdefault('kanban_pages', {})
+  pages[status] = pages.get(status, 0) + 1
+
+
+def _column_jobs(db, status, column):
+  """
+  Returns:
+    (cards to show, cursor for the next page or None). Extra pages follow
+    the keyset cursors from the first page on every rerun, so cards added
+    or moved meanwhile are neither skipped nor repeated.
+  """
+  jobs, next_cursor = list(column.jobs), column.next_cursor
+  for _ in range(st.session_state.get('kanban_pages', {}).get(status, 0)):
+    if next_cursor is None:
+      break
+    page, next_cursor = queries.job_summary_page(
+      db, JobFilters(status=status, limit=CARDS_PER_PAGE, cursor=next_cursor)
+    )
+    jobs.extend(page)
+  return jobs, next_cursor
 
 
 def render(db):
@@ -7,15 +37,16 @@ def render(db):
   st.title("📝 Application Pipeline")
   st.markdown("Kanban board view of your applications")
   
-  statuses = ['saved', 'applied', 'interview', 'offer', 'rejected']
-  cols = st.columns(len(statuses))
+  board = queries.status_board(db, STATUSES, CARDS_PER_PAGE)
+  cols = st.columns(len(STATUSES))
   
-  for idx, status in enumerate(statuses):
+  for idx, status in enumerate(STATUSES):
     with cols[idx]:
-      jobs = db.query(Job).filter(Job.status == status).all()
+      column = board[status]
+      jobs, next_cursor = _column_jobs(db, status, column)
       
       st.markdown(f"### {status.upper()}")
-      st.markdown(f"**{len(jobs)} jobs**")
+      st.markdown(f"**{column.count} jobs**")
       st.markdown("---")
       
       for job in jobs:
@@ -29,3 +60,11 @@ def render(db):
             st.rerun()
           
           st.markdown("---")
+      
+      if next_cursor is not None:
+        st.button(
+          f"Load more ({max(column.count - len(jobs), 0)} left)",
+          key=f"kanban_more_{status}",
+          on_click=_load_more,
+          args=(status,)
+        )
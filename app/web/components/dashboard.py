@@ -1,10 +1,13 @@
 import streamlit as st
+from datetime import datetime, timedelta, timezone
 import pandas as pd
 import plotly.express as px
-from sqlalchemy import desc
-from app.services.job_service import get_job_stats
+from app.web import queries
 from app.web.utils import status_badge
-from app.models.job import Job
+from app.schemas.jobs import JobFilters
+
+# Days shown in the activity trend charts
+TREND_DAYS = 90
 
 
 def render(db):
@@ -13,7 +16,7 @@ def render(db):
   st.markdown("Overview of your job search progress")
   
   # Get stats
-  stats = get_job_stats(db)
+  stats = queries.job_stats(db)
   
   # Metrics Row
   col1, col2, col3, col4 = st.columns(4)
@@ -81,10 +84,18 @@ def render(db):
       st.info("No jobs tracked yet.")
   
   st.markdown("---")
+
+  _render_funnel(db)
+
+  st.markdown("---")
+
+  _render_trends(db)
+
+  st.markdown("---")
   
   # Recent Jobs
   st.subheader("📅 Recent Jobs (Last 10)")
-  recent_jobs = db.query(Job).order_by(desc(Job.created_at)).limit(10).all()
+  recent_jobs = queries.job_summaries(db, JobFilters(limit=10))
   
   if recent_jobs:
     for job in recent_jobs:
@@ -108,3 +119,89 @@ def render(db):
         st.markdown("---")
   else:
     st.info("No jobs yet. Start by scraping jobs or adding them manually!")
+
+
+def _render_funnel(db):
+  """Render pipeline funnel from precomputed funnel metrics."""
+  st.subheader("🎯 Application Funnel")
+  funnel = queries.funnel_metrics(db)
+
+  if not any(stage.reached for stage in funnel.stages):
+    st.info("No pipeline activity yet.")
+    return
+
+  col1, col2 = st.columns([2, 1])
+
+  with col1:
+    funnel_df = pd.DataFrame([
+      {'Stage': stage.stage.title(), 'Jobs': stage.reached}
+      for stage in funnel.stages
+      if stage.stage != 'rejected'
+    ])
+    fig = px.funnel(funnel_df, x='Jobs', y='Stage')
+    fig.update_layout(height=300)
+    st.plotly_chart(fig, width='stretch')
+
+  with col2:
+    def days(value):
+      return f"{value:.1f} days" if value is not None else "—"
+
+    st.metric("Avg. Time to Apply", days(funnel.time_to_apply_days))
+    st.metric("Avg. Time to Interview", days(funnel.time_to_interview_days))
+
+    for stage in funnel.stages[1:]:
+      if stage.conversion_rate is not None:
+        st.caption(f"{stage.stage.title()}: {stage.conversion_rate:.0%} conversion")
+
+
+def _render_trends(db):
+  """Render ingestion and application trends from the daily activity rollup."""
+  st.subheader("📈 Activity Trends")
+  # Rollup days are UTC
+  today = datetime.now(timezone.utc).date()
+  since = today - timedelta(days=TREND_DAYS - 1)
+  activity = pd.DataFrame(
+    queries.daily_activity(db, since),
+    columns=['Day', 'Source', 'Status', 'Created', 'Changed']
+  )
+
+  if activity.empty:
+    st.info(f"No activity in the last {TREND_DAYS} days.")
+    return
+
+  activity['Day'] = pd.to_datetime(activity['Day'])
+  days = pd.date_range(since, today, freq='D')
+
+  col1, col2 = st.columns(2)
+
+  with col1:
+    st.markdown("**Jobs Added per Day**")
+    added = activity.pivot_table(
+      index='Day', columns='Source', values='Created', aggfunc='sum', fill_value=0
+    ).reindex(days, fill_value=0)
+    fig = px.bar(
+      added,
+      labels={'index': 'Day', 'value': 'Jobs', 'Source': 'Source'},
+      color_discrete_sequence=px.colors.qualitative.Pastel
+    )
+    fig.update_layout(height=300, legend_title_text='Source')
+    st.plotly_chart(fig, width='stretch')
+
+  with col2:
+    st.markdown("**Applications per Week**")
+    # Jobs reaching each stage, whether added with it or moved into it
+    stages = activity[activity['Status'].isin(['applied', 'interview', 'offer'])]
+    weekly = stages.assign(Jobs=stages['Created'] + stages['Changed']).pivot_table(
+      index='Day', columns='Status', values='Jobs', aggfunc='sum', fill_value=0
+    ).reindex(days, fill_value=0).resample('W-MON', label='left', closed='left').sum()
+    if weekly.empty:
+      st.info("No applications in this period.")
+    else:
+      fig = px.line(
+        weekly,
+        markers=True,
+        labels={'index': 'Week', 'value': 'Jobs', 'Status': 'Stage'},
+        color_discrete_sequence=px.colors.qualitative.Set2
+      )
+      fig.update_layout(height=300, legend_title_text='Stage')
+      st.plotly_chart(fig, width='stretch')
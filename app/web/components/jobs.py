@@ -1,8 +1,30 @@
 import streamlit as st
-from app.services.job_service import get_jobs
+from app.services.job_service import get_job_by_id, update_job, update_job_status
+from app.web import queries
 from app.web.utils import status_badge, jobs_to_dataframe
-from app.models.job import Job
-from app.schemas.jobs import JobFilters
+from app.schemas.jobs import JobFilters, JobUpdate
+
+PAGE_SIZES = [25, 50, 100, 200]
+TABLE_COLUMNS = ['Title', 'Company', 'Location', 'Type', 'Salary', 'Status', 'Source', 'Date Added']
+
+
+def _go_to_page(page, cursor=None):
+  """
+  Button callback: move to page. Moving forward passes the cursor that
+  starts the new page; going back reuses the cursors already seen.
+  """
+  if cursor is not None:
+    st.session_state['jobs_cursors'] = st.session_state['jobs_cursors'][:page] + [cursor]
+  st.session_state['jobs_page'] = page
+
+
+def _on_table_select():
+  """Table selection callback: open the selected job's details."""
+  rows = st.session_state['jobs_table'].selection.rows
+  ids = st.session_state.get('jobs_page_ids', [])
+  if rows and rows[0] < len(ids):
+    st.session_state['selected_job_id'] = ids[rows[0]]
+    st.session_state['show_job_detail'] = True
 
 
 def render(db):
@@ -14,10 +36,14 @@ def render(db):
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-      search = st.text_input("Search", placeholder="Job title or company")
+      search = st.text_input(
+        "Search",
+        placeholder="Job title or company",
+        help="Matches job titles and company names; descriptions are not searched."
+      )
     
     with col2:
-      sources = ['All'] + list(set([s for s, in db.query(Job.source).distinct().all()]))
+      sources = ['All'] + queries.distinct_values(db, 'source')
       source_filter = st.selectbox("Source", sources)
     
     with col3:
@@ -25,48 +51,100 @@ def render(db):
       status_filter = st.selectbox("Status", statuses)
     
     with col4:
-      job_types = ['All'] + list(set([jt for jt, in db.query(Job.job_type).distinct().all() if jt]))
+      job_types = ['All'] + queries.distinct_values(db, 'job_type')
       type_filter = st.selectbox("Job Type", job_types)
+
+    col1, col2, col3 = st.columns([2, 1, 3])
+
+    with col1:
+      min_salary = st.number_input(
+        "Minimum Yearly Salary",
+        min_value=0,
+        value=0,
+        step=10000,
+        help="Only jobs with a yearly salary in the chosen currency are shown when set; "
+             "hourly or monthly pay and other currencies are not compared."
+      )
+
+    with col2:
+      currencies = queries.distinct_values(db, 'salary_currency') or ['USD']
+      salary_currency = st.selectbox(
+        "Currency",
+        currencies,
+        index=currencies.index('USD') if 'USD' in currencies else 0
+      )
+
+    with col3:
+      sort_options = {'Newest': 'newest', 'Salary (high to low)': 'salary_desc', 'Salary (low to high)': 'salary_asc'}
+      sort_label = st.selectbox("Sort By", list(sort_options))
   
+    col1, col2 = st.columns(2)
+
+    with col1:
+      view_mode = st.radio("View as:", ["Table", "Cards"], horizontal=True)
+
+    with col2:
+      page_size = st.selectbox("Jobs per page", PAGE_SIZES, index=1)
+
   # Build filters dict
   filters_dict = {
     'search': search if search else None,
     'source': source_filter if source_filter != 'All' else None,
     'status': status_filter if status_filter != 'All' else None,
-    'job_type': type_filter if type_filter != 'All' else None
+    'job_type': type_filter if type_filter != 'All' else None,
+    'salary_min': min_salary if min_salary else None,
+    'salary_currency': salary_currency,
+    'sort': sort_options[sort_label],
+    'limit': page_size,
   }
 
-  filters = JobFilters(**filters_dict)
+  # Any filter change starts over from the first page
+  filters_key = tuple(sorted(filters_dict.items()))
+  if st.session_state.get('jobs_filters_key') != filters_key:
+    st.session_state['jobs_filters_key'] = filters_key
+    st.session_state['jobs_cursors'] = [None]
+    st.session_state['jobs_page'] = 0
 
-  # DEBUG: Show what filters are being applied
-  #st.write("DEBUG - Filters:", filters.model_dump())
-  
-  # Get filtered jobs
-  jobs = get_jobs(db, filters)
+  page = st.session_state['jobs_page']
+  filters = JobFilters(**filters_dict, cursor=st.session_state['jobs_cursors'][page])
+
+  # One page of summary rows, fetched by keyset cursor (no COUNT, no OFFSET)
+  try:
+    jobs, next_cursor = queries.job_summary_page(db, filters)
+  except ValueError:
+    _go_to_page(0)
+    st.rerun()
 
-  # DEBUG: Show how many jobs were returned
-  #st.write(f"DEBUG - Jobs returned: {len(jobs)}")
+  # The rows past this cursor are gone (e.g. the last job here left the filter)
+  if not jobs and page > 0:
+    _go_to_page(0)
+    st.rerun()
 
   df = jobs_to_dataframe(jobs)
 
-  # DEBUG: Show if dataframe is empty
-  # st.write(f"DEBUG - DataFrame empty: {df.empty}")
-  # st.write(f"DEBUG - DataFrame shape: {df.shape if not df.empty else 'N/A'}")
-  
   if not df.empty:
-    st.markdown(f"**Showing {len(df)} jobs**")
-    
-    # Display options
-    view_mode = st.radio("View as:", ["Cards", "Table"], horizontal=True)
-    
+    first = page * page_size + 1
+    st.markdown(f"**Page {page + 1}** • jobs {first}–{first + len(df) - 1}")
+
     if view_mode == "Table":
+      # Plain grid, no per-row widgets; selecting a row opens its details
+      st.session_state['jobs_page_ids'] = list(df['ID'])
       st.dataframe(
-        df[['Title', 'Company', 'Location', 'Type', 'Status', 'Source', 'Date Added']],
+        df[TABLE_COLUMNS],
         width='stretch',
-        hide_index=True
+        hide_index=True,
+        key='jobs_table',
+        on_select=_on_table_select,
+        selection_mode='single-row',
       )
     else:
-      _render_card_view(df, db)
+      _render_card_view(df)
+
+    col1, col2, _ = st.columns([1, 1, 6])
+    with col1:
+      st.button("◀ Previous", disabled=page == 0, on_click=_go_to_page, args=(page - 1,))
+    with col2:
+      st.button("Next ▶", disabled=next_cursor is None, on_click=_go_to_page, args=(page + 1, next_cursor))
 
     # Job detail modal
     if st.session_state.get('show_job_detail'):
@@ -75,8 +153,8 @@ def render(db):
     st.info("No jobs found matching your filters.")
 
 
-def _render_card_view(df, db):
-  """Render jobs in card view."""
+def _render_card_view(df):
+  """Render one page of jobs as cards (one widget per card)."""
   for idx, row in df.iterrows():
     with st.container():
       col1, col2, col3 = st.columns([4, 2, 1])
@@ -96,21 +174,16 @@ def _render_card_view(df, db):
         if st.button("View Details", key=f"view_{row['ID']}"):
           st.session_state['selected_job_id'] = row['ID']
           st.session_state['show_job_detail'] = True
-        
-        if st.button("🔗 Apply", key=f"apply_{row['ID']}"):
-          st.markdown(f"[Open Job]({row['URL']})")
+
+        st.markdown(f"[🔗 Apply]({row['URL']})")
       
       st.markdown("---")
-  
-  # Job detail modal
-  if st.session_state.get('show_job_detail'):
-    _render_job_detail(db)
 
 
 def _render_job_detail(db):
   """Render job detail modal."""
   job_id = st.session_state.get('selected_job_id')
-  job = db.query(Job).filter(Job.id == job_id).first()
+  job = get_job_by_id(db, job_id)
   
   if job:
     with st.expander(f"📋 Job Details: {job.title}", expanded=True):
@@ -138,8 +211,7 @@ def _render_job_detail(db):
         )
         
         if st.button("Update Status"):
-          job.status = new_status
-          db.commit()
+          update_job_status(db, job.id, new_status)
           st.success(f"Status updated to {new_status}!")
           st.rerun()
         
@@ -152,8 +224,7 @@ def _render_job_detail(db):
         )
         
         if st.button("Save Notes"):
-          job.notes = notes
-          db.commit()
+          update_job(db, job.id, JobUpdate(notes=notes))
           st.success("Notes saved!")
       
       if st.button("Close"):
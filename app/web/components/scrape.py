@@ -1,23 +1,29 @@
 import streamlit as st
 import pandas as pd
-from app.scrappers.remoteok import RemoteOKScraper
-from app.scrappers.weworkremotely import WeWorkRemotelyScraper
-from app.scrappers.remotive import RemotiveScraper
-from app.scrappers.engine import ScraperEngine
+from app.services import scrape_service
 from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+STATUS_LABELS = {
+  "pending": "⏳ Pending",
+  "scraping": "🔎 Scraping",
+  "saving": "💾 Saving",
+  "done": "✅ Success",
+  "failed": "❌ Failed",
+}
+
+
 def render(db):
   """Render scraping page."""
   st.title("🔍 Scrape Jobs")
   st.markdown("Discover new job opportunities from multiple sources")
   
   scrapers_available = {
-    "RemoteOK": RemoteOKScraper,
-    "WeWorkRemotely": WeWorkRemotelyScraper,
-    "Remotive": RemotiveScraper
+    "RemoteOK": "remoteok",
+    "WeWorkRemotely": "weworkremotely",
+    "Remotive": "remotive"
   }
   
   col1, col2 = st.columns([1, 2])
@@ -26,9 +32,9 @@ def render(db):
     st.markdown("### Select Sources")
     selected_scrapers = []
     
-    for name, scraper_class in scrapers_available.items():
+    for name, source in scrapers_available.items():
       if st.checkbox(name, value=True):
-        selected_scrapers.append((name, scraper_class))
+        selected_scrapers.append(source)
     
     st.markdown("---")
     scrape_all = st.button("🚀 Start Scraping", type="primary", width='stretch')
@@ -37,47 +43,41 @@ def render(db):
     st.markdown("### Scraping Results")
     
     if scrape_all and selected_scrapers:
-      _run_scrapers(db, selected_scrapers)
+      # Runs on the background workers; this page only polls its progress
+      run = scrape_service.start_run(selected_scrapers)
+      st.session_state.scrape_run_id = run.id
     elif scrape_all and not selected_scrapers:
       st.warning("Please select at least one source to scrape.")
 
+    if st.session_state.get("scrape_run_id"):
+      _render_progress()
 
-def _run_scrapers(db, selected_scrapers):
-  """Run selected scrapers and display results."""
-  progress_bar = st.progress(0)
-  status_text = st.empty()
-  results_container = st.container()
-  
-  total_scrapers = len(selected_scrapers)
-  engine = ScraperEngine(db)
-  all_results = []
-  
-  for idx, (name, scraper_class) in enumerate(selected_scrapers):
-    status_text.text(f"Scraping {name}...")
-    
-    try:
-      scraper = scraper_class()
-      count = engine.run_scraper(scraper)
-      all_results.append({
-        'Source': name,
-        'Status': '✅ Success',
-        'Jobs Found': count
-      })
-    except Exception as e:
-      logger.error(f"Error scraping {name}: {e}")
-      all_results.append({
-        'Source': name,
-        'Status': '❌ Failed',
-        'Jobs Found': 0
-      })
-    
-    progress_bar.progress((idx + 1) / total_scrapers)
-  
-  status_text.text("✅ Scraping complete!")
-  
-  with results_container:
-    results_df = pd.DataFrame(all_results)
-    st.dataframe(results_df, width='stretch', hide_index=True)
-    
-    total_found = sum([r['Jobs Found'] for r in all_results])
-    st.success(f"🎉 Found {total_found} new jobs across all sources!")
+
+@st.fragment(run_every=1)
+def _render_progress():
+  """Show the current run's progress; reruns on its own every second."""
+  run = scrape_service.get_run(st.session_state.scrape_run_id)
+  if run is None:
+    st.session_state.scrape_run_id = None
+    return
+
+  done = sum(1 for source in run.sources if source.status in ("done", "failed"))
+  st.progress(done / len(run.sources))
+
+  results_df = pd.DataFrame([
+    {
+      'Source': source.source,
+      'Status': STATUS_LABELS[source.status],
+      'Jobs Found': source.found,
+      'New Jobs': source.saved,
+    }
+    for source in run.sources
+  ])
+  st.dataframe(results_df, width='stretch', hide_index=True)
+
+  if run.error:
+    st.error(f"Scrape run failed: {run.error}")
+  elif run.finished:
+    st.success(f"🎉 Found {run.total_saved} new jobs across all sources!")
+  else:
+    st.caption("Scraping in the background — you can keep using the app.")
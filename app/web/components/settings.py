@@ -1,7 +1,15 @@
+import tempfile
+from pathlib import Path
 import streamlit as st
-from app.web.utils import jobs_to_dataframe
-from app.services.job_service import get_jobs
-from app.models.job import Job
+from app.web import queries
+from app.services.job_service import RECORD_FIELDS, iter_job_records
+from app.schemas.jobs import JobFilters
+from app.utils import export as exporter
+
+# Rows fetched from the database per batch when exporting
+EXPORT_BATCH_SIZE = 1000
+
+EXPORT_FILE_NAME = "jobtrail_export.csv"
 
 
 def render(db):
@@ -29,19 +37,26 @@ def _render_database_tab(db):
   with col1:
     st.markdown("**Export Data**")
     if st.button("📥 Export to CSV"):
-        jobs = get_jobs(db)
-        df = jobs_to_dataframe(jobs)
-        csv = df.to_csv(index=False)
-        st.download_button(
-          "Download CSV",
-          csv,
-          "jobtrail_export.csv",
-          "text/csv"
-        )
+        # Same columns as `jobtrail export -f csv`, so the file can be re-imported.
+        # Rows stream to a temp file in batches; Streamlit then holds one copy
+        # of the file's bytes to serve the download.
+        with tempfile.TemporaryDirectory() as tmp:
+          path = Path(tmp) / EXPORT_FILE_NAME
+          exporter.export_records(
+            iter_job_records(db, JobFilters(limit=None), EXPORT_BATCH_SIZE), path, "csv", RECORD_FIELDS
+          )
+          with open(path, "rb") as csv:
+            st.download_button(
+              "Download CSV",
+              csv,
+              EXPORT_FILE_NAME,
+              "text/csv"
+            )
+        st.caption("For large databases, `jobtrail export` writes the file without going through the browser.")
   
   with col2:
     st.markdown("**Database Stats**")
-    st.info(f"Total Jobs: {db.query(Job).count()}")
+    st.info(f"Total Jobs: {queries.job_stats(db).total}")
     st.info(f"Database: SQLite")
 
 
@@ -1,12 +1,27 @@
 import streamlit as st
+from contextlib import contextmanager
+from typing import Iterator
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
-from datetime import datetime, timedelta
 from app.db.session import SessionLocal
-from app.models.job import Job
+from app.db.init_db import init_db
+
+
+@contextmanager
+def get_db() -> Iterator[Session]:
+  """
+  Database session for one script rerun. Each browser session and rerun
+  gets its own Session from the engine's connection pool, closed when the
+  rerun ends, so users never share an identity map or a transaction.
+  """
+  db = SessionLocal()
+  try:
+    yield db
+  finally:
+    db.close()
 
 
 @st.cache_resource
-def get_db() -> Session:
-  """Get database session (cached)."""
-  return SessionLocal()
\ No newline at end of file
+def init_database() -> bool:
+  """Create tables and seed rollups once per server process."""
+  init_db()
+  return True
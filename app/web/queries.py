@@ -0,0 +1,97 @@
+import streamlit as st
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import Row
+from sqlalchemy.orm import Session
+from app.schemas.jobs import FunnelMetrics, JobFilters, JobStats
+from app.services import job_service, version_service
+
+# Cached results are keyed on the jobs table version, so any write (from
+# this app, the API or the CLI) misses the cache on the next rerun. The
+# service calls behind them use the same version read to validate the
+# query cache (see job_service._cached), so a new key is never filled from
+# an entry loaded at an older version. The TTL only bounds memory held for
+# versions nobody asks for anymore.
+CACHE_TTL = 600
+CACHE_ENTRIES = 512
+
+
+def data_version(db: Session) -> int:
+  """
+  Returns:
+    Jobs table version, read once per transaction (re-read after a write)
+  """
+  version, _ = version_service.get_version(db, "jobs")
+  return version
+
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_ENTRIES, show_spinner=False)
+def _job_stats(_db: Session, version: int) -> JobStats:
+  return job_service.get_job_stats(_db)
+
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_ENTRIES, show_spinner=False)
+def _funnel_metrics(_db: Session, version: int) -> FunnelMetrics:
+  return job_service.get_funnel_metrics(_db)
+
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_ENTRIES, show_spinner=False)
+def _distinct_values(_db: Session, column_name: str, version: int) -> List[str]:
+  return job_service.get_distinct_values(_db, column_name)
+
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_ENTRIES, show_spinner=False)
+def _job_summaries(_db: Session, filters: JobFilters, version: int) -> List[Row]:
+  return job_service.get_job_summaries(_db, filters)
+
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_ENTRIES, show_spinner=False)
+def _job_summary_page(_db: Session, filters: JobFilters, version: int) -> Tuple[List[Row], Optional[str]]:
+  return job_service.get_job_summary_page(_db, filters)
+
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_ENTRIES, show_spinner=False)
+def _status_board(
+  _db: Session,
+  statuses: Tuple[str, ...],
+  limit: int,
+  version: int
+) -> Dict[str, job_service.BoardColumn]:
+  return job_service.get_status_board(_db, statuses, limit)
+
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_ENTRIES, show_spinner=False)
+def _daily_activity(_db: Session, since: date, version: int) -> List[Row]:
+  return job_service.get_daily_activity(_db, since)
+
+
+def job_stats(db: Session) -> JobStats:
+  return _job_stats(db, data_version(db))
+
+
+def funnel_metrics(db: Session) -> FunnelMetrics:
+  return _funnel_metrics(db, data_version(db))
+
+
+def daily_activity(db: Session, since: date) -> List[Row]:
+  return _daily_activity(db, since, data_version(db))
+
+
+def distinct_values(db: Session, column_name: str) -> List[str]:
+  return _distinct_values(db, column_name, data_version(db))
+
+
+def job_summaries(db: Session, filters: JobFilters) -> List[Row]:
+  return _job_summaries(db, filters, data_version(db))
+
+
+def job_summary_page(db: Session, filters: JobFilters) -> Tuple[List[Row], Optional[str]]:
+  """
+  Raises:
+    ValueError: if filters.cursor is invalid
+  """
+  return _job_summary_page(db, filters, data_version(db))
+
+
+def status_board(db: Session, statuses: Tuple[str, ...], limit: int) -> Dict[str, job_service.BoardColumn]:
+  return _status_board(db, statuses, limit, data_version(db))
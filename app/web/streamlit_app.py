@@ -1,7 +1,8 @@
 import streamlit as st
 from app.web import config
-from app.web.database import get_db
-from app.services.job_service import get_job_stats
+from app.db.profiling import track_queries
+from app.web.database import get_db, init_database
+from app.web import queries
 from app.web.utils import init_session_state
 from app.web.components import dashboard, jobs, applications, scrape, settings
 
@@ -10,8 +11,8 @@ config.configure_page()
 config.load_custom_css()
 
 # Initialize
+init_database()
 init_session_state()
-db = get_db()
 
 # Sidebar
 st.sidebar.title("💼 JobTrail")
@@ -23,20 +24,22 @@ page = st.sidebar.radio(
   label_visibility="collapsed"
 )
 
-st.sidebar.markdown("---")
-st.sidebar.markdown("### Quick Stats")
-stats = get_job_stats(db)
-st.sidebar.metric("Total Jobs", stats.total)
-st.sidebar.metric("Added This Week", stats.recent_7days)
+# One session per rerun; count its queries (logged when over budget, see app.db.profiling)
+with get_db() as db, track_queries(f"streamlit:{page}"):
+  st.sidebar.markdown("---")
+  st.sidebar.markdown("### Quick Stats")
+  stats = queries.job_stats(db)
+  st.sidebar.metric("Total Jobs", stats.total)
+  st.sidebar.metric("Added This Week", stats.recent_7days)
 
-# Route to pages
-if page == "📊 Dashboard":
-  dashboard.render(db)
-elif page == "💼 Jobs":
-  jobs.render(db)
-elif page == "📝 Applications":
-  applications.render(db)
-elif page == "🔍 Scrape Jobs":
-  scrape.render(db)
-elif page == "⚙️ Settings":
-  settings.render(db)
\ No newline at end of file
+  # Route to pages
+  if page == "📊 Dashboard":
+    dashboard.render(db)
+  elif page == "💼 Jobs":
+    jobs.render(db)
+  elif page == "📝 Applications":
+    applications.render(db)
+  elif page == "🔍 Scrape Jobs":
+    scrape.render(db)
+  elif page == "⚙️ Settings":
+    settings.render(db)
@@ -1,33 +1,51 @@
+import numpy as np
 import pandas as pd
 import streamlit as st
-from app.models.job import Job
 
 
 def status_badge(status: str) -> str:
   """Return HTML for status badge."""
   return f'<span class="status-badge status-{status}">{status.upper()}</span>'
 
+# Display column, summary field and the text shown when the field is empty
+DISPLAY_COLUMNS = [
+  ('ID', 'id', None),
+  ('Title', 'title', None),
+  ('Company', 'company', None),
+  ('Location', 'location', 'Remote'),
+  ('Type', 'job_type', 'N/A'),
+  ('Salary', 'salary', 'Not specified'),
+  ('Status', 'status', None),
+  ('Source', 'source', None),
+  ('Date Added', 'created_at', None),
+  ('URL', 'url', None),
+]
+
+
 def jobs_to_dataframe(jobs: list) -> pd.DataFrame:
-  """Convert list of Job objects to pandas DataFrame."""
+  """
+  Load job summary rows (see job_service.get_job_summaries) into a display
+  DataFrame. Rows go into the frame as plain tuples and defaults and dates
+  are applied per column, not per job.
+
+  Returns:
+    DataFrame with the DISPLAY_COLUMNS headers, empty if there are no jobs
+  """
   if not jobs:
     return pd.DataFrame()
-  
-  data = []
-  for job in jobs:
-    data.append({
-      'ID': job.id,
-      'Title': job.title,
-      'Company': job.company,
-      'Location': job.location or 'Remote',
-      'Type': job.job_type or 'N/A',
-      'Salary': job.salary or 'Not specified',
-      'Status': job.status,
-      'Source': job.source,
-      'Date Added': job.created_at.strftime('%Y-%m-%d'),
-      'URL': job.url
-    })
-  
-  return pd.DataFrame(data)
+
+  raw = pd.DataFrame.from_records(jobs, columns=list(jobs[0]._fields))
+  df = pd.DataFrame(index=raw.index)
+  for header, field, default in DISPLAY_COLUMNS:
+    column = raw[field]
+    if default is not None:
+      column = column.mask(column.isna() | column.eq(''), default)
+    df[header] = column
+
+  # Day precision datetime64 formats as YYYY-MM-DD in C; strftime is per element
+  created = pd.to_datetime(raw['created_at'], utc=True).dt.tz_localize(None)
+  df['Date Added'] = np.datetime_as_string(created.to_numpy().astype('datetime64[D]'))
+  return df
 
 
 def init_session_state():
@@ -0,0 +1,89 @@
+"""
+Requests/sec for large GET /jobs pages: the fast path (row-to-dict
+records encoded directly) against the previous path (ORM objects
+validated through the JobOut response model, then stdlib JSON).
+
+Runs against a throwaway SQLite database:
+
+  python benchmarks/api_serialization.py --jobs 5000 --page-size 500
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+DB_DIR = tempfile.mkdtemp(prefix="jobtrail-bench-")
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_DIR}/bench.db"
+
+from fastapi import Depends  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from app.main import app  # noqa: E402
+from app.db.deps import get_async_db  # noqa: E402
+from app.db.session import SessionLocal  # noqa: E402
+from app.schemas.jobs import JobCreate, JobFilters, JobOut  # noqa: E402
+from app.services import async_job_service, job_service  # noqa: E402
+from app.utils import serialization  # noqa: E402
+
+
+@app.get("/bench/legacy", response_model=list[JobOut])
+async def legacy_list(limit: int, db=Depends(get_async_db)):
+  return await async_job_service.get_jobs(db, JobFilters(limit=limit))
+
+
+def seed(count: int):
+  db = SessionLocal()
+  try:
+    job_service.create_jobs(db, [
+      JobCreate(
+        title=f"Software Engineer {i}",
+        company=f"Company {i % 200}",
+        location="Remote",
+        job_type="remote",
+        salary="$90,000 - $140,000",
+        description=f"We are hiring engineers to build product {i % 50}. " * 20,
+        url=f"https://example.com/jobs/{i}",
+        source="bench",
+      )
+      for i in range(count)
+    ])
+  finally:
+    db.close()
+
+
+def measure(client: TestClient, path: str, params: dict, seconds: float) -> float:
+  client.get(path, params=params).raise_for_status()  # warm the query cache
+  requests = 0
+  started = time.perf_counter()
+  while time.perf_counter() - started < seconds:
+    client.get(path, params=params).raise_for_status()
+    requests += 1
+  return requests / (time.perf_counter() - started)
+
+
+def main():
+  parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+  parser.add_argument("--jobs", type=int, default=5000)
+  parser.add_argument("--page-size", type=int, default=500)
+  parser.add_argument("--seconds", type=float, default=5.0)
+  args = parser.parse_args()
+
+  seed(args.jobs)
+  client = TestClient(app)
+  params = {"limit": args.page_size}
+
+  encoder = "orjson" if serialization.orjson is not None else "json"
+  print(f"{args.jobs} jobs, page size {args.page_size}, encoder {encoder}")
+
+  before = measure(client, "/bench/legacy", params, args.seconds)
+  after = measure(client, "/jobs/", params, args.seconds)
+
+  print(f"  ORM + JobOut validation: {before:8.1f} req/s")
+  print(f"  row records, fast JSON:  {after:8.1f} req/s  ({after / before:.1f}x)")
+
+
+if __name__ == "__main__":
+  main()